@@ -0,0 +1,22 @@
+"""Add upstream_modified watermark to tracked_businesses
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "007"
+down_revision = "006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("tracked_businesses", sa.Column("upstream_modified", sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("tracked_businesses", "upstream_modified")
@@ -0,0 +1,25 @@
+"""Add updated_at to cached_businesses
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "008"
+down_revision = "007"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "cached_businesses",
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.text("NOW()"), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("cached_businesses", "updated_at")
@@ -0,0 +1,31 @@
+"""Add business_schedules cache table
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
+
+revision = "009"
+down_revision = "008"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "business_schedules",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("business_number", sa.String(20), nullable=False),
+        sa.Column("preconsultations", JSONB(), nullable=False, server_default=sa.text("'[]'::jsonb")),
+        sa.Column("sessions", JSONB(), nullable=False, server_default=sa.text("'[]'::jsonb")),
+        sa.Column("fetched_at", sa.DateTime(), nullable=False, server_default=sa.func.now()),
+    )
+    op.create_index("ix_business_schedules_business_number", "business_schedules", ["business_number"], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_table("business_schedules")
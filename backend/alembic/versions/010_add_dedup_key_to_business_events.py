@@ -0,0 +1,36 @@
+"""Add dedup_key to business_events
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "010"
+down_revision = "009"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("business_events", sa.Column("dedup_key", sa.String(32), nullable=True))
+    # Same hash as app.services.scheduler.event_dedup_key
+    op.execute("""
+        UPDATE business_events
+        SET dedup_key = md5(concat_ws('|', business_number, event_type,
+                                      coalesce(committee_name, ''), coalesce(description, '')))
+        WHERE event_type IN ('committee_scheduled', 'debate_scheduled')
+    """)
+    op.execute("""
+        DELETE FROM business_events e
+        USING business_events keep
+        WHERE e.dedup_key = keep.dedup_key AND e.id > keep.id
+    """)
+    op.create_index("ix_business_events_dedup_key", "business_events", ["dedup_key"], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_business_events_dedup_key", table_name="business_events")
+    op.drop_column("business_events", "dedup_key")
@@ -0,0 +1,89 @@
+"""Move upstream business data into a shared businesses table
+
+tracked_businesses keeps only the per-user subscription (user, priority,
+created_at) plus a business_id foreign key.
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "011"
+down_revision = "010"
+branch_labels = None
+depends_on = None
+
+
+def _business_columns() -> list[sa.Column]:
+    return [
+        sa.Column("title", sa.String(500)),
+        sa.Column("description", sa.Text()),
+        sa.Column("status", sa.String(100)),
+        sa.Column("business_type", sa.String(100)),
+        sa.Column("author", sa.String(500)),
+        sa.Column("author_faction", sa.String(255)),
+        sa.Column("submitted_text", sa.Text()),
+        sa.Column("reasoning", sa.Text()),
+        sa.Column("federal_council_response", sa.Text()),
+        sa.Column("federal_council_proposal", sa.String(200)),
+        sa.Column("first_council", sa.String(100)),
+        sa.Column("submission_date", sa.DateTime()),
+        sa.Column("upstream_modified", sa.DateTime()),
+        sa.Column("last_api_sync", sa.DateTime()),
+    ]
+
+
+COLUMN_LIST = ", ".join(c.name for c in _business_columns())
+
+
+def upgrade() -> None:
+    op.create_table(
+        "businesses",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("business_number", sa.String(20), nullable=False),
+        *_business_columns(),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+    )
+    op.create_index("ix_businesses_id", "businesses", ["id"])
+    op.create_index("ix_businesses_business_number", "businesses", ["business_number"], unique=True)
+
+    # Most recently synced copy wins when several users track a number
+    op.execute(f"""
+        INSERT INTO businesses (business_number, {COLUMN_LIST}, created_at)
+        SELECT DISTINCT ON (business_number) business_number, {COLUMN_LIST}, created_at
+        FROM tracked_businesses
+        ORDER BY business_number, last_api_sync DESC NULLS LAST, id
+    """)
+
+    op.add_column("tracked_businesses", sa.Column("business_id", sa.Integer(), nullable=True))
+    op.execute("""
+        UPDATE tracked_businesses t SET business_id = b.id
+        FROM businesses b WHERE b.business_number = t.business_number
+    """)
+    op.alter_column("tracked_businesses", "business_id", nullable=False)
+    op.create_foreign_key(
+        "tracked_businesses_business_id_fkey", "tracked_businesses", "businesses",
+        ["business_id"], ["id"],
+    )
+    op.create_index("ix_tracked_businesses_business_id", "tracked_businesses", ["business_id"])
+
+    for column in _business_columns():
+        op.drop_column("tracked_businesses", column.name)
+
+
+def downgrade() -> None:
+    for column in _business_columns():
+        op.add_column("tracked_businesses", column)
+    op.execute(f"""
+        UPDATE tracked_businesses t
+        SET ({COLUMN_LIST}) = (SELECT {COLUMN_LIST} FROM businesses b WHERE b.id = t.business_id)
+    """)
+    op.drop_index("ix_tracked_businesses_business_id", table_name="tracked_businesses")
+    op.drop_constraint("tracked_businesses_business_id_fkey", "tracked_businesses", type_="foreignkey")
+    op.drop_column("tracked_businesses", "business_id")
+    op.drop_index("ix_businesses_business_number", table_name="businesses")
+    op.drop_index("ix_businesses_id", table_name="businesses")
+    op.drop_table("businesses")
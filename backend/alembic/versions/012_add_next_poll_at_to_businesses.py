@@ -0,0 +1,24 @@
+"""Add next_poll_at to businesses for adaptive polling
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "012"
+down_revision = "011"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("businesses", sa.Column("next_poll_at", sa.DateTime(), nullable=True))
+    op.create_index("ix_businesses_next_poll_at", "businesses", ["next_poll_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_businesses_next_poll_at", table_name="businesses")
+    op.drop_column("businesses", "next_poll_at")
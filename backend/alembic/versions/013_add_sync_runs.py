@@ -0,0 +1,42 @@
+"""Add sync_runs job history table
+
+Revision ID: 013
+Revises: 012
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
+
+revision = "013"
+down_revision = "012"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "sync_runs",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("job", sa.String(100), nullable=False),
+        sa.Column("trigger", sa.String(20), nullable=False),
+        sa.Column("status", sa.String(20), nullable=False),
+        sa.Column("started_at", sa.DateTime(), nullable=False),
+        sa.Column("finished_at", sa.DateTime(), nullable=True),
+        sa.Column("duration_seconds", sa.Float(), nullable=True),
+        sa.Column("rows_fetched", sa.Integer(), nullable=True),
+        sa.Column("rows_inserted", sa.Integer(), nullable=True),
+        sa.Column("rows_updated", sa.Integer(), nullable=True),
+        sa.Column("upstream_calls", sa.Integer(), nullable=True),
+        sa.Column("phases", JSONB(), nullable=False, server_default=sa.text("'{}'::jsonb")),
+        sa.Column("error", sa.Text(), nullable=True),
+    )
+    op.create_index("ix_sync_runs_id", "sync_runs", ["id"])
+    op.create_index("ix_sync_runs_job_started_at", "sync_runs", ["job", "started_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_sync_runs_job_started_at", table_name="sync_runs")
+    op.drop_index("ix_sync_runs_id", table_name="sync_runs")
+    op.drop_table("sync_runs")
@@ -0,0 +1,36 @@
+"""Add watch_rules table and watch_match alert type
+
+Revision ID: 015
+Revises: 014
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "015"
+down_revision = "014"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("ALTER TYPE alert_type_enum ADD VALUE IF NOT EXISTS 'watch_match'")
+    op.create_table(
+        "watch_rules",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("phrase", sa.String(200), nullable=True),
+        sa.Column("business_type", sa.String(100), nullable=True),
+        sa.Column("auto_accept", sa.Boolean(), nullable=False, server_default=sa.false()),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+    )
+    op.create_index("ix_watch_rules_id", "watch_rules", ["id"])
+    op.create_index("ix_watch_rules_user_id", "watch_rules", ["user_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_watch_rules_user_id", table_name="watch_rules")
+    op.drop_index("ix_watch_rules_id", table_name="watch_rules")
+    op.drop_table("watch_rules")
+    # Postgres cannot drop a value from an enum type; watch_match stays
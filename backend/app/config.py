@@ -4,6 +4,16 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
+def _parse_limits(raw: str) -> dict[str, int]:
+    """Parse 'job=n,job2=m' into a dict."""
+    limits = {}
+    for part in raw.split(","):
+        name, _, value = part.partition("=")
+        if name.strip() and value.strip().isdigit():
+            limits[name.strip()] = int(value)
+    return limits
+
+
 class Settings:
     PROJECT_NAME: str = "Parlamentsmonitor"
     DATABASE_URL: str = os.getenv(
@@ -14,8 +24,72 @@ class Settings:
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24  # 24 hours
     PARLIAMENT_API_BASE: str = "https://ws.parlament.ch/odata.svc"
-    SYNC_INTERVAL_HOURS: int = 6
+
+    # Shared HTTP client for ws.parlament.ch (connection pooling / keep-alive)
+    PARLIAMENT_HTTP_TIMEOUT: float = float(os.getenv("PARLIAMENT_HTTP_TIMEOUT", "30"))
+    PARLIAMENT_HTTP_MAX_CONNECTIONS: int = int(os.getenv("PARLIAMENT_HTTP_MAX_CONNECTIONS", "20"))
+    PARLIAMENT_HTTP_MAX_KEEPALIVE: int = int(os.getenv("PARLIAMENT_HTTP_MAX_KEEPALIVE", "10"))
+    PARLIAMENT_HTTP_KEEPALIVE_EXPIRY: float = float(os.getenv("PARLIAMENT_HTTP_KEEPALIVE_EXPIRY", "60"))
+    PARLIAMENT_HTTP2: bool = os.getenv("PARLIAMENT_HTTP2", "false").lower() == "true"
+
+    # Retry policy and circuit breaker for parliament API calls
+    PARLIAMENT_MAX_RETRIES: int = int(os.getenv("PARLIAMENT_MAX_RETRIES", "3"))
+    PARLIAMENT_RETRY_BASE_DELAY: float = float(os.getenv("PARLIAMENT_RETRY_BASE_DELAY", "1"))
+    PARLIAMENT_RETRY_MAX_DELAY: float = float(os.getenv("PARLIAMENT_RETRY_MAX_DELAY", "30"))
+    PARLIAMENT_BREAKER_THRESHOLD: int = int(os.getenv("PARLIAMENT_BREAKER_THRESHOLD", "5"))
+    PARLIAMENT_BREAKER_COOLDOWN_SECONDS: float = float(os.getenv("PARLIAMENT_BREAKER_COOLDOWN_SECONDS", "60"))
+
+    SYNC_INTERVAL_HOURS: int = int(os.getenv("SYNC_INTERVAL_HOURS", "6"))
+    # Delta mode only refetches tracked businesses whose upstream Modified moved
+    SYNC_DELTA_MODE: bool = os.getenv("SYNC_DELTA_MODE", "true").lower() == "true"
+    # Business chunk requests in flight during the tracked-business sync
+    SYNC_CONCURRENCY: int = int(os.getenv("SYNC_CONCURRENCY", "8"))
+
+    # Adaptive polling: per-business poll intervals instead of the fixed
+    # SYNC_INTERVAL_HOURS sweep (see services/poll_scheduler.py)
+    ADAPTIVE_POLLING: bool = os.getenv("ADAPTIVE_POLLING", "true").lower() == "true"
+    POLL_TICK_MINUTES: int = int(os.getenv("POLL_TICK_MINUTES", "5"))
+    # Businesses synced per batch (and commit); a tick drains all due batches
+    POLL_BATCH_SIZE: int = int(os.getenv("POLL_BATCH_SIZE", "50"))
+    POLL_HOT_MINUTES: int = int(os.getenv("POLL_HOT_MINUTES", "15"))
+    POLL_WARM_MINUTES: int = int(os.getenv("POLL_WARM_MINUTES", "120"))
+    POLL_DORMANT_HOURS: int = int(os.getenv("POLL_DORMANT_HOURS", "168"))
+
+    # sync_runs history older than this is deleted daily
+    SYNC_RUN_RETENTION_DAYS: int = int(os.getenv("SYNC_RUN_RETENTION_DAYS", "30"))
+
+    # Nightly business cache sync: OData page size and pages in flight
+    BUSINESS_CACHE_PAGE_SIZE: int = int(os.getenv("BUSINESS_CACHE_PAGE_SIZE", "500"))
+    BUSINESS_CACHE_CONCURRENCY: int = int(os.getenv("BUSINESS_CACHE_CONCURRENCY", "4"))
     MONITORING_CRON_HOUR: int = 7
+    # OData page size when collecting monitoring candidates
+    MONITORING_PAGE_SIZE: int = int(os.getenv("MONITORING_PAGE_SIZE", "500"))
+
+    # How often every worker tries to become (or confirms it still is) the
+    # scheduler leader
+    LEADER_ELECTION_SECONDS: int = int(os.getenv("LEADER_ELECTION_SECONDS", "30"))
+
+    # Dedicated thread pool for blocking swissparlpy calls, with per-job caps
+    UPSTREAM_EXECUTOR_WORKERS: int = int(os.getenv("UPSTREAM_EXECUTOR_WORKERS", "8"))
+    UPSTREAM_JOB_CONCURRENCY: int = int(os.getenv("UPSTREAM_JOB_CONCURRENCY", "4"))
+    UPSTREAM_JOB_LIMITS: dict[str, int] = _parse_limits(os.getenv("UPSTREAM_JOB_LIMITS", "voting=2,schedule=4"))
+
+    # Voting sync pipeline: AIMD limit on concurrent Voting fetches (grows
+    # while fetches finish within the target latency, halves on errors/429),
+    # stage queue size and votes per bulk write
+    VOTING_SYNC_INITIAL_CONCURRENCY: int = int(os.getenv("VOTING_SYNC_INITIAL_CONCURRENCY", "2"))
+    VOTING_SYNC_MIN_CONCURRENCY: int = int(os.getenv("VOTING_SYNC_MIN_CONCURRENCY", "1"))
+    VOTING_SYNC_MAX_CONCURRENCY: int = int(os.getenv("VOTING_SYNC_MAX_CONCURRENCY", "8"))
+    VOTING_SYNC_TARGET_LATENCY: float = float(os.getenv("VOTING_SYNC_TARGET_LATENCY", "2"))
+    VOTING_SYNC_QUEUE_SIZE: int = int(os.getenv("VOTING_SYNC_QUEUE_SIZE", "50"))
+    VOTING_SYNC_WRITE_BATCH: int = int(os.getenv("VOTING_SYNC_WRITE_BATCH", "50"))
+
+    # Persisted business schedules older than this are refreshed in the background
+    SCHEDULE_CACHE_STALE_HOURS: float = float(os.getenv("SCHEDULE_CACHE_STALE_HOURS", "6"))
+
+    # Memo for Subject/Meeting lookups behind session schedules
+    SCHEDULE_MEMO_TTL_SECONDS: float = float(os.getenv("SCHEDULE_MEMO_TTL_SECONDS", str(6 * 3600)))
+    SCHEDULE_MEMO_MAXSIZE: int = int(os.getenv("SCHEDULE_MEMO_MAXSIZE", "5000"))
 
     # SMTP settings for email alerts
     SMTP_HOST: str = os.getenv("SMTP_HOST", "")
@@ -25,6 +99,19 @@ class Settings:
     SMTP_FROM: str = os.getenv("SMTP_FROM", "")
     SMTP_USE_TLS: bool = os.getenv("SMTP_USE_TLS", "true").lower() == "true"
     SMTP_USE_SSL: bool = os.getenv("SMTP_USE_SSL", "false").lower() == "true"
+    # Parallel SMTP sessions per notification batch (each sends many mails)
+    SMTP_CONCURRENCY: int = int(os.getenv("SMTP_CONCURRENCY", "3"))
+    SMTP_TIMEOUT: float = float(os.getenv("SMTP_TIMEOUT", "30"))
+
+    # Email outbox worker: alert emails are queued with the alerts and sent
+    # in the background with exponential backoff between attempts
+    EMAIL_OUTBOX_INTERVAL_SECONDS: int = int(os.getenv("EMAIL_OUTBOX_INTERVAL_SECONDS", "60"))
+    EMAIL_OUTBOX_BATCH_SIZE: int = int(os.getenv("EMAIL_OUTBOX_BATCH_SIZE", "500"))
+    EMAIL_MAX_ATTEMPTS: int = int(os.getenv("EMAIL_MAX_ATTEMPTS", "6"))
+    EMAIL_RETRY_BASE_SECONDS: int = int(os.getenv("EMAIL_RETRY_BASE_SECONDS", "60"))
+    EMAIL_RETRY_MAX_SECONDS: int = int(os.getenv("EMAIL_RETRY_MAX_SECONDS", "3600"))
+    # Hour (UTC) at which daily digests go out
+    EMAIL_DIGEST_HOUR: int = int(os.getenv("EMAIL_DIGEST_HOUR", "6"))
 
 
 settings = Settings()
@@ -7,17 +7,69 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from .config import settings
 from .routers import alerts, auth, businesses, monitoring, parliament, settings_router
-from .routers import parliamentarians, committees_router, votes_router, predictions
+from .routers import parliamentarians, committees_router, votes_router, predictions, sync_runs_router, watch_rules
 from .services.scheduler import fetch_monitoring_candidates, sync_committee_schedules, sync_tracked_businesses
 from .services.parliamentarian_sync import sync_parliamentarians
 from .services.committee_sync import sync_committees
 from .services.voting_sync import sync_voting_data
 from .services.parliament_api import sync_cached_businesses
+from .services.poll_scheduler import poll_due_businesses
+from .services.email_outbox import drain_email_outbox
+from .services.sync_runs import prune_sync_runs
+from .services.http_client import close_http_client, open_http_client
+from .services.job_lock import elect_leader, leader_job, lock_transaction, resign_leader, trigger_job
+from .services.upstream_executor import shutdown_upstream_executor
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-scheduler = AsyncIOScheduler()
+# A slow run never overlaps or queues up behind itself
+scheduler = AsyncIOScheduler(job_defaults={"coalesce": True, "max_instances": 1})
+
+# Keep in sync with scheduler.event_dedup_key and alembic migration 010
+BACKFILL_EVENT_DEDUP_KEYS_SQL = """
+    UPDATE business_events
+    SET dedup_key = md5(concat_ws('|', business_number, event_type,
+                                  coalesce(committee_name, ''), coalesce(description, '')))
+    WHERE event_type IN ('committee_scheduled', 'debate_scheduled')
+"""
+# Keep in sync with alembic migration 011
+_BUSINESS_COLUMNS = (
+    "title, description, status, business_type, author, author_faction, "
+    "submitted_text, reasoning, federal_council_response, "
+    "federal_council_proposal, first_council, submission_date, "
+    "upstream_modified, last_api_sync"
+)
+NORMALIZE_TRACKED_BUSINESSES_SQL = [
+    f"""
+    INSERT INTO businesses (business_number, {_BUSINESS_COLUMNS}, created_at)
+    SELECT DISTINCT ON (business_number) business_number, {_BUSINESS_COLUMNS}, created_at
+    FROM tracked_businesses
+    ORDER BY business_number, last_api_sync DESC NULLS LAST, id
+    ON CONFLICT (business_number) DO NOTHING
+    """,
+    "ALTER TABLE tracked_businesses ADD COLUMN business_id INTEGER REFERENCES businesses(id)",
+    """
+    UPDATE tracked_businesses t SET business_id = b.id
+    FROM businesses b WHERE b.business_number = t.business_number
+    """,
+    "ALTER TABLE tracked_businesses ALTER COLUMN business_id SET NOT NULL",
+    "CREATE INDEX IF NOT EXISTS ix_tracked_businesses_business_id ON tracked_businesses(business_id)",
+    "ALTER TABLE tracked_businesses "
+    + ", ".join(f"DROP COLUMN {c.strip()}" for c in _BUSINESS_COLUMNS.split(",")),
+]
+TRACKED_BUSINESSES_LEGACY_SQL = """
+    SELECT NOT EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_schema = current_schema()
+          AND table_name = 'tracked_businesses' AND column_name = 'business_id'
+    )
+"""
+DELETE_DUPLICATE_EVENTS_SQL = """
+    DELETE FROM business_events e
+    USING business_events keep
+    WHERE e.dedup_key = keep.dedup_key AND e.id > keep.id
+"""
 
 
 def _backfill_session_names(engine):
@@ -71,31 +123,33 @@ async def lifespan(app: FastAPI):
     with engine.connect() as conn:
         inspector = inspect(engine)
         columns = [c["name"] for c in inspector.get_columns("tracked_businesses")]
-        if "author" not in columns:
+        # Column additions below only apply to the pre-normalization layout
+        legacy_tracked = "business_id" not in columns
+        if legacy_tracked and "author" not in columns:
             conn.execute(text("ALTER TABLE tracked_businesses ADD COLUMN author VARCHAR(500)"))
             conn.commit()
             logger.info("Added author column to tracked_businesses")
-        if "submitted_text" not in columns:
+        if legacy_tracked and "submitted_text" not in columns:
             conn.execute(text("ALTER TABLE tracked_businesses ADD COLUMN submitted_text TEXT"))
             conn.commit()
             logger.info("Added submitted_text column to tracked_businesses")
-        if "reasoning" not in columns:
+        if legacy_tracked and "reasoning" not in columns:
             conn.execute(text("ALTER TABLE tracked_businesses ADD COLUMN reasoning TEXT"))
             conn.commit()
             logger.info("Added reasoning column to tracked_businesses")
-        if "federal_council_response" not in columns:
+        if legacy_tracked and "federal_council_response" not in columns:
             conn.execute(text("ALTER TABLE tracked_businesses ADD COLUMN federal_council_response TEXT"))
             conn.commit()
             logger.info("Added federal_council_response column to tracked_businesses")
-        if "federal_council_proposal" not in columns:
+        if legacy_tracked and "federal_council_proposal" not in columns:
             conn.execute(text("ALTER TABLE tracked_businesses ADD COLUMN federal_council_proposal VARCHAR(200)"))
             conn.commit()
             logger.info("Added federal_council_proposal column to tracked_businesses")
-        if "first_council" not in columns:
+        if legacy_tracked and "first_council" not in columns:
             conn.execute(text("ALTER TABLE tracked_businesses ADD COLUMN first_council VARCHAR(100)"))
             conn.commit()
             logger.info("Added first_council column to tracked_businesses")
-        if "author_faction" not in columns:
+        if legacy_tracked and "author_faction" not in columns:
             conn.execute(text("ALTER TABLE tracked_businesses ADD COLUMN author_faction VARCHAR(255)"))
             conn.commit()
             logger.info("Added author_faction column to tracked_businesses")
@@ -103,6 +157,21 @@ async def lifespan(app: FastAPI):
             conn.execute(text("ALTER TABLE tracked_businesses ADD COLUMN priority INTEGER"))
             conn.commit()
             logger.info("Added priority column to tracked_businesses")
+        if legacy_tracked and "upstream_modified" not in columns:
+            conn.execute(text("ALTER TABLE tracked_businesses ADD COLUMN upstream_modified TIMESTAMP"))
+            conn.commit()
+            logger.info("Added upstream_modified column to tracked_businesses")
+        if legacy_tracked:
+            # Move upstream data into the shared businesses table (one row
+            # per number) and keep only the subscription on tracked_businesses.
+            # Workers start together: the first one to get the lock migrates,
+            # the others find business_id present once they get it.
+            lock_transaction(conn, "migrate:normalize_tracked_businesses")
+            if conn.execute(text(TRACKED_BUSINESSES_LEGACY_SQL)).scalar():
+                for statement in NORMALIZE_TRACKED_BUSINESSES_SQL:
+                    conn.execute(text(statement))
+                logger.info("Normalized tracked_businesses into businesses")
+            conn.commit()
 
         # Votes table migrations
         vote_columns = [c["name"] for c in inspector.get_columns("votes")]
@@ -111,6 +180,41 @@ async def lifespan(app: FastAPI):
             conn.commit()
             logger.info("Added session_name column to votes")
 
+        # Business cache: updated_at drives the /recent ETag
+        cache_columns = [c["name"] for c in inspector.get_columns("cached_businesses")]
+        if "updated_at" not in cache_columns:
+            conn.execute(text("ALTER TABLE cached_businesses ADD COLUMN updated_at TIMESTAMP DEFAULT NOW()"))
+            conn.commit()
+            logger.info("Added updated_at column to cached_businesses")
+
+        # Business events: content hash for set-based dedup of schedule events
+        event_columns = [c["name"] for c in inspector.get_columns("business_events")]
+        if "dedup_key" not in event_columns:
+            conn.execute(text("ALTER TABLE business_events ADD COLUMN dedup_key VARCHAR(32)"))
+            conn.execute(text(BACKFILL_EVENT_DEDUP_KEYS_SQL))
+            conn.execute(text(DELETE_DUPLICATE_EVENTS_SQL))
+            conn.execute(text(
+                "CREATE UNIQUE INDEX IF NOT EXISTS ix_business_events_dedup_key "
+                "ON business_events(dedup_key)"
+            ))
+            conn.commit()
+            logger.info("Added dedup_key column to business_events")
+
+        business_columns = [c["name"] for c in inspector.get_columns("businesses")]
+        if "next_poll_at" not in business_columns:
+            conn.execute(text("ALTER TABLE businesses ADD COLUMN next_poll_at TIMESTAMP"))
+            conn.execute(text("CREATE INDEX IF NOT EXISTS ix_businesses_next_poll_at ON businesses(next_poll_at)"))
+            conn.commit()
+            logger.info("Added next_poll_at column to businesses")
+
+        # Alert type for watch rule matches
+        alert_types = next((e["labels"] for e in inspector.get_enums() if e["name"] == "alert_type_enum"), [])
+        if alert_types and "watch_match" not in alert_types:
+            # ADD VALUE cannot run inside a transaction block before Postgres 12
+            with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as autocommit:
+                autocommit.execute(text("ALTER TYPE alert_type_enum ADD VALUE IF NOT EXISTS 'watch_match'"))
+            logger.info("Added watch_match to alert_type_enum")
+
         # Business notes table
         if not inspector.has_table("business_notes"):
             conn.execute(text("""
@@ -136,41 +240,64 @@ async def lifespan(app: FastAPI):
             conn.execute(text("ALTER TABLE users ADD COLUMN email_alert_types VARCHAR(500) DEFAULT 'status_change,committee_scheduled,debate_scheduled'"))
             conn.commit()
             logger.info("Added email_alert_types column to users")
+        if "email_digest" not in user_columns:
+            conn.execute(text("ALTER TABLE users ADD COLUMN email_digest VARCHAR(20) NOT NULL DEFAULT 'immediate'"))
+            conn.commit()
+            logger.info("Added email_digest column to users")
 
     logger.info("Database tables ensured")
 
     # Backfill session names for votes that are missing them
     _backfill_session_names(engine)
 
-    # Start scheduler
+    # Shared HTTP client for parliament API calls (routers + scheduler jobs)
+    await open_http_client()
+
+    # Start scheduler. Every worker runs one, but only the elected leader
+    # executes jobs (see services/job_lock.py)
+    elect_leader()
     scheduler.add_job(
-        sync_tracked_businesses,
+        elect_leader,
         "interval",
-        hours=settings.SYNC_INTERVAL_HOURS,
-        id="sync_businesses",
+        seconds=settings.LEADER_ELECTION_SECONDS,
+        id="leader_election",
     )
+    if settings.ADAPTIVE_POLLING:
+        scheduler.add_job(
+            leader_job("poll_due_businesses", poll_due_businesses),
+            "interval",
+            minutes=settings.POLL_TICK_MINUTES,
+            id="poll_businesses",
+        )
+    else:
+        scheduler.add_job(
+            leader_job("sync_tracked_businesses", sync_tracked_businesses),
+            "interval",
+            hours=settings.SYNC_INTERVAL_HOURS,
+            id="sync_businesses",
+        )
     scheduler.add_job(
-        fetch_monitoring_candidates,
+        leader_job("fetch_monitoring_candidates", fetch_monitoring_candidates),
         "cron",
         hour=settings.MONITORING_CRON_HOUR,
         id="monitoring_candidates",
     )
     scheduler.add_job(
-        sync_committee_schedules,
+        leader_job("sync_committee_schedules", sync_committee_schedules),
         "interval",
         hours=settings.SYNC_INTERVAL_HOURS,
         id="sync_committee_schedules",
     )
     # Monthly sync for parliamentarians and committees (1st of each month at 03:00)
     scheduler.add_job(
-        sync_parliamentarians,
+        leader_job("sync_parliamentarians", sync_parliamentarians),
         "cron",
         day=1,
         hour=3,
         id="sync_parliamentarians",
     )
     scheduler.add_job(
-        sync_committees,
+        leader_job("sync_committees", sync_committees),
         "cron",
         day=1,
         hour=3,
@@ -179,7 +306,7 @@ async def lifespan(app: FastAPI):
     )
     # Weekly voting data sync (Sunday at 04:00)
     scheduler.add_job(
-        sync_voting_data,
+        leader_job("sync_voting_data", sync_voting_data),
         "cron",
         day_of_week="sun",
         hour=4,
@@ -187,16 +314,35 @@ async def lifespan(app: FastAPI):
     )
     # Daily business cache sync (02:00)
     scheduler.add_job(
-        sync_cached_businesses,
+        leader_job("sync_cached_businesses", sync_cached_businesses),
         "cron",
         hour=2,
         id="sync_cached_businesses",
     )
+    # Alert emails queued by the sync jobs
+    scheduler.add_job(
+        leader_job("drain_email_outbox", drain_email_outbox, record=False),
+        "interval",
+        seconds=settings.EMAIL_OUTBOX_INTERVAL_SECONDS,
+        id="drain_email_outbox",
+    )
+    # Daily sync_runs retention (03:45); the 5-minute poll ticks alone add
+    # about 288 rows a day
+    scheduler.add_job(
+        leader_job("prune_sync_runs", prune_sync_runs, record=False),
+        "cron",
+        hour=3,
+        minute=45,
+        id="prune_sync_runs",
+    )
     scheduler.start()
     logger.info("Scheduler started")
     yield
     scheduler.shutdown()
+    resign_leader()
     logger.info("Scheduler stopped")
+    await close_http_client()
+    shutdown_upstream_executor()
 
 
 app = FastAPI(title=settings.PROJECT_NAME, lifespan=lifespan)
@@ -222,6 +368,8 @@ app.include_router(committees_router.parties_router)
 app.include_router(committees_router.parl_groups_router)
 app.include_router(votes_router.router)
 app.include_router(predictions.router)
+app.include_router(sync_runs_router.router)
+app.include_router(watch_rules.router)
 
 
 @app.get("/api/health")
@@ -241,8 +389,8 @@ async def trigger_sync_parliamentarians(
     user: User = Depends(get_current_user),
 ):
     """Manually trigger parliamentarian + party + canton sync."""
-    background_tasks.add_task(sync_parliamentarians)
-    return {"status": "started", "job": "sync_parliamentarians"}
+    status = trigger_job("sync_parliamentarians", sync_parliamentarians, background_tasks)
+    return {"status": status, "job": "sync_parliamentarians"}
 
 
 @app.post("/api/sync/committees")
@@ -251,8 +399,8 @@ async def trigger_sync_committees(
     user: User = Depends(get_current_user),
 ):
     """Manually trigger committee + membership sync."""
-    background_tasks.add_task(sync_committees)
-    return {"status": "started", "job": "sync_committees"}
+    status = trigger_job("sync_committees", sync_committees, background_tasks)
+    return {"status": status, "job": "sync_committees"}
 
 
 @app.post("/api/sync/voting-data")
@@ -261,8 +409,8 @@ async def trigger_sync_voting_data(
     user: User = Depends(get_current_user),
 ):
     """Manually trigger voting data sync (can take several minutes)."""
-    background_tasks.add_task(sync_voting_data)
-    return {"status": "started", "job": "sync_voting_data"}
+    status = trigger_job("sync_voting_data", sync_voting_data, background_tasks)
+    return {"status": status, "job": "sync_voting_data"}
 
 
 @app.post("/api/sync/businesses")
@@ -271,8 +419,8 @@ async def trigger_sync_businesses(
     user: User = Depends(get_current_user),
 ):
     """Manually trigger business cache sync (years 25/26)."""
-    background_tasks.add_task(sync_cached_businesses)
-    return {"status": "started", "job": "sync_cached_businesses"}
+    status = trigger_job("sync_cached_businesses", sync_cached_businesses, background_tasks)
+    return {"status": status, "job": "sync_cached_businesses"}
 
 
 @app.post("/api/sync/all")
@@ -280,9 +428,21 @@ async def trigger_sync_all(
     background_tasks: BackgroundTasks,
     user: User = Depends(get_current_user),
 ):
-    """Trigger all parliament data syncs (parliamentarians, committees, voting data, businesses)."""
-    background_tasks.add_task(sync_parliamentarians)
-    background_tasks.add_task(sync_committees)
-    background_tasks.add_task(sync_voting_data)
-    background_tasks.add_task(sync_cached_businesses)
-    return {"status": "started", "jobs": ["sync_parliamentarians", "sync_committees", "sync_voting_data", "sync_cached_businesses"]}
+    """Trigger all parliament data syncs (parliamentarians, committees, voting data, businesses).
+
+    Jobs that are already running are reported under ``already_running``
+    instead of being started a second time.
+    """
+    jobs = {
+        "sync_parliamentarians": sync_parliamentarians,
+        "sync_committees": sync_committees,
+        "sync_voting_data": sync_voting_data,
+        "sync_cached_businesses": sync_cached_businesses,
+    }
+    started, already_running = [], []
+    for name, job in jobs.items():
+        if trigger_job(name, job, background_tasks) == "started":
+            started.append(name)
+        else:
+            already_running.append(name)
+    return {"status": "started", "jobs": started, "already_running": already_running}
@@ -15,6 +15,7 @@ from sqlalchemy import (
     UniqueConstraint,
 )
 from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.associationproxy import association_proxy
 from sqlalchemy.orm import relationship
 
 from .database import Base
@@ -29,18 +30,22 @@ class User(Base):
     password_hash = Column(String(255), nullable=False)
     email_alerts_enabled = Column(Boolean, default=False)
     email_alert_types = Column(String(500), default="status_change,committee_scheduled,debate_scheduled")
+    # "immediate", "hourly" or "daily" (see services/email_outbox.py)
+    email_digest = Column(String(20), default="immediate", server_default="immediate", nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow)
 
     tracked_businesses = relationship("TrackedBusiness", back_populates="user")
     alerts = relationship("Alert", back_populates="user")
 
 
-class TrackedBusiness(Base):
-    __tablename__ = "tracked_businesses"
+class Business(Base):
+    """Upstream data of a parliamentary business, stored once per number and
+    shared by every user tracking it."""
+
+    __tablename__ = "businesses"
 
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    business_number = Column(String(20), nullable=False, index=True)
+    business_number = Column(String(20), unique=True, nullable=False, index=True)
     title = Column(String(500))
     description = Column(Text)
     status = Column(String(100))
@@ -53,13 +58,48 @@ class TrackedBusiness(Base):
     federal_council_proposal = Column(String(200))
     first_council = Column(String(100))
     submission_date = Column(DateTime)
-    priority = Column(Integer, nullable=True)
+    upstream_modified = Column(DateTime)
     last_api_sync = Column(DateTime)
+    # Set by the adaptive poll scheduler; NULL means due now
+    next_poll_at = Column(DateTime, index=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    trackers = relationship("TrackedBusiness", back_populates="business")
+
+
+class TrackedBusiness(Base):
+    """A user's subscription to a business (user-specific fields only)."""
+
+    __tablename__ = "tracked_businesses"
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    business_id = Column(Integer, ForeignKey("businesses.id"), nullable=False, index=True)
+    # Denormalized key: events, alerts and schedules are keyed by number
+    business_number = Column(String(20), nullable=False, index=True)
+    priority = Column(Integer, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
 
     user = relationship("User", back_populates="tracked_businesses")
+    business = relationship("Business", back_populates="trackers", lazy="joined")
     notes = relationship("BusinessNote", back_populates="business", cascade="all, delete-orphan")
 
+    # Upstream fields, read through to the shared Business row
+    title = association_proxy("business", "title")
+    description = association_proxy("business", "description")
+    status = association_proxy("business", "status")
+    business_type = association_proxy("business", "business_type")
+    author = association_proxy("business", "author")
+    author_faction = association_proxy("business", "author_faction")
+    submitted_text = association_proxy("business", "submitted_text")
+    reasoning = association_proxy("business", "reasoning")
+    federal_council_response = association_proxy("business", "federal_council_response")
+    federal_council_proposal = association_proxy("business", "federal_council_proposal")
+    first_council = association_proxy("business", "first_council")
+    submission_date = association_proxy("business", "submission_date")
+    upstream_modified = association_proxy("business", "upstream_modified")
+    last_api_sync = association_proxy("business", "last_api_sync")
+
 
 class BusinessNote(Base):
     __tablename__ = "business_notes"
@@ -84,6 +124,9 @@ class BusinessEvent(Base):
     description = Column(Text)
     committee_name = Column(String(255))
     raw_data = Column(Text)
+    # md5 of (business_number, event_type, committee_name, description) for
+    # schedule events; NULL for events that may legitimately repeat
+    dedup_key = Column(String(32), unique=True, index=True)
     created_at = Column(DateTime, default=datetime.utcnow)
 
 
@@ -100,6 +143,7 @@ class Alert(Base):
             "debate_scheduled",
             "new_document",
             "vote_result",
+            "watch_match",
             name="alert_type_enum",
         ),
         nullable=False,
@@ -112,6 +156,26 @@ class Alert(Base):
     user = relationship("User", back_populates="alerts")
 
 
+class EmailOutbox(Base):
+    """A pending or sent alert email for one user (one row per alert)."""
+
+    __tablename__ = "email_outbox"
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    alert_id = Column(Integer, ForeignKey("alerts.id", ondelete="CASCADE"), nullable=False)
+    status = Column(String(20), nullable=False, default="pending")  # "pending", "sent", "failed"
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    last_error = Column(Text)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    sent_at = Column(DateTime)
+
+    __table_args__ = (
+        Index("ix_email_outbox_status_next_attempt_at", "status", "next_attempt_at"),
+    )
+
+
 class MonitoringCandidate(Base):
     __tablename__ = "monitoring_candidates"
 
@@ -130,6 +194,21 @@ class MonitoringCandidate(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
 
 
+class WatchRule(Base):
+    """A user's keyword/phrase and/or business-type rule, matched against new
+    businesses (see services/watch_rules.py)."""
+
+    __tablename__ = "watch_rules"
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    phrase = Column(String(200), nullable=True)
+    business_type = Column(String(100), nullable=True)
+    # Also accept matching monitoring candidates on the user's behalf
+    auto_accept = Column(Boolean, nullable=False, default=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+
 # --- Parlamentarier-Profile & Abstimmungsprognose ---
 
 
@@ -280,6 +359,30 @@ class CachedBusiness(Base):
     business_number = Column(String(20), unique=True, nullable=False, index=True)
     title = Column(String(500))
     created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+class CacheVersion(Base):
+    """Version of a locally cached data set, bumped by the job that refreshes
+    it, so every worker can derive ETags without scanning the data."""
+
+    __tablename__ = "cache_versions"
+
+    name = Column(String(50), primary_key=True)
+    version = Column(String(64), nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow)
+
+
+class BusinessSchedule(Base):
+    """Cached committee pre-consultations and plenary sessions per business."""
+
+    __tablename__ = "business_schedules"
+
+    id = Column(Integer, primary_key=True, index=True)
+    business_number = Column(String(20), unique=True, nullable=False, index=True)
+    preconsultations = Column(JSONB, nullable=False, default=list)
+    sessions = Column(JSONB, nullable=False, default=list)
+    fetched_at = Column(DateTime, nullable=False, default=datetime.utcnow)
 
 
 class VotePrediction(Base):
@@ -298,3 +401,28 @@ class VotePrediction(Base):
     __table_args__ = (
         UniqueConstraint("business_number", "person_number", "model_version", name="uq_vote_prediction"),
     )
+
+
+class SyncRun(Base):
+    """One run of a scheduled or manually triggered sync job."""
+
+    __tablename__ = "sync_runs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    job = Column(String(100), nullable=False)
+    trigger = Column(String(20), nullable=False)  # "scheduled" or "manual"
+    status = Column(String(20), nullable=False)  # "running", "success", "failed"
+    started_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    finished_at = Column(DateTime)
+    duration_seconds = Column(Float)
+    rows_fetched = Column(Integer, default=0)
+    rows_inserted = Column(Integer, default=0)
+    rows_updated = Column(Integer, default=0)
+    upstream_calls = Column(Integer, default=0)
+    # phase name -> seconds
+    phases = Column(JSONB, nullable=False, default=dict)
+    error = Column(Text)
+
+    __table_args__ = (
+        Index("ix_sync_runs_job_started_at", "job", "started_at"),
+    )
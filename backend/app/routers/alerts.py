@@ -6,7 +6,7 @@ from sqlalchemy.orm import Session
 
 from ..auth import get_current_user
 from ..database import get_db
-from ..models import Alert, TrackedBusiness, User
+from ..models import Alert, Business, TrackedBusiness, User
 from ..schemas import AlertOut
 
 router = APIRouter(prefix="/api/alerts", tags=["alerts"])
@@ -22,7 +22,8 @@ def _attach_business_titles(alerts: list[Alert], user_id: int, db: Session) -> l
     id_map: dict[str, int] = {}
     if biz_numbers:
         rows = (
-            db.query(TrackedBusiness.business_number, TrackedBusiness.title, TrackedBusiness.id)
+            db.query(TrackedBusiness.business_number, Business.title, TrackedBusiness.id)
+            .join(Business, TrackedBusiness.business_id == Business.id)
             .filter(
                 TrackedBusiness.user_id == user_id,
                 TrackedBusiness.business_number.in_(biz_numbers),
@@ -4,13 +4,16 @@ from datetime import datetime
 
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
 from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
 from ..auth import get_current_user
 from ..database import SessionLocal, get_db
-from ..models import BusinessEvent, BusinessNote, CachedBusiness, TrackedBusiness, User
+from ..models import Business, BusinessEvent, BusinessNote, CachedBusiness, TrackedBusiness, User
 from ..schemas import BusinessAdd, BusinessDetailOut, BusinessEventOut, BusinessNoteCreate, BusinessNoteOut, BusinessPriorityUpdate, BusinessScheduleOut, TrackedBusinessOut
-from ..services.parliament_api import fetch_business, fetch_business_schedule, fetch_business_status
+from ..services import cache_versions
+from ..services.parliament_api import fetch_business, fetch_business_status
+from ..services.schedule_cache import get_business_schedule as get_cached_schedule, refresh_business_schedule
 
 logger = logging.getLogger(__name__)
 
@@ -92,21 +95,41 @@ async def add_business(
         .first()
     )
 
+    shared = _get_or_create_business(
+        db, data.business_number, cached.title if cached else data.business_number
+    )
     business = TrackedBusiness(
         user_id=user.id,
+        business=shared,
         business_number=data.business_number,
-        title=cached.title if cached else data.business_number,
     )
     db.add(business)
+    # Due now: the scheduler leader picks it up on its next poll tick
+    shared.next_poll_at = datetime.utcnow()
     db.commit()
     db.refresh(business)
 
-    # Fetch full details and events from API in background
+    # Fetch full details, events and schedule from API in background
     background_tasks.add_task(_backfill_business, business.id, data.business_number)
+    background_tasks.add_task(refresh_business_schedule, data.business_number)
 
     return business
 
 
+def _get_or_create_business(db: Session, business_number: str, title: str) -> Business:
+    """Return the shared Business row for a number, creating it if needed.
+
+    ON CONFLICT DO NOTHING makes this safe when two users add the same
+    business at the same time.
+    """
+    db.execute(
+        pg_insert(Business)
+        .values(business_number=business_number, title=title, created_at=datetime.utcnow())
+        .on_conflict_do_nothing(index_elements=[Business.business_number])
+    )
+    return db.query(Business).filter(Business.business_number == business_number).one()
+
+
 async def _backfill_business(business_id: int, business_number: str) -> None:
     """Background task: fetch missing data from parliament API and store in DB."""
     db: Session = SessionLocal()
@@ -130,9 +153,10 @@ async def _backfill_business(business_id: int, business_number: str) -> None:
                 db.commit()
 
         # Backfill business detail fields if any are missing
-        business = db.query(TrackedBusiness).filter(TrackedBusiness.id == business_id).first()
-        if not business:
+        tracked = db.query(TrackedBusiness).filter(TrackedBusiness.id == business_id).first()
+        if not tracked:
             return
+        business = tracked.business
 
         info = await fetch_business(business.business_number)
         if info:
@@ -144,6 +168,7 @@ async def _backfill_business(business_id: int, business_number: str) -> None:
                 if val and not getattr(business, field, None):
                     setattr(business, field, val)
             business.last_api_sync = datetime.utcnow()
+            cache_versions.bump_version(db, cache_versions.BUSINESSES)
             db.commit()
     except Exception:
         db.rollback()
@@ -189,6 +214,7 @@ def get_business(
 @router.get("/{business_id}/schedule", response_model=BusinessScheduleOut)
 async def get_business_schedule(
     business_id: int,
+    background_tasks: BackgroundTasks,
     user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
@@ -200,8 +226,7 @@ async def get_business_schedule(
     if not business:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Nicht gefunden")
 
-    schedule = await fetch_business_schedule(business.business_number)
-    return schedule
+    return await get_cached_schedule(db, business.business_number, background_tasks)
 
 
 @router.delete("/{business_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -1,19 +1,73 @@
-from fastapi import APIRouter, Depends, Query
+import asyncio
+import hashlib
+
+from fastapi import APIRouter, Depends, Query, Request, Response
+from sqlalchemy.orm import Session
 
 from ..auth import get_current_user
-from ..models import User
-from ..schemas import BusinessCacheItem, ParliamentPreview
-from ..services.parliament_api import fetch_business, fetch_recent_businesses_cached, search_businesses
+from ..database import get_db
+from ..models import CachedBusiness, User
+from ..schemas import BusinessCacheItem, ParliamentPreview, UpstreamStatusOut
+from ..services.http_client import breaker
+from ..services.parliament_api import (
+    fetch_business,
+    fetch_recent_businesses_cached,
+    query_recent_businesses,
+    recent_businesses_version,
+    search_businesses,
+    upstream_available,
+)
+from ..services.search_index import search_local
+from ..services.upstream_executor import executor_stats
 
 router = APIRouter(prefix="/api/parliament", tags=["parliament"])
 
 
+@router.get("/status", response_model=UpstreamStatusOut)
+def upstream_status(
+    user: User = Depends(get_current_user),
+):
+    """Return the circuit breaker state for ws.parlament.ch."""
+    return breaker.snapshot()
+
+
+@router.get("/executor")
+def upstream_executor_stats(
+    user: User = Depends(get_current_user),
+):
+    """Queue depth, running calls and timings of the upstream thread pool."""
+    return executor_stats()
+
+
 @router.get("/recent", response_model=list[BusinessCacheItem])
 async def recent_businesses(
+    request: Request,
+    response: Response,
+    q: str | None = Query(None, description="Prefix of business number or title word"),
+    limit: int | None = Query(None, ge=1, le=1000),
+    offset: int = Query(0, ge=0),
+    after: str | None = Query(None, description="Keyset cursor: last business_number of the previous page"),
     user: User = Depends(get_current_user),
 ):
-    """Return cached business_number + title for the last 12 months."""
-    return await fetch_recent_businesses_cached()
+    """Return cached business_number + title for the last 12 months.
+
+    Supports prefix autocomplete, limit/offset or keyset paging and
+    conditional GET (ETag derived from the last cache sync).
+    """
+    version = recent_businesses_version()
+    if version is None:
+        return await fetch_recent_businesses_cached()
+
+    key = f"{version}|{q or ''}|{limit or ''}|{offset}|{after or ''}"
+    etag = f'W/"{hashlib.sha1(key.encode()).hexdigest()[:20]}"'
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+
+    rows, total = query_recent_businesses(version, q=q, limit=limit, offset=offset, after=after)
+    response.headers.update(headers)
+    response.headers["X-Total-Count"] = str(total)
+    return rows
 
 
 @router.get("/search", response_model=list[ParliamentPreview])
@@ -21,6 +75,13 @@ async def search(
     q: str = Query(..., min_length=2),
     user: User = Depends(get_current_user),
 ):
+    """Search locally indexed businesses; ask ws.parlament.ch only on no hits."""
+    results = await asyncio.to_thread(search_local, q)
+    if results:
+        return results
+    # Degrade instantly instead of waiting on retries while upstream is down
+    if not upstream_available():
+        return []
     return await search_businesses(q)
 
 
@@ -28,10 +89,20 @@ async def search(
 async def preview(
     business_number: str,
     user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
 ):
-    info = await fetch_business(business_number)
+    info = await fetch_business(business_number) if upstream_available() else None
     if not info:
-        return ParliamentPreview(business_number=business_number)
+        # Fall back to the local business cache (title only)
+        cached = (
+            db.query(CachedBusiness)
+            .filter(CachedBusiness.business_number == business_number)
+            .first()
+        )
+        return ParliamentPreview(
+            business_number=business_number,
+            title=cached.title if cached else None,
+        )
     return ParliamentPreview(
         business_number=business_number,
         title=info.get("title"),
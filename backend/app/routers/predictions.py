@@ -3,7 +3,7 @@
 import asyncio
 import logging
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
 from ..auth import get_current_user
@@ -20,7 +20,7 @@ from ..schemas import (
     TreatingBodyOut,
     VotePredictionOut,
 )
-from ..services.parliament_api import fetch_preconsultations
+from ..services.schedule_cache import get_business_schedule
 from ..services.prediction_service import predict_for_business
 
 logger = logging.getLogger(__name__)
@@ -31,6 +31,7 @@ router = APIRouter(prefix="/api/businesses", tags=["predictions"])
 @router.get("/{business_id}/treating-body", response_model=TreatingBodyOut)
 async def get_treating_body(
     business_id: int,
+    background_tasks: BackgroundTasks,
     user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
@@ -46,8 +47,9 @@ async def get_treating_body(
             detail="Geschäft nicht gefunden",
         )
 
-    # Fetch preconsultations from parliament API
-    preconsultations = await fetch_preconsultations(business.business_number)
+    # Preconsultations from the persisted schedule cache
+    schedule = await get_business_schedule(db, business.business_number, background_tasks)
+    preconsultations = schedule["preconsultations"]
 
     # Find the next treating body
     next_body_name = None
@@ -126,6 +128,7 @@ async def get_treating_body(
 @router.get("/{business_id}/vote-prediction", response_model=VotePredictionOut)
 async def get_vote_prediction(
     business_id: int,
+    background_tasks: BackgroundTasks,
     user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
@@ -142,7 +145,8 @@ async def get_vote_prediction(
         )
 
     # First determine the treating body
-    preconsultations = await fetch_preconsultations(business.business_number)
+    schedule = await get_business_schedule(db, business.business_number, background_tasks)
+    preconsultations = schedule["preconsultations"]
 
     committee_name = None
     committee_abbr = None
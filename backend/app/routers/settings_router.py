@@ -1,10 +1,11 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
 from ..auth import get_current_user
 from ..database import get_db
 from ..models import User
 from ..schemas import EmailSettingsOut, EmailSettingsUpdate
+from ..services.email_outbox import DIGEST_MODES
 
 router = APIRouter(prefix="/api/settings", tags=["settings"])
 
@@ -14,6 +15,7 @@ VALID_ALERT_TYPES = {
     "debate_scheduled",
     "new_document",
     "vote_result",
+    "watch_match",
 }
 
 
@@ -26,6 +28,7 @@ def get_email_settings(
     return EmailSettingsOut(
         email_alerts_enabled=user.email_alerts_enabled or False,
         email_alert_types=types_list,
+        email_digest=user.email_digest or "immediate",
     )
 
 
@@ -35,13 +38,18 @@ def update_email_settings(
     user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
+    if data.email_digest is not None and data.email_digest not in DIGEST_MODES:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Ungültiger Zustellmodus")
     user.email_alerts_enabled = data.email_alerts_enabled
     # Only keep valid alert types
     valid = [t for t in data.email_alert_types if t in VALID_ALERT_TYPES]
     user.email_alert_types = ",".join(valid) if valid else ""
+    if data.email_digest is not None:
+        user.email_digest = data.email_digest
     db.commit()
     db.refresh(user)
     return EmailSettingsOut(
         email_alerts_enabled=user.email_alerts_enabled,
         email_alert_types=valid,
+        email_digest=user.email_digest,
     )
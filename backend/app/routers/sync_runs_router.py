@@ -0,0 +1,28 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from ..auth import get_current_user
+from ..database import get_db
+from ..models import SyncRun, User
+from ..schemas import SyncRunOut
+
+router = APIRouter(prefix="/api/sync/runs", tags=["sync"])
+
+
+@router.get("", response_model=list[SyncRunOut])
+def list_sync_runs(
+    job: Optional[str] = None,
+    status: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=500),
+    user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Most recent sync job runs, newest first."""
+    q = db.query(SyncRun)
+    if job:
+        q = q.filter(SyncRun.job == job)
+    if status:
+        q = q.filter(SyncRun.status == status)
+    return q.order_by(SyncRun.started_at.desc()).limit(limit).all()
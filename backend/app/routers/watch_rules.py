@@ -0,0 +1,77 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.orm import Session
+
+from ..auth import get_current_user
+from ..database import get_db
+from ..models import User, WatchRule
+from ..schemas import WatchRuleCreate, WatchRuleOut
+
+router = APIRouter(prefix="/api/watch-rules", tags=["watch-rules"])
+
+MAX_RULES_PER_USER = 100
+
+
+@router.get("", response_model=list[WatchRuleOut])
+def list_watch_rules(
+    user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    return (
+        db.query(WatchRule)
+        .filter(WatchRule.user_id == user.id)
+        .order_by(WatchRule.created_at)
+        .all()
+    )
+
+
+@router.post("", response_model=WatchRuleOut, status_code=status.HTTP_201_CREATED)
+def add_watch_rule(
+    data: WatchRuleCreate,
+    user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    phrase = " ".join((data.phrase or "").split()) or None
+    business_type = (data.business_type or "").strip() or None
+    if not phrase and not business_type:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Stichwort oder Geschäftstyp erforderlich",
+        )
+    if phrase and len(phrase) < 2:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Stichwort muss mindestens 2 Zeichen lang sein",
+        )
+    if db.query(WatchRule).filter(WatchRule.user_id == user.id).count() >= MAX_RULES_PER_USER:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Maximal {MAX_RULES_PER_USER} Regeln pro Benutzer",
+        )
+
+    rule = WatchRule(
+        user_id=user.id,
+        phrase=phrase[:200] if phrase else None,
+        business_type=business_type[:100] if business_type else None,
+        auto_accept=data.auto_accept,
+    )
+    db.add(rule)
+    db.commit()
+    db.refresh(rule)
+    return rule
+
+
+@router.delete("/{rule_id}", status_code=status.HTTP_204_NO_CONTENT)
+def delete_watch_rule(
+    rule_id: int,
+    user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    rule = (
+        db.query(WatchRule)
+        .filter(WatchRule.id == rule_id, WatchRule.user_id == user.id)
+        .first()
+    )
+    if not rule:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Nicht gefunden")
+    db.delete(rule)
+    db.commit()
@@ -127,6 +127,22 @@ class MonitoringDecision(BaseModel):
     decision: str  # "accepted" or "rejected"
 
 
+class WatchRuleCreate(BaseModel):
+    phrase: Optional[str] = None
+    business_type: Optional[str] = None
+    auto_accept: bool = False
+
+
+class WatchRuleOut(BaseModel):
+    id: int
+    phrase: Optional[str] = None
+    business_type: Optional[str] = None
+    auto_accept: bool = False
+    created_at: datetime
+
+    model_config = {"from_attributes": True}
+
+
 # --- Business Cache ---
 class BusinessCacheItem(BaseModel):
     business_number: str
@@ -143,6 +159,13 @@ class ParliamentPreview(BaseModel):
     submission_date: Optional[str] = None
 
 
+class UpstreamStatusOut(BaseModel):
+    state: str  # "closed", "open" or "half_open"
+    consecutive_failures: int = 0
+    retry_in_seconds: float = 0.0
+    last_failure: Optional[str] = None
+
+
 # --- Schedule ---
 class PreconsultationOut(BaseModel):
     committee_name: str
@@ -172,6 +195,7 @@ class BusinessScheduleOut(BaseModel):
 class EmailSettingsOut(BaseModel):
     email_alerts_enabled: bool = False
     email_alert_types: list[str] = []
+    email_digest: str = "immediate"
 
     model_config = {"from_attributes": True}
 
@@ -179,6 +203,8 @@ class EmailSettingsOut(BaseModel):
 class EmailSettingsUpdate(BaseModel):
     email_alerts_enabled: bool
     email_alert_types: list[str]
+    # "immediate", "hourly" or "daily"; unchanged if omitted
+    email_digest: Optional[str] = None
 
 
 # --- Parliamentarians ---
@@ -349,3 +375,22 @@ class TreatingBodyOut(BaseModel):
     next_body_type: Optional[str] = None  # "committee" or "council"
     next_date: Optional[str] = None
     members: list[CommitteeMemberOut] = []
+
+
+# --- Sync runs ---
+class SyncRunOut(BaseModel):
+    id: int
+    job: str
+    trigger: str
+    status: str
+    started_at: datetime
+    finished_at: Optional[datetime] = None
+    duration_seconds: Optional[float] = None
+    rows_fetched: int = 0
+    rows_inserted: int = 0
+    rows_updated: int = 0
+    upstream_calls: int = 0
+    phases: dict[str, float] = {}
+    error: Optional[str] = None
+
+    model_config = {"from_attributes": True}
@@ -0,0 +1,70 @@
+"""AIMD concurrency limit for upstream calls.
+
+Additive increase / multiplicative decrease, as in TCP congestion control:
+every call that completes successfully within the target latency raises the
+limit by ``1 / limit`` (about +1 per round of calls); a failure or a
+throttling response (HTTP 429) halves it. Slow but successful calls leave
+the limit unchanged. Only calls started after the last decrease can trigger
+another one, so a burst of failures from one round cuts the limit once.
+"""
+
+import asyncio
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class AIMDLimiter:
+    """Adaptive limit on the number of calls in flight."""
+
+    def __init__(
+        self,
+        name: str,
+        initial: int,
+        minimum: int,
+        maximum: int,
+        target_latency: float,
+        decrease_factor: float = 0.5,
+    ):
+        self.name = name
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.limit = float(min(max(initial, self.minimum), self.maximum))
+        self.target_latency = target_latency
+        self.decrease_factor = decrease_factor
+        self.peak = self.limit
+        self.decreases = 0
+        self._in_flight = 0
+        self._last_decrease = time.monotonic()
+        self._cond = asyncio.Condition()
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    async def acquire(self) -> float:
+        """Wait for a free slot; returns the start time to pass to release()."""
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._in_flight < int(self.limit))
+            self._in_flight += 1
+        return time.monotonic()
+
+    async def release(self, started: float, ok: bool, throttled: bool = False) -> None:
+        """Free the slot of a call and adapt the limit to its outcome."""
+        latency = time.monotonic() - started
+        async with self._cond:
+            self._in_flight -= 1
+            if not ok or throttled:
+                if started >= self._last_decrease:
+                    self.limit = max(self.minimum, self.limit * self.decrease_factor)
+                    self._last_decrease = time.monotonic()
+                    self.decreases += 1
+                    logger.info(
+                        "%s: %s, concurrency limit lowered to %d",
+                        self.name, "throttled" if throttled else "call failed", int(self.limit),
+                    )
+            elif latency <= self.target_latency:
+                self.limit = min(self.maximum, self.limit + 1 / self.limit)
+                self.peak = max(self.peak, self.limit)
+            self._cond.notify_all()
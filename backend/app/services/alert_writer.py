@@ -0,0 +1,85 @@
+"""Bulk alert fan-out.
+
+One alert per user tracking the business is generated in the database with
+``INSERT INTO alerts ... SELECT FROM tracked_businesses JOIN (VALUES ...)``,
+so a change to a business tracked by many users costs one statement instead
+of one INSERT per tracker. Emails for the inserted alerts are queued in the
+email outbox within the same transaction.
+"""
+
+import logging
+from datetime import datetime
+
+from sqlalchemy import DateTime, Text, cast, column, false, insert, literal, select, values
+from sqlalchemy.orm import Session
+
+from ..models import Alert, TrackedBusiness
+from .email_outbox import enqueue_alert_emails
+
+logger = logging.getLogger(__name__)
+
+# Events per INSERT ... SELECT statement
+FAN_OUT_BATCH = 500
+
+
+def fan_out_alerts(db: Session, events: list[dict]) -> list:
+    """Create an alert for every tracker of each event's business.
+
+    ``events`` are dicts with ``business_number``, ``alert_type``,
+    ``message`` and optionally ``event_date``. Returns the inserted alert rows
+    (id, user_id, business_number, alert_type, message, event_date). Does not
+    commit.
+    """
+    tracked = TrackedBusiness.__table__
+    alerts = Alert.__table__
+    now = datetime.utcnow()
+    inserted = []
+
+    for start in range(0, len(events), FAN_OUT_BATCH):
+        batch = events[start:start + FAN_OUT_BATCH]
+        v = values(
+            column("business_number", tracked.c.business_number.type),
+            column("alert_type", Text),
+            column("message", Text),
+            column("event_date", DateTime),
+            name="events",
+        ).data([
+            (e["business_number"], e["alert_type"], e["message"], e.get("event_date"))
+            for e in batch
+        ])
+
+        # DISTINCT: one alert per user and event, even for duplicate tracking rows
+        source = (
+            select(
+                tracked.c.user_id,
+                v.c.business_number,
+                # VALUES columns are untyped text/NULL; cast to the target types
+                cast(v.c.alert_type, alerts.c.alert_type.type),
+                v.c.message,
+                cast(v.c.event_date, DateTime),
+                false(),
+                literal(now, DateTime),
+            )
+            .select_from(tracked.join(v, tracked.c.business_number == v.c.business_number))
+            .distinct()
+        )
+        stmt = (
+            insert(alerts)
+            .from_select(
+                ["user_id", "business_number", "alert_type", "message", "event_date", "is_read", "created_at"],
+                source,
+            )
+            .returning(
+                alerts.c.id, alerts.c.user_id, alerts.c.business_number,
+                alerts.c.alert_type, alerts.c.message, alerts.c.event_date,
+            )
+        )
+        inserted.extend(db.execute(stmt).all())
+
+    if inserted:
+        queued = enqueue_alert_emails(db, inserted)
+        logger.info(
+            "Fanned out %d alerts for %d events, %d emails queued",
+            len(inserted), len(events), queued,
+        )
+    return inserted
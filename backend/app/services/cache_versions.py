@@ -0,0 +1,66 @@
+"""Versions of locally cached data sets, shared by all workers.
+
+A job that changes a data set bumps its ``cache_versions`` row; in-memory
+copies (the /recent index, the search index) remember the version they were
+built from and are rebuilt when it changes. Versions are re-read from the
+database at most every VERSION_TTL_SECONDS, so every worker sees a change
+made by the scheduler leader within that time.
+"""
+
+import threading
+import time
+from datetime import datetime
+from typing import Callable
+
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from ..database import SessionLocal
+from ..models import CacheVersion
+
+CACHED_BUSINESSES = "cached_businesses"  # sync_cached_businesses
+BUSINESSES = "businesses"  # texts of tracked businesses
+PARLIAMENTARIANS = "parliamentarians"  # sync_parliamentarians
+
+VERSION_TTL_SECONDS = 30
+
+# name -> (monotonic read time, version)
+_versions: dict[str, tuple[float, str | None]] = {}
+_lock = threading.Lock()
+
+
+def read_version(name: str, fallback: Callable[[Session], str | None] | None = None) -> str | None:
+    """Current version of a data set (None if never recorded).
+
+    ``fallback`` derives a version when no row exists yet; its result is
+    cached like a stored one.
+    """
+    now = time.monotonic()
+    with _lock:
+        cached = _versions.get(name)
+    if cached is not None and now - cached[0] < VERSION_TTL_SECONDS:
+        return cached[1]
+
+    db = SessionLocal()
+    try:
+        row = db.get(CacheVersion, name)
+        version = row.version if row is not None else (fallback(db) if fallback else None)
+    finally:
+        db.close()
+    with _lock:
+        _versions[name] = (now, version)
+    return version
+
+
+def bump_version(db: Session, name: str) -> str:
+    """Record a new version of a data set (no commit)."""
+    now = datetime.utcnow()
+    version = now.strftime("%Y%m%d%H%M%S%f")
+    stmt = insert(CacheVersion).values(name=name, version=version, updated_at=now)
+    db.execute(stmt.on_conflict_do_update(
+        index_elements=[CacheVersion.name],
+        set_={"version": stmt.excluded.version, "updated_at": stmt.excluded.updated_at},
+    ))
+    with _lock:
+        _versions[name] = (time.monotonic(), version)
+    return version
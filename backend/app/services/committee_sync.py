@@ -1,18 +1,20 @@
 """Sync service for committees and committee memberships.
 
-Fetches data from ws.parlament.ch via swissparlpy and stores locally.
+Fetches committees via swissparlpy and streams memberships through the
+async OData client, storing both locally.
 Runs monthly via scheduler (together with parliamentarian sync).
 """
 
-import asyncio
 import logging
 from datetime import datetime
 
-import swissparlpy as spp
 from sqlalchemy.orm import Session
 
 from ..database import SessionLocal
 from ..models import Committee, CommitteeMembership
+from . import sync_runs
+from .odata_client import iter_pages
+from .upstream_executor import get_data, run_upstream
 
 logger = logging.getLogger(__name__)
 
@@ -20,23 +22,13 @@ logger = logging.getLogger(__name__)
 def _fetch_committees_sync() -> list[dict]:
     """Fetch all committees."""
     try:
-        data = spp.get_data("Committee", Language="DE")
+        data = get_data("Committee", Language="DE")
         return [dict(row) for row in data]
     except Exception as exc:
         logger.error("Failed to fetch Committee: %s", exc)
         return []
 
 
-def _fetch_member_committee_sync() -> list[dict]:
-    """Fetch all active committee memberships."""
-    try:
-        data = spp.get_data("MemberCommittee", Language="DE")
-        return [dict(row) for row in data]
-    except Exception as exc:
-        logger.error("Failed to fetch MemberCommittee: %s", exc)
-        return []
-
-
 def _sync_committees(db: Session, committees_data: list[dict]) -> int:
     """Sync committee master data."""
     now = datetime.utcnow()
@@ -154,15 +146,23 @@ async def sync_committees():
     try:
         logger.info("Starting committee sync...")
 
-        committees_data, memberships_data = await asyncio.gather(
-            asyncio.to_thread(_fetch_committees_sync),
-            asyncio.to_thread(_fetch_member_committee_sync),
-        )
-
-        committees_added = _sync_committees(db, committees_data)
+        with sync_runs.phase("committees"):
+            committees_data = await run_upstream("committees", _fetch_committees_sync)
+            committees_added = _sync_committees(db, committees_data)
+            db.commit()
+        sync_runs.count(fetched=len(committees_data), inserted=committees_added)
         logger.info("Committees sync: %d added", committees_added)
 
-        membership_stats = _sync_committee_memberships(db, memberships_data)
+        # Stream memberships page by page instead of loading them all
+        membership_stats = {"added": 0, "updated": 0}
+        with sync_runs.phase("memberships"):
+            async for page in iter_pages("MemberCommittee"):
+                page_stats = _sync_committee_memberships(db, page)
+                membership_stats["added"] += page_stats["added"]
+                membership_stats["updated"] += page_stats["updated"]
+                sync_runs.count(fetched=len(page), inserted=page_stats["added"], updated=page_stats["updated"])
+                db.commit()
+                db.expunge_all()
         logger.info(
             "Committee memberships sync: %d added, %d updated",
             membership_stats["added"], membership_stats["updated"],
@@ -172,6 +172,7 @@ async def sync_committees():
         logger.info("Committee sync complete")
     except Exception:
         db.rollback()
+        sync_runs.mark_failed()
         logger.exception("Committee sync failed")
     finally:
         db.close()
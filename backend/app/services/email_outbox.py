@@ -0,0 +1,166 @@
+"""Durable email outbox for alert notifications.
+
+Alert creation enqueues one ``email_outbox`` row per alert and recipient in
+the same transaction as the alert, so sync jobs never wait on SMTP and no
+notification is lost when sending fails. ``drain_email_outbox`` runs in the
+background: it claims due rows (``FOR UPDATE SKIP LOCKED``), merges them into
+one email per user and retries failures with exponential backoff.
+
+Users choose between immediate emails and hourly/daily digests
+(``users.email_digest``); digest rows are simply not due before the next
+digest boundary, so all alerts up to then end up in a single email.
+"""
+
+import logging
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from ..config import settings
+from ..database import SessionLocal
+from ..models import Alert, Business, EmailOutbox, User
+from .email_service import build_alert_message, send_messages
+
+logger = logging.getLogger(__name__)
+
+DIGEST_MODES = ("immediate", "hourly", "daily")
+
+
+def next_send_time(mode: str | None, now: datetime) -> datetime:
+    """When an alert enqueued at ``now`` becomes due for a digest ``mode``."""
+    if mode == "hourly":
+        return now.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
+    if mode == "daily":
+        send_at = now.replace(hour=settings.EMAIL_DIGEST_HOUR, minute=0, second=0, microsecond=0)
+        return send_at if send_at > now else send_at + timedelta(days=1)
+    return now
+
+
+def enqueue_alert_emails(db: Session, new_alerts: list) -> int:
+    """Queue emails for alerts (rows returned by fan_out_alerts) of users who
+    enabled email alerts for that alert type. Does not commit."""
+    if not new_alerts or not settings.SMTP_HOST:
+        return 0
+
+    user_ids = {a.user_id for a in new_alerts}
+    users = {
+        user.id: user
+        for user in db.query(User).filter(User.id.in_(user_ids), User.email_alerts_enabled == True)
+    }
+
+    now = datetime.utcnow()
+    rows = []
+    for alert in new_alerts:
+        user = users.get(alert.user_id)
+        if user is None:
+            continue
+        enabled_types = {t.strip() for t in (user.email_alert_types or "").split(",") if t.strip()}
+        if alert.alert_type not in enabled_types:
+            continue
+        rows.append({
+            "user_id": user.id,
+            "alert_id": alert.id,
+            "status": "pending",
+            "attempts": 0,
+            "next_attempt_at": next_send_time(user.email_digest, now),
+            "created_at": now,
+        })
+
+    for start in range(0, len(rows), settings.EMAIL_OUTBOX_BATCH_SIZE):
+        db.execute(pg_insert(EmailOutbox).values(rows[start:start + settings.EMAIL_OUTBOX_BATCH_SIZE]))
+    return len(rows)
+
+
+def _retry_delay(attempts: int) -> timedelta:
+    seconds = settings.EMAIL_RETRY_BASE_SECONDS * (2 ** (attempts - 1))
+    return timedelta(seconds=min(seconds, settings.EMAIL_RETRY_MAX_SECONDS))
+
+
+async def drain_email_outbox():
+    """Send due outbox entries, one email per user (runs every
+    EMAIL_OUTBOX_INTERVAL_SECONDS)."""
+    if not settings.SMTP_HOST:
+        return
+    db: Session = SessionLocal()
+    try:
+        now = datetime.utcnow()
+        # Rows stay locked until commit, so concurrent drains skip them
+        entries = db.execute(
+            select(EmailOutbox)
+            .where(EmailOutbox.status == "pending", EmailOutbox.next_attempt_at <= now)
+            .order_by(EmailOutbox.next_attempt_at)
+            .limit(settings.EMAIL_OUTBOX_BATCH_SIZE)
+            .with_for_update(skip_locked=True)
+        ).scalars().all()
+        if not entries:
+            db.rollback()
+            return
+
+        alerts = {a.id: a for a in db.query(Alert).filter(Alert.id.in_({e.alert_id for e in entries}))}
+        users = {u.id: u for u in db.query(User).filter(User.id.in_({e.user_id for e in entries}))}
+        titles = dict(
+            db.query(Business.business_number, Business.title)
+            .filter(Business.business_number.in_({a.business_number for a in alerts.values()}))
+            .all()
+        )
+
+        by_user: dict[int, list[EmailOutbox]] = defaultdict(list)
+        for entry in entries:
+            if entry.alert_id in alerts and entry.user_id in users:
+                by_user[entry.user_id].append(entry)
+            else:
+                # Alert or user deleted meanwhile
+                entry.status = "failed"
+                entry.last_error = "Alert oder Benutzer nicht mehr vorhanden"
+
+        batches = []
+        messages = []
+        for user_id, user_entries in by_user.items():
+            user_entries.sort(key=lambda e: e.created_at)
+            alert_dicts = []
+            for entry in user_entries:
+                a = alerts[entry.alert_id]
+                alert_dicts.append({
+                    "business_number": a.business_number,
+                    "business_title": titles.get(a.business_number) or "",
+                    "alert_type": a.alert_type,
+                    "message": a.message,
+                    "event_date": a.event_date,
+                })
+            batches.append(user_entries)
+            messages.append(build_alert_message(users[user_id].email, alert_dicts))
+
+        results = await send_messages(messages)
+
+        sent = failed = 0
+        now = datetime.utcnow()
+        for user_entries, ok in zip(batches, results):
+            for entry in user_entries:
+                entry.attempts += 1
+                if ok:
+                    entry.status = "sent"
+                    entry.sent_at = now
+                    entry.last_error = None
+                elif entry.attempts >= settings.EMAIL_MAX_ATTEMPTS:
+                    entry.status = "failed"
+                    entry.last_error = "Zustellung fehlgeschlagen"
+                else:
+                    entry.next_attempt_at = now + _retry_delay(entry.attempts)
+                    entry.last_error = "Zustellung fehlgeschlagen"
+            if ok:
+                sent += 1
+            else:
+                failed += 1
+        db.commit()
+        logger.info(
+            "Email outbox: %d alerts in %d email(s) sent, %d email(s) failed",
+            sum(len(b) for b, ok in zip(batches, results) if ok), sent, failed,
+        )
+    except Exception:
+        db.rollback()
+        logger.exception("Email outbox drain failed")
+    finally:
+        db.close()
@@ -1,8 +1,11 @@
+import asyncio
 import logging
-import smtplib
+from collections import deque
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 
+import aiosmtplib
+
 from ..config import settings
 
 logger = logging.getLogger(__name__)
@@ -18,6 +21,7 @@ def _build_alert_summary_html(alerts: list[dict]) -> str:
             "debate_scheduled": "Debatte",
             "new_document": "Dokument",
             "vote_result": "Abstimmung",
+            "watch_match": "Stichwort",
         }
         type_label = alert_type_labels.get(a["alert_type"], a["alert_type"])
         event_date = ""
@@ -69,18 +73,8 @@ def _build_alert_summary_html(alerts: list[dict]) -> str:
     """
 
 
-def send_alert_email(to_email: str, to_name: str, alerts: list[dict]) -> bool:
-    """Send an alert summary email to a user.
-
-    Returns True on success, False on failure.
-    """
-    if not settings.SMTP_HOST:
-        logger.warning("SMTP not configured – skipping email to %s", to_email)
-        return False
-
-    if not alerts:
-        return False
-
+def build_alert_message(to_email: str, alerts: list[dict]) -> MIMEMultipart:
+    """Build the alert summary email (plain text + HTML) for one user."""
     msg = MIMEMultipart("alternative")
     msg["Subject"] = f"Parlamentsmonitor: {len(alerts)} neue Alert(s)"
     msg["From"] = settings.SMTP_FROM or f"noreply@{settings.SMTP_HOST}"
@@ -96,23 +90,73 @@ def send_alert_email(to_email: str, to_name: str, alerts: list[dict]) -> bool:
     # HTML version
     html_body = _build_alert_summary_html(alerts)
     msg.attach(MIMEText(html_body, "html", "utf-8"))
-
+    return msg
+
+
+async def _open_smtp() -> aiosmtplib.SMTP:
+    """Connect (STARTTLS takes precedence over SSL, as before) and log in once."""
+    smtp = aiosmtplib.SMTP(
+        hostname=settings.SMTP_HOST,
+        port=settings.SMTP_PORT,
+        use_tls=settings.SMTP_USE_SSL and not settings.SMTP_USE_TLS,
+        start_tls=settings.SMTP_USE_TLS,
+        timeout=settings.SMTP_TIMEOUT,
+    )
+    await smtp.connect()
     try:
-        if settings.SMTP_USE_TLS:
-            server = smtplib.SMTP(settings.SMTP_HOST, settings.SMTP_PORT)
-            server.starttls()
-        elif settings.SMTP_USE_SSL:
-            server = smtplib.SMTP_SSL(settings.SMTP_HOST, settings.SMTP_PORT)
-        else:
-            server = smtplib.SMTP(settings.SMTP_HOST, settings.SMTP_PORT)
-
         if settings.SMTP_USER and settings.SMTP_PASSWORD:
-            server.login(settings.SMTP_USER, settings.SMTP_PASSWORD)
-
-        server.sendmail(msg["From"], [to_email], msg.as_string())
-        server.quit()
-        logger.info("Alert email sent to %s (%d alerts)", to_email, len(alerts))
-        return True
-    except Exception:
-        logger.exception("Failed to send alert email to %s", to_email)
-        return False
+            await smtp.login(settings.SMTP_USER, settings.SMTP_PASSWORD)
+    except BaseException:
+        smtp.close()
+        raise
+    return smtp
+
+
+async def send_messages(messages: list[MIMEMultipart]) -> list[bool]:
+    """Send messages over at most SMTP_CONCURRENCY reused SMTP sessions.
+
+    Each worker opens one authenticated session and sends message after
+    message over it, reconnecting once if the server drops the connection.
+    Returns a success flag per message, in order.
+    """
+    results = [False] * len(messages)
+    if not messages:
+        return results
+    if not settings.SMTP_HOST:
+        logger.warning("SMTP not configured – skipping %d email(s)", len(messages))
+        return results
+
+    pending = deque(enumerate(messages))
+
+    async def worker():
+        smtp: aiosmtplib.SMTP | None = None
+        try:
+            while pending:
+                i, msg = pending.popleft()
+                for attempt in range(2):
+                    try:
+                        if smtp is None or not smtp.is_connected:
+                            smtp = await _open_smtp()
+                        await smtp.send_message(msg)
+                        results[i] = True
+                        break
+                    except (aiosmtplib.SMTPServerDisconnected, aiosmtplib.SMTPConnectError,
+                            aiosmtplib.SMTPTimeoutError) as exc:
+                        smtp = None
+                        if attempt:
+                            logger.error("Failed to send alert email to %s: %s", msg["To"], exc)
+                    except (aiosmtplib.SMTPException, OSError):
+                        logger.exception("Failed to send alert email to %s", msg["To"])
+                        break
+        finally:
+            if smtp is not None and smtp.is_connected:
+                try:
+                    await smtp.quit()
+                except aiosmtplib.SMTPException:
+                    smtp.close()
+
+    workers = min(max(1, settings.SMTP_CONCURRENCY), len(messages))
+    await asyncio.gather(*(worker() for _ in range(workers)))
+    logger.info("Alert emails: %d/%d sent over %d connection(s)", sum(results), len(results), workers)
+    return results
+
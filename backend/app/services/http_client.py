@@ -0,0 +1,254 @@
+"""Shared, long-lived HTTP client for outbound calls to ws.parlament.ch.
+
+The client is opened once in ``main.lifespan`` and reused by routers and
+scheduler jobs so that requests share pooled keep-alive connections instead
+of paying a fresh TCP+TLS handshake each time.
+"""
+
+import asyncio
+import logging
+import random
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+import httpx
+
+from ..config import settings
+from .sync_runs import count_upstream_call
+
+logger = logging.getLogger(__name__)
+
+_client: httpx.AsyncClient | None = None
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def _build_client() -> httpx.AsyncClient:
+    http2 = settings.PARLIAMENT_HTTP2
+    if http2 and not _http2_available():
+        logger.warning("PARLIAMENT_HTTP2 enabled but 'h2' is not installed – falling back to HTTP/1.1")
+        http2 = False
+
+    limits = httpx.Limits(
+        max_connections=settings.PARLIAMENT_HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.PARLIAMENT_HTTP_MAX_KEEPALIVE,
+        keepalive_expiry=settings.PARLIAMENT_HTTP_KEEPALIVE_EXPIRY,
+    )
+    logger.info(
+        "Parliament HTTP client opened (max_connections=%d, keepalive=%d, http2=%s)",
+        settings.PARLIAMENT_HTTP_MAX_CONNECTIONS,
+        settings.PARLIAMENT_HTTP_MAX_KEEPALIVE,
+        http2,
+    )
+    return httpx.AsyncClient(
+        timeout=settings.PARLIAMENT_HTTP_TIMEOUT,
+        limits=limits,
+        http2=http2,
+    )
+
+
+async def open_http_client() -> httpx.AsyncClient:
+    """Create the shared client (called from the app lifespan)."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = _build_client()
+    return _client
+
+
+async def close_http_client() -> None:
+    """Close the shared client and release pooled connections."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+        logger.info("Parliament HTTP client closed")
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared client, creating it lazily outside the app lifespan
+    (e.g. when a sync function is run from a script)."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = _build_client()
+    return _client
+
+
+# ---------------------------------------------------------------------------
+# Retry policy + circuit breaker
+# ---------------------------------------------------------------------------
+
+RETRYABLE_STATUS_CODES = {408, 425, 429, 500, 502, 503, 504}
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker.
+
+    closed    -> requests pass; failures are counted.
+    open      -> requests fail fast until the cooldown has elapsed.
+    half_open -> a single probe request is let through; success closes the
+                 breaker, failure re-opens it for another cooldown window.
+    """
+
+    def __init__(self, threshold: int, cooldown_seconds: float):
+        self.threshold = threshold
+        self.cooldown_seconds = cooldown_seconds
+        self.failures = 0
+        self.opened_at: float | None = None
+        self.last_failure: str | None = None
+        self._probe_in_flight = False
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.cooldown_seconds:
+            return "half_open"
+        return "open"
+
+    @property
+    def is_open(self) -> bool:
+        """True while calls would be rejected without touching the network."""
+        state = self.state
+        return state == "open" or (state == "half_open" and self._probe_in_flight)
+
+    def allow(self) -> bool:
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "half_open" and not self._probe_in_flight:
+            self._probe_in_flight = True
+            return True
+        return False
+
+    def release_probe(self) -> None:
+        """Give up a half-open probe without an outcome (e.g. cancelled), so
+        the next call can probe again."""
+        self._probe_in_flight = False
+
+    def record_success(self) -> None:
+        if self.opened_at is not None:
+            logger.info("Parliament API circuit breaker closed")
+        self.failures = 0
+        self.opened_at = None
+        self._probe_in_flight = False
+
+    def record_failure(self, reason: str) -> None:
+        self.failures += 1
+        self.last_failure = reason
+        if self._probe_in_flight or (self.opened_at is None and self.failures >= self.threshold):
+            logger.warning(
+                "Parliament API circuit breaker opened after %d failures (%s); cooling down %.0fs",
+                self.failures, reason, self.cooldown_seconds,
+            )
+            self.opened_at = time.monotonic()
+        self._probe_in_flight = False
+
+    def retry_in(self) -> float:
+        if self.opened_at is None:
+            return 0.0
+        return max(0.0, self.cooldown_seconds - (time.monotonic() - self.opened_at))
+
+    def snapshot(self) -> dict:
+        return {
+            "state": self.state,
+            "consecutive_failures": self.failures,
+            "retry_in_seconds": round(self.retry_in(), 1),
+            "last_failure": self.last_failure,
+        }
+
+
+breaker = CircuitBreaker(
+    threshold=settings.PARLIAMENT_BREAKER_THRESHOLD,
+    cooldown_seconds=settings.PARLIAMENT_BREAKER_COOLDOWN_SECONDS,
+)
+
+
+def _retry_after_seconds(resp: httpx.Response) -> float | None:
+    """Parse a Retry-After header (delta-seconds or HTTP date)."""
+    raw = resp.headers.get("Retry-After")
+    if not raw:
+        return None
+    try:
+        return max(0.0, float(raw))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(raw)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Exponential backoff with full jitter."""
+    cap = min(settings.PARLIAMENT_RETRY_MAX_DELAY, settings.PARLIAMENT_RETRY_BASE_DELAY * (2 ** attempt))
+    return random.uniform(0, cap)
+
+
+async def get_json(url: str, params: dict | None = None) -> dict | None:
+    """GET a JSON document with async retry/backoff behind the circuit breaker.
+
+    Returns None when the upstream is unavailable, the breaker is open, or
+    the request failed with a non-retryable status.
+    """
+    data, _ = await get_json_throttled(url, params)
+    return data
+
+
+async def get_json_throttled(url: str, params: dict | None = None) -> tuple[dict | None, bool]:
+    """Like get_json, but also reports whether this request failed because
+    the upstream kept throttling it (last attempt answered HTTP 429)."""
+    throttled = False
+    max_retries = max(1, settings.PARLIAMENT_MAX_RETRIES)
+    for attempt in range(max_retries):
+        if not breaker.allow():
+            logger.info("Parliament API circuit open – skipping %s", url)
+            return None, False
+
+        delay: float | None = None
+        throttled = False
+        count_upstream_call()
+        try:
+            resp = await get_http_client().get(url, params=params)
+        except httpx.HTTPError as exc:
+            breaker.record_failure(type(exc).__name__)
+            logger.warning("Parliament API attempt %d failed: %s", attempt + 1, exc)
+        except asyncio.CancelledError:
+            # Not an upstream failure, but a pending probe must not stay taken
+            breaker.release_probe()
+            raise
+        except BaseException as exc:
+            breaker.record_failure(type(exc).__name__)
+            raise
+        else:
+            if resp.status_code < 400:
+                breaker.record_success()
+                try:
+                    return resp.json(), False
+                except ValueError:
+                    logger.warning("Parliament API returned invalid JSON for %s", url)
+                    return None, False
+            if resp.status_code not in RETRYABLE_STATUS_CODES:
+                # Client errors mean the upstream is healthy; don't trip the breaker
+                breaker.record_success()
+                logger.warning("Parliament API returned %d for %s", resp.status_code, url)
+                return None, False
+            throttled = resp.status_code == 429
+            breaker.record_failure(f"HTTP {resp.status_code}")
+            logger.warning("Parliament API attempt %d failed: HTTP %d", attempt + 1, resp.status_code)
+            delay = _retry_after_seconds(resp)
+
+        if attempt < max_retries - 1:
+            if delay is None:
+                delay = _backoff_delay(attempt)
+            await asyncio.sleep(min(delay, settings.PARLIAMENT_RETRY_MAX_DELAY))
+    return None, throttled
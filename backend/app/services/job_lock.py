@@ -0,0 +1,182 @@
+"""Cluster-wide coordination of sync jobs via Postgres advisory locks.
+
+Every uvicorn worker runs the lifespan and therefore its own APScheduler, so
+jobs are guarded twice:
+
+- Leader election: one process holds the ``scheduler-leader`` lock on a
+  dedicated connection; only that process runs scheduled jobs. When it dies,
+  Postgres drops the lock and another worker takes over on its next
+  election round.
+- Per-job lock: every run (scheduled or manual ``/api/sync/*``) holds
+  ``job:<name>`` while it runs, so a job never overlaps itself across
+  workers. Manual triggers for a job that is already running are coalesced
+  into that run instead of starting a second one.
+
+Session-level locks on AUTOCOMMIT connections are used so no transaction is
+left open while a long job runs.
+"""
+
+import hashlib
+import logging
+
+from fastapi import BackgroundTasks
+from sqlalchemy import text
+
+from ..database import engine
+from .sync_runs import record_run
+
+logger = logging.getLogger(__name__)
+
+LEADER_LOCK = "scheduler-leader"
+
+# Jobs running in this process (cheap check before asking Postgres)
+_running: set[str] = set()
+
+
+def _lock_key(name: str) -> int:
+    """Stable signed 64-bit key for pg_advisory_lock."""
+    digest = hashlib.sha1(f"politradar:{name}".encode()).digest()
+    return int.from_bytes(digest[:8], "big", signed=True)
+
+
+def lock_transaction(conn, name: str) -> None:
+    """Block until ``name`` is locked for the rest of ``conn``'s current
+    transaction (released on commit/rollback). For one-off startup
+    migrations that every worker would otherwise run at the same time."""
+    conn.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": _lock_key(name)})
+
+
+class AdvisoryLock:
+    """A session-level advisory lock held on its own connection."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.key = _lock_key(name)
+        self._conn = None
+
+    @property
+    def held(self) -> bool:
+        return self._conn is not None
+
+    def try_acquire(self) -> bool:
+        if self._conn is not None:
+            return True
+        conn = engine.connect().execution_options(isolation_level="AUTOCOMMIT")
+        try:
+            acquired = conn.execute(text("SELECT pg_try_advisory_lock(:key)"), {"key": self.key}).scalar()
+        except Exception:
+            conn.close()
+            raise
+        if not acquired:
+            conn.close()
+            return False
+        self._conn = conn
+        return True
+
+    def is_alive(self) -> bool:
+        """Check that the connection holding the lock is still usable."""
+        if self._conn is None:
+            return False
+        try:
+            self._conn.execute(text("SELECT 1"))
+            return True
+        except Exception:
+            self._conn.invalidate()
+            self._conn = None
+            return False
+
+    def release(self) -> None:
+        if self._conn is None:
+            return
+        try:
+            self._conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": self.key})
+        except Exception:
+            logger.warning("Could not release advisory lock %s; closing its connection", self.name)
+        finally:
+            self._conn.close()
+            self._conn = None
+
+
+_leader = AdvisoryLock(LEADER_LOCK)
+
+
+def is_leader() -> bool:
+    return _leader.held
+
+
+def elect_leader() -> bool:
+    """Try to become (or verify that we still are) the scheduler leader.
+
+    Runs at startup and periodically in every worker.
+    """
+    was_leader = _leader.held
+    try:
+        leader = _leader.is_alive() or _leader.try_acquire()
+    except Exception:
+        logger.exception("Leader election failed")
+        leader = False
+    if leader != was_leader:
+        logger.info("Scheduler leadership %s", "acquired" if leader else "lost")
+    return leader
+
+
+def resign_leader() -> None:
+    _leader.release()
+
+
+def job_running(name: str) -> bool:
+    """True if ``name`` is running in this or any other worker."""
+    if name in _running:
+        return True
+    probe = AdvisoryLock(f"job:{name}")
+    if not probe.try_acquire():
+        return True
+    probe.release()
+    return False
+
+
+async def run_exclusive(name: str, job, trigger: str = "manual", record: bool = True) -> bool:
+    """Run ``job()`` unless it is already running anywhere, recording the
+    run in sync_runs unless ``record`` is false. Returns whether it ran."""
+    if name in _running:
+        logger.info("Job %s already running in this worker; skipped", name)
+        return False
+    lock = AdvisoryLock(f"job:{name}")
+    if not lock.try_acquire():
+        logger.info("Job %s already running in another worker; skipped", name)
+        return False
+    _running.add(name)
+    try:
+        if record:
+            await record_run(name, trigger, job)
+        else:
+            await job()
+    finally:
+        _running.discard(name)
+        lock.release()
+    return True
+
+
+def leader_job(name: str, job, record: bool = True):
+    """Wrap ``job`` for APScheduler: only the leader runs it, exclusively.
+
+    High-frequency housekeeping jobs pass ``record=False`` to stay out of
+    the sync_runs history.
+    """
+    async def run():
+        if not is_leader():
+            return
+        await run_exclusive(name, job, "scheduled", record)
+
+    run.__name__ = name
+    return run
+
+
+def trigger_job(name: str, job, background_tasks: BackgroundTasks) -> str:
+    """Start ``job`` in the background for a manual trigger, or coalesce into
+    the run already in progress. Returns ``"started"`` or
+    ``"already_running"``."""
+    if job_running(name):
+        return "already_running"
+    background_tasks.add_task(run_exclusive, name, job)
+    return "started"
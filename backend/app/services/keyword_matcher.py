@@ -0,0 +1,86 @@
+"""Multi-phrase matching with an Aho-Corasick automaton.
+
+All phrases are compiled into one automaton, so scanning a text costs
+O(len(text) + matches) no matter how many phrases are registered.
+Matching is case-insensitive and anchored at word starts: "AHV" matches
+"AHV-Reform" and "Klima" matches "Klimaschutz", but "Bahn" does not match
+"Autobahn".
+"""
+
+from collections import deque
+
+
+def _normalize(text: str) -> str:
+    return " ".join(text.casefold().split())
+
+
+class KeywordMatcher:
+    """Aho-Corasick automaton mapping phrases to arbitrary values."""
+
+    def __init__(self):
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        # (phrase length, value) for phrases ending in this state
+        self._out: list[list[tuple[int, object]]] = [[]]
+        # Nearest state on the failure chain that has outputs
+        self._out_link: list[int] = [0]
+        self._built = False
+
+    def __len__(self) -> int:
+        return sum(len(out) for out in self._out)
+
+    def add(self, phrase: str, value) -> None:
+        phrase = _normalize(phrase)
+        if not phrase:
+            return
+        node = 0
+        for ch in phrase:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+                self._out_link.append(0)
+            node = nxt
+        self._out[node].append((len(phrase), value))
+        self._built = False
+
+    def build(self) -> None:
+        """Compute failure and output links (breadth-first)."""
+        queue = deque(self._goto[0].values())
+        for child in queue:
+            self._fail[child] = 0
+            self._out_link[child] = 0
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                fail = self._goto[fail].get(ch, 0)
+                self._fail[child] = fail
+                self._out_link[child] = fail if self._out[fail] else self._out_link[fail]
+                queue.append(child)
+        self._built = True
+
+    def find(self, text: str) -> set:
+        """Return the values of all phrases occurring in ``text``."""
+        if not self._built:
+            self.build()
+        text = _normalize(text)
+        found = set()
+        node = 0
+        for i, ch in enumerate(text):
+            while node and ch not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(ch, 0)
+            match = node if self._out[node] else self._out_link[node]
+            while match:
+                for length, value in self._out[match]:
+                    start = i - length + 1
+                    if start == 0 or not text[start - 1].isalnum():
+                        found.add(value)
+                match = self._out_link[match]
+        return found
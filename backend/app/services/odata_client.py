@@ -0,0 +1,130 @@
+"""Async OData v2 client for ws.parlament.ch with streaming pagination.
+
+Built on the shared httpx client (and its retry policy / circuit breaker).
+Rows are yielded page by page as plain dicts with ``/Date(...)/`` values
+decoded to datetimes, so sync services can write large entity sets such as
+``Voting`` or ``MemberCommittee`` in bounded memory instead of copying whole
+swissparlpy result sets.
+"""
+
+import logging
+import re
+from datetime import datetime, timedelta
+
+from ..config import settings
+from .http_client import get_json_throttled
+
+logger = logging.getLogger(__name__)
+
+BASE = settings.PARLIAMENT_API_BASE
+DEFAULT_PAGE_SIZE = 1000
+
+_DATE_RE = re.compile(r"^/Date\((-?\d+)([+-]\d{4})?\)/$")
+_EPOCH = datetime(1970, 1, 1)
+
+
+class ODataError(Exception):
+    """Raised when a page cannot be fetched, so callers never mistake a
+    truncated stream for a complete result set."""
+
+
+class ODataThrottled(ODataError):
+    """A page request failed because the upstream kept answering HTTP 429."""
+
+
+def decode_value(value):
+    """Decode an OData ``/Date(ms[+hhmm])/`` string to a naive UTC datetime."""
+    if isinstance(value, str) and value.startswith("/Date("):
+        match = _DATE_RE.match(value)
+        if match:
+            return _EPOCH + timedelta(milliseconds=int(match.group(1)))
+    return value
+
+
+def decode_row(row: dict) -> dict:
+    """Drop OData metadata and decode date values (recursing into $expand)."""
+    out = {}
+    for key, value in row.items():
+        if key == "__metadata" or (isinstance(value, dict) and "__deferred" in value):
+            continue
+        if isinstance(value, dict) and "results" in value:
+            out[key] = [decode_row(r) for r in value["results"]]
+        elif isinstance(value, dict):
+            out[key] = decode_row(value)
+        else:
+            out[key] = decode_value(value)
+    return out
+
+
+def _build_params(
+    filter: str | None,
+    select: list[str] | None,
+    expand: list[str] | None,
+    orderby: str | None,
+    page_size: int,
+    language: str | None,
+) -> dict:
+    filters = [f for f in (filter, f"Language eq '{language}'" if language else None) if f]
+    params = {"$format": "json", "$top": str(page_size)}
+    if filters:
+        params["$filter"] = " and ".join(f"({f})" for f in filters) if len(filters) > 1 else filters[0]
+    if select:
+        params["$select"] = ",".join(select)
+    if expand:
+        params["$expand"] = ",".join(expand)
+    if orderby:
+        params["$orderby"] = orderby
+    return params
+
+
+async def iter_pages(
+    entity: str,
+    *,
+    filter: str | None = None,
+    select: list[str] | None = None,
+    expand: list[str] | None = None,
+    orderby: str | None = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    language: str | None = "DE",
+):
+    """Yield decoded pages of ``entity`` rows.
+
+    Follows the server's ``__next`` links; if the server does not provide
+    one but returned a full page, continues with ``$skip``.
+    """
+    url = f"{BASE}/{entity}"
+    params = _build_params(filter, select, expand, orderby, page_size, language)
+    fetched = 0
+    pages = 0
+
+    while True:
+        data, throttled = await get_json_throttled(url, params)
+        if data is None:
+            error = ODataThrottled if throttled else ODataError
+            raise error(f"Failed to fetch {entity} page {pages + 1}")
+
+        d = data.get("d")
+        results = d.get("results", []) if isinstance(d, dict) else (d or [])
+        pages += 1
+        fetched += len(results)
+        if results:
+            yield [decode_row(r) for r in results]
+
+        next_url = d.get("__next") if isinstance(d, dict) else None
+        if next_url:
+            # __next carries the complete query (including skiptoken)
+            url, params = next_url, None
+        elif len(results) >= page_size:
+            url = f"{BASE}/{entity}"
+            params = {**_build_params(filter, select, expand, orderby, page_size, language), "$skip": str(fetched)}
+        else:
+            break
+
+    logger.debug("OData %s: %d rows in %d page(s) streamed", entity, fetched, pages)
+
+
+async def iter_entities(entity: str, **kwargs):
+    """Yield decoded ``entity`` rows one at a time (see iter_pages)."""
+    async for page in iter_pages(entity, **kwargs):
+        for row in page:
+            yield row
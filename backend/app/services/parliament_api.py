@@ -1,75 +1,127 @@
 import asyncio
+import bisect
 import logging
-import time
 from datetime import datetime, timedelta
 
-import httpx
-import swissparlpy as spp
+from pyodata.v2.service import GetEntitySetFilter
 
 from ..config import settings
+from . import cache_versions, sync_runs
+from .http_client import breaker, get_json
+from .odata_client import ODataError
+from .ttl_cache import TTLCache
+from .upstream_executor import get_data, run_upstream
 
 logger = logging.getLogger(__name__)
 
 BASE = settings.PARLIAMENT_API_BASE
-TIMEOUT = 30.0
-MAX_RETRIES = 3
 
-# In-memory cache for recent businesses (title + number)
-_recent_businesses_cache: list[dict] = []
-_recent_businesses_cache_time: datetime | None = None
-_CACHE_TTL_HOURS = 6
+# In-memory sorted index over cached_businesses for /api/parliament/recent
+_recent_index: "_RecentBusinessIndex | None" = None
+
+# Bulk fetching: business numbers per OData OR-filter request
+BULK_CHUNK_SIZE = 50
+
+# Columns required by _parse_business (plus the key)
+_BUSINESS_SELECT = ",".join([
+    "BusinessShortNumber",
+    "Title",
+    "Description",
+    "BusinessStatusText",
+    "BusinessTypeName",
+    "SubmittedBy",
+    "SubmittedText",
+    "ReasonText",
+    "FederalCouncilResponseText",
+    "FederalCouncilProposalText",
+    "FirstCouncil1Name",
+    "SubmissionDate",
+    "Modified",
+])
 
 
 async def _get(url: str, params: dict | None = None) -> dict | None:
-    """GET request with retry and backoff."""
-    for attempt in range(MAX_RETRIES):
-        try:
-            async with httpx.AsyncClient(timeout=TIMEOUT) as client:
-                resp = await client.get(url, params=params)
-                resp.raise_for_status()
-                return resp.json()
-        except (httpx.HTTPError, httpx.TimeoutException) as exc:
-            logger.warning("Parliament API attempt %d failed: %s", attempt + 1, exc)
-            if attempt < MAX_RETRIES - 1:
-                time.sleep(2 ** attempt)
-    return None
+    """GET request with async retry/backoff behind the circuit breaker."""
+    return await get_json(url, params)
+
+
+def upstream_available() -> bool:
+    """False while the circuit breaker is rejecting calls to ws.parlament.ch."""
+    return not breaker.is_open
+
+
+def _results(data: dict | None) -> list[dict]:
+    """Extract the result rows from an OData v2 JSON response."""
+    if not data:
+        return []
+    d = data.get("d")
+    if isinstance(d, dict):
+        return d.get("results", []) or []
+    if isinstance(d, list):
+        return d
+    return []
+
+
+def _chunks(items: list, size: int = BULK_CHUNK_SIZE):
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+def _or_filter(field: str, values: list, quote: bool = True) -> str:
+    """Build '(F eq 'a' or F eq 'b' ...)' for an OData $filter."""
+    if quote:
+        terms = [f"{field} eq '{v}'" for v in values]
+    else:
+        terms = [f"{field} eq {v}" for v in values]
+    return "(" + " or ".join(terms) + ")"
 
 
 async def fetch_business(business_number: str) -> dict | None:
     """Fetch a single business by its number (e.g. '24.3927')."""
     url = f"{BASE}/Business"
     params = {
-        "$filter": f"Language eq 'DE'",
+        "$filter": f"BusinessShortNumber eq '{business_number}' and Language eq 'DE'",
         "$format": "json",
     }
-    data = await _get(url, params={
-        **params,
-        "$filter": f"BusinessShortNumber eq '{business_number}' and Language eq 'DE'",
-    })
-    if not data:
+
+    # Business and author faction (BusinessRole) are independent – fetch concurrently
+    data, faction = await asyncio.gather(
+        _get(url, params),
+        fetch_author_faction(business_number),
+        return_exceptions=True,
+    )
+    if isinstance(data, BaseException) or not data:
         return None
 
-    results = data.get("d", {}).get("results", []) if isinstance(data.get("d"), dict) else []
-    if not results:
-        # Try alternative response format
-        results = data.get("d", []) if isinstance(data.get("d"), list) else []
+    results = _results(data)
     if not results:
         return None
 
     item = results[0] if isinstance(results, list) else results
     parsed = _parse_business(item, business_number)
 
-    # Fetch author faction in parallel
-    try:
-        faction = await fetch_author_faction(business_number)
-        if faction:
-            parsed["author_faction"] = faction
-    except Exception:
-        logger.debug("Could not fetch faction for %s", business_number)
+    if isinstance(faction, BaseException):
+        logger.debug("Could not fetch faction for %s: %s", business_number, faction)
+    elif faction:
+        parsed["author_faction"] = faction
 
     return parsed
 
 
+def _parse_odata_datetime(raw) -> datetime | None:
+    """Parse an OData '/Date(ms+offset)/' or ISO value into a naive UTC datetime."""
+    if not raw:
+        return None
+    try:
+        raw_str = str(raw)
+        if "/Date(" in raw_str:
+            ts = int(raw_str.split("(")[1].split(")")[0].split("+")[0].split("-")[0])
+            return datetime.utcfromtimestamp(ts / 1000)
+        return datetime.fromisoformat(raw_str.replace("Z", "+00:00")).replace(tzinfo=None)
+    except (ValueError, IndexError):
+        return None
+
+
 def _parse_business(item: dict, business_number: str) -> dict:
     submission_raw = item.get("SubmissionDate")
     submission_date = None
@@ -96,27 +148,102 @@ def _parse_business(item: dict, business_number: str) -> dict:
         "federal_council_proposal": item.get("FederalCouncilProposalText", ""),
         "first_council": item.get("FirstCouncil1Name", ""),
         "submission_date": submission_date,
+        "modified": _parse_odata_datetime(item.get("Modified")),
     }
 
 
+# ---------------------------------------------------------------------------
+# Author faction resolution (local parliamentarian table, API fallback)
+# ---------------------------------------------------------------------------
+
+# person_number -> faction name, mirrored from the parliamentarians table;
+# rebuilt when the parliamentarians version changes (any worker's sync)
+_faction_index: dict[int, str] = {}
+_faction_index_loaded = False
+_faction_index_version: str | None = None
+
+
+def refresh_faction_index() -> int:
+    """(Re)build the person -> faction index from local Parliamentarian rows.
+
+    Called after sync_parliamentarians, lazily on first use and whenever the
+    parliamentarians version changed since the last build.
+    """
+    global _faction_index, _faction_index_loaded, _faction_index_version
+    from ..database import SessionLocal
+    from ..models import Parliamentarian
+
+    version = cache_versions.read_version(cache_versions.PARLIAMENTARIANS)
+    db = SessionLocal()
+    try:
+        rows = db.query(
+            Parliamentarian.person_number,
+            Parliamentarian.parl_group_name,
+            Parliamentarian.party_name,
+        ).all()
+    finally:
+        db.close()
+
+    index = {}
+    for row in rows:
+        faction = row.parl_group_name or row.party_name
+        if faction:
+            index[row.person_number] = faction
+    _faction_index = index
+    _faction_index_loaded = True
+    _faction_index_version = version
+    logger.info("Faction index refreshed: %d parliamentarians", len(index))
+    return len(index)
+
+
+def _local_factions() -> dict[int, str]:
+    try:
+        if (not _faction_index_loaded
+                or cache_versions.read_version(cache_versions.PARLIAMENTARIANS) != _faction_index_version):
+            refresh_faction_index()
+    except Exception:
+        logger.exception("Could not load faction index from database")
+    return _faction_index
+
+
+async def _fetch_member_factions(member_ids: list[int]) -> dict[int, str]:
+    """Resolve MemberCouncil IDs (= person numbers) to factions.
+
+    Uses the local index and only asks the API for misses.
+    """
+    local = _local_factions()
+    found = {mid: local[mid] for mid in member_ids if mid in local}
+    local_hits = len(found)
+    missing = sorted({mid for mid in member_ids if mid not in found})
+
+    for chunk in _chunks(missing):
+        data = await _get(f"{BASE}/MemberCouncil", {
+            "$filter": f"{_or_filter('ID', chunk, quote=False)} and Language eq 'DE'",
+            "$select": "ID,ParlGroupName,PartyName",
+            "$format": "json",
+        })
+        for member in _results(data):
+            faction = member.get("ParlGroupName") or member.get("PartyName") or ""
+            if member.get("ID") and faction:
+                found[member["ID"]] = faction
+    if missing:
+        logger.debug("Faction index: %d local hits, %d API lookups", local_hits, len(missing))
+    return found
+
+
 async def fetch_author_faction(business_number: str) -> str | None:
     """Fetch the parliamentary faction (Fraktion) of the business author via BusinessRole."""
     url = f"{BASE}/BusinessRole"
     params = {
         "$filter": f"BusinessShortNumber eq '{business_number}' and Language eq 'DE'",
+        "$select": "MemberCouncilNumber",
         "$format": "json",
     }
     data = await _get(url, params)
-    if not data:
-        return None
-
-    results = data.get("d", {}).get("results", []) if isinstance(data.get("d"), dict) else []
-    if not results:
-        results = data.get("d", []) if isinstance(data.get("d"), list) else []
 
     # Find a role that has a MemberCouncilNumber (the author)
     member_council_number = None
-    for role in results:
+    for role in _results(data):
         mcn = role.get("MemberCouncilNumber")
         if mcn:
             member_council_number = mcn
@@ -125,26 +252,233 @@ async def fetch_author_faction(business_number: str) -> str | None:
     if not member_council_number:
         return None
 
-    # Fetch the MemberCouncil to get ParlGroupName
-    mc_url = f"{BASE}/MemberCouncil"
-    mc_params = {
-        "$filter": f"ID eq {member_council_number} and Language eq 'DE'",
-        "$format": "json",
-        "$select": "ParlGroupName,ParlGroupAbbreviation,PartyName",
+    factions = await _fetch_member_factions([member_council_number])
+    return factions.get(member_council_number)
+
+
+async def iter_businesses(business_numbers: list[str], concurrency: int = 4):
+    """Yield ``{number: parsed business}`` per chunk as chunks complete.
+
+    Chunks of up to BULK_CHUNK_SIZE numbers are fetched with OData OR-filters,
+    at most ``concurrency`` chunks in flight. Business and BusinessRole
+    (author faction) lookups of a chunk run concurrently.
+    """
+    numbers = sorted({nr for nr in business_numbers if nr})
+    if not numbers:
+        return
+
+    url = f"{BASE}/Business"
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def _fetch_chunk(chunk: list[str]) -> dict[str, dict]:
+        async with semaphore:
+            data, factions = await asyncio.gather(
+                _get(url, {
+                    "$filter": f"{_or_filter('BusinessShortNumber', chunk)} and Language eq 'DE'",
+                    "$select": _BUSINESS_SELECT,
+                    "$format": "json",
+                }),
+                fetch_author_factions(chunk),
+                return_exceptions=True,
+            )
+        if isinstance(data, BaseException):
+            raise data
+        if isinstance(factions, BaseException):
+            logger.error("Could not fetch author factions in bulk: %s", factions)
+            factions = {}
+
+        parsed: dict[str, dict] = {}
+        for item in _results(data):
+            nr = item.get("BusinessShortNumber", "")
+            if nr and nr not in parsed:
+                parsed[nr] = _parse_business(item, nr)
+                if factions.get(nr):
+                    parsed[nr]["author_faction"] = factions[nr]
+        return parsed
+
+    tasks = [asyncio.create_task(_fetch_chunk(chunk)) for chunk in _chunks(numbers)]
+    try:
+        for next_chunk in asyncio.as_completed(tasks):
+            yield await next_chunk
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+async def fetch_businesses(business_numbers: list[str], concurrency: int = 4) -> dict[str, dict]:
+    """Bulk-fetch businesses by number using chunked OData OR-filters.
+
+    Returns a dict keyed by business number; numbers not found upstream are
+    missing from the result. Author factions are resolved in bulk as well.
+    """
+    out: dict[str, dict] = {}
+    async for chunk in iter_businesses(business_numbers, concurrency):
+        out.update(chunk)
+    logger.info("Bulk-fetched %d/%d businesses", len(out), len(set(business_numbers)))
+    return out
+
+
+async def fetch_business_modified(
+    business_numbers: list[str], concurrency: int = 4,
+) -> tuple[dict[str, datetime], set[str]]:
+    """Return the upstream ``Modified`` timestamp per business number, plus
+    the numbers whose lookup failed (unknown, not missing upstream).
+
+    Only the key and timestamp are selected, so this is cheap enough to run
+    for every tracked business before deciding which ones to refetch.
+    """
+    numbers = sorted({nr for nr in business_numbers if nr})
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def _fetch_chunk(chunk: list[str]) -> dict | None:
+        async with semaphore:
+            return await _get(f"{BASE}/Business", {
+                "$filter": f"{_or_filter('BusinessShortNumber', chunk)} and Language eq 'DE'",
+                "$select": "BusinessShortNumber,Modified",
+                "$format": "json",
+            })
+
+    chunks = list(_chunks(numbers))
+    out: dict[str, datetime] = {}
+    failed: set[str] = set()
+    for chunk, data in zip(chunks, await asyncio.gather(*(_fetch_chunk(c) for c in chunks))):
+        if data is None:
+            failed.update(chunk)
+            continue
+        for item in _results(data):
+            nr = item.get("BusinessShortNumber")
+            modified = _parse_odata_datetime(item.get("Modified"))
+            if nr and modified:
+                out[nr] = modified
+    return out, failed
+
+
+async def fetch_author_factions(business_numbers: list[str]) -> dict[str, str]:
+    """Bulk variant of fetch_author_faction: business number -> faction name."""
+    numbers = sorted({nr for nr in business_numbers if nr})
+    if not numbers:
+        return {}
+
+    # BusinessRole: business number -> MemberCouncil ID of the author
+    member_by_business: dict[str, int] = {}
+    for chunk in _chunks(numbers):
+        data = await _get(f"{BASE}/BusinessRole", {
+            "$filter": f"{_or_filter('BusinessShortNumber', chunk)} and Language eq 'DE'",
+            "$select": "BusinessShortNumber,MemberCouncilNumber",
+            "$format": "json",
+        })
+        for role in _results(data):
+            nr = role.get("BusinessShortNumber")
+            mcn = role.get("MemberCouncilNumber")
+            if nr and mcn and nr not in member_by_business:
+                member_by_business[nr] = mcn
+
+    faction_by_member = await _fetch_member_factions(list(member_by_business.values()))
+
+    return {
+        nr: faction_by_member[mcn]
+        for nr, mcn in member_by_business.items()
+        if mcn in faction_by_member
     }
-    mc_data = await _get(mc_url, mc_params)
-    if not mc_data:
-        return None
 
-    mc_results = mc_data.get("d", {}).get("results", []) if isinstance(mc_data.get("d"), dict) else []
-    if not mc_results:
-        mc_results = mc_data.get("d", []) if isinstance(mc_data.get("d"), list) else []
-    if not mc_results:
-        return None
 
-    member = mc_results[0] if isinstance(mc_results, list) else mc_results
-    faction = member.get("ParlGroupName") or member.get("PartyName") or ""
-    return faction if faction else None
+class _RecentBusinessIndex:
+    """Sorted, prefix-searchable snapshot of cached_businesses.
+
+    Rebuilt only when the business cache version (the ``cache_versions`` row
+    bumped by sync_cached_businesses) changes, i.e. once per cache sync that
+    changed something.
+    """
+
+    def __init__(self, version: str, rows: list[tuple[str, str]]):
+        self.version = version
+        # ascending by business number (bisect); served in descending order
+        self.rows = sorted(rows)
+        self.numbers = [nr for nr, _ in self.rows]
+        words = []
+        for idx, (_, title) in enumerate(self.rows):
+            for word in set((title or "").lower().split()):
+                words.append((word, idx))
+        self.words = sorted(words)
+
+    def _number_matches(self, prefix: str) -> range:
+        lo = bisect.bisect_left(self.numbers, prefix)
+        hi = bisect.bisect_left(self.numbers, prefix + "\uffff")
+        return range(lo, hi)
+
+    def _title_matches(self, prefix: str) -> set[int]:
+        prefix = prefix.lower()
+        lo = bisect.bisect_left(self.words, (prefix,))
+        out = set()
+        for word, idx in self.words[lo:]:
+            if not word.startswith(prefix):
+                break
+            out.add(idx)
+        return out
+
+    def query(self, q: str | None, after: str | None) -> list[int]:
+        """Row indices matching ``q`` (number or title-word prefix), newest first."""
+        if q:
+            matches = set(self._number_matches(q)) | self._title_matches(q)
+            indices = sorted(matches, reverse=True)
+        else:
+            indices = range(len(self.rows) - 1, -1, -1)
+        if after:
+            # keyset pagination: continue below the last number of the previous page
+            cutoff = bisect.bisect_left(self.numbers, after)
+            indices = [i for i in indices if i < cutoff]
+        return list(indices)
+
+
+def _legacy_recent_version(db) -> str | None:
+    """Version of a cache filled before versions were recorded."""
+    from sqlalchemy import func
+
+    from ..models import CachedBusiness
+
+    count, last_update = db.query(
+        func.count(CachedBusiness.id),
+        func.max(CachedBusiness.updated_at),
+    ).one()
+    return f"{count}-{last_update.timestamp() if last_update else 0:.0f}" if count else None
+
+
+def recent_businesses_version() -> str | None:
+    """Version of the business cache (None if empty); used as ETag seed.
+
+    Bumped by sync_cached_businesses. Served from memory and re-read from
+    the ``cache_versions`` row at most every VERSION_TTL_SECONDS, so other
+    workers see a sync within that time.
+    """
+    return cache_versions.read_version(cache_versions.CACHED_BUSINESSES, _legacy_recent_version)
+
+
+def query_recent_businesses(
+    version: str,
+    q: str | None = None,
+    limit: int | None = None,
+    offset: int = 0,
+    after: str | None = None,
+) -> tuple[list[dict], int]:
+    """Return (page, total matches) from the in-memory recent-business index."""
+    global _recent_index
+    if _recent_index is None or _recent_index.version != version:
+        from ..database import SessionLocal
+        from ..models import CachedBusiness
+
+        db = SessionLocal()
+        try:
+            rows = db.query(CachedBusiness.business_number, CachedBusiness.title).all()
+        finally:
+            db.close()
+        _recent_index = _RecentBusinessIndex(version, [(r.business_number, r.title or "") for r in rows])
+        logger.info("Recent business index rebuilt: %d rows (version %s)", len(rows), version)
+
+    index = _recent_index
+    indices = index.query(q.strip() if q else None, after)
+    total = len(indices)
+    page = indices[offset:offset + limit] if limit else indices[offset:]
+    return [{"business_number": index.rows[i][0], "title": index.rows[i][1]} for i in page], total
 
 
 async def fetch_recent_businesses_cached() -> list[dict]:
@@ -152,93 +486,194 @@ async def fetch_recent_businesses_cached() -> list[dict]:
 
     Falls back to API if the DB cache is empty.
     """
-    from ..database import SessionLocal
-    from ..models import CachedBusiness
-
-    db = SessionLocal()
-    try:
-        count = db.query(CachedBusiness).count()
-        if count > 0:
-            rows = db.query(CachedBusiness).order_by(CachedBusiness.business_number.desc()).all()
-            return [{"business_number": r.business_number, "title": r.title or ""} for r in rows]
-    finally:
-        db.close()
+    version = recent_businesses_version()
+    if version:
+        rows, _ = query_recent_businesses(version)
+        return rows
 
     # Fallback: fetch from API and return (without persisting)
     return await _fetch_businesses_from_api()
 
 
-async def _fetch_businesses_from_api() -> list[dict]:
-    """Fetch businesses from current and previous year from parliament API."""
-    now = datetime.utcnow()
-    since = f"{now.year - 1}-01-01"
+def _cache_since() -> str:
+    """Start of the business cache window: Jan 1st of the previous year."""
+    return f"{datetime.utcnow().year - 1}-01-01"
+
+
+def _cache_page_params(since: str, skip: int, top: int) -> dict:
+    return {
+        "$filter": f"SubmissionDate ge datetime'{since}T00:00:00' and Language eq 'DE'",
+        "$format": "json",
+        "$select": "BusinessShortNumber,Title",
+        # Secondary key keeps $skip pages stable when fetched concurrently
+        "$orderby": "SubmissionDate desc,ID desc",
+        "$top": str(top),
+        "$skip": str(skip),
+    }
+
+
+def _cache_rows(results: list[dict]) -> list[dict]:
+    rows = []
+    for item in results:
+        nr = item.get("BusinessShortNumber", "")
+        if nr:
+            rows.append({
+                "business_number": nr,
+                "title": item.get("Title", ""),
+            })
+    return rows
+
+
+async def _count_businesses_since(since: str) -> int | None:
+    """Return the total number of businesses in the cache window ($inlinecount)."""
+    params = _cache_page_params(since, skip=0, top=1)
+    params["$inlinecount"] = "allpages"
+    data = await _get(f"{BASE}/Business", params)
+    if not data or not isinstance(data.get("d"), dict):
+        return None
+    try:
+        return int(data["d"]["__count"])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+async def _iter_business_pages(since: str):
+    """Yield pages of {business_number, title} rows for the cache window.
+
+    When the total count is known, pages are fetched concurrently under a
+    semaphore and yielded as they complete; otherwise pages are walked
+    sequentially until a short page is returned. Raises ODataError if a page
+    cannot be fetched, so a sync never takes a truncated window as complete.
+    """
     url = f"{BASE}/Business"
-    all_results: list[dict] = []
-    skip = 0
-    batch_size = 500
+    page_size = settings.BUSINESS_CACHE_PAGE_SIZE
+    total = await _count_businesses_since(since)
+
+    if total is None:
+        logger.info("Business count unavailable – falling back to sequential paging")
+        skip = 0
+        while True:
+            data = await _get(url, _cache_page_params(since, skip, page_size))
+            if data is None:
+                raise ODataError(f"Failed to fetch Business page at $skip={skip}")
+            results = _results(data)
+            if not results:
+                break
+            yield _cache_rows(results)
+            if len(results) < page_size:
+                break
+            skip += page_size
+        return
 
-    while True:
-        params = {
-            "$filter": f"SubmissionDate ge datetime'{since}T00:00:00' and Language eq 'DE'",
-            "$format": "json",
-            "$select": "BusinessShortNumber,Title",
-            "$orderby": "SubmissionDate desc",
-            "$top": str(batch_size),
-            "$skip": str(skip),
-        }
-        data = await _get(url, params)
-        if not data:
-            break
+    logger.info("Fetching %d businesses in pages of %d (concurrency %d)",
+                total, page_size, settings.BUSINESS_CACHE_CONCURRENCY)
+    semaphore = asyncio.Semaphore(settings.BUSINESS_CACHE_CONCURRENCY)
 
-        results = data.get("d", {}).get("results", []) if isinstance(data.get("d"), dict) else []
-        if not results:
-            results = data.get("d", []) if isinstance(data.get("d"), list) else []
-        if not results:
-            break
+    async def _fetch_page(skip: int) -> list[dict]:
+        async with semaphore:
+            data = await _get(url, _cache_page_params(since, skip, page_size))
+        if data is None:
+            raise ODataError(f"Failed to fetch Business page at $skip={skip}")
+        return _cache_rows(_results(data))
+
+    tasks = [asyncio.create_task(_fetch_page(skip)) for skip in range(0, total, page_size)]
+    try:
+        for next_page in asyncio.as_completed(tasks):
+            yield await next_page
+    finally:
+        for task in tasks:
+            task.cancel()
 
-        for item in results:
-            nr = item.get("BusinessShortNumber", "")
-            if nr:
-                all_results.append({
-                    "business_number": nr,
-                    "title": item.get("Title", ""),
-                })
-        if len(results) < batch_size:
-            break
-        skip += batch_size
+
+async def _fetch_businesses_from_api() -> list[dict]:
+    """Fetch businesses from current and previous year from parliament API."""
+    since = _cache_since()
+    all_results: list[dict] = []
+    try:
+        async for page in _iter_business_pages(since):
+            all_results.extend(page)
+    except ODataError as exc:
+        logger.warning("Business list from API is incomplete: %s", exc)
 
     logger.info("Fetched %d businesses from API (since %s)", len(all_results), since)
     return all_results
 
 
-async def sync_cached_businesses():
-    """Fetch businesses for years 25/26 from API and store in DB."""
-    from ..database import SessionLocal
+def _upsert_cached_businesses(db, rows: list[dict]) -> tuple[set[str], int]:
+    """Upsert one page into cached_businesses. Returns (inserted numbers,
+    updated count)."""
+    from sqlalchemy import literal_column
+    from sqlalchemy.dialects.postgresql import insert
+
     from ..models import CachedBusiness
 
-    businesses = await _fetch_businesses_from_api()
-    if not businesses:
-        logger.warning("No businesses fetched from API for sync")
-        return
+    # A single INSERT ... ON CONFLICT may not touch the same key twice
+    unique = list({r["business_number"]: r for r in rows}.values())
+    if not unique:
+        return set(), 0
+
+    stmt = insert(CachedBusiness).values(unique)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[CachedBusiness.business_number],
+        set_={"title": stmt.excluded.title, "updated_at": datetime.utcnow()},
+        where=CachedBusiness.title.is_distinct_from(stmt.excluded.title),
+    ).returning(
+        CachedBusiness.business_number,
+        literal_column("xmax = 0").label("inserted"),
+    )
+    result = db.execute(stmt).all()
+    inserted = {row.business_number for row in result if row.inserted}
+    return inserted, len(result) - len(inserted)
+
 
+async def sync_cached_businesses():
+    """Fetch businesses for years 25/26 from API and store in DB.
+
+    Pages are upserted as they arrive instead of materializing the full set;
+    newly cached businesses are matched against the watch rules.
+    """
+    from ..database import SessionLocal
+    from ..models import CacheVersion, CachedBusiness
+    from .watch_rules import apply_watch_rules, load_watch_rules
+
+    since = _cache_since()
     db = SessionLocal()
     try:
-        existing = {r.business_number for r in db.query(CachedBusiness.business_number).all()}
-        seen = set(existing)
-        new_count = 0
-        for b in businesses:
-            nr = b["business_number"]
-            if nr not in seen:
-                seen.add(nr)
-                db.add(CachedBusiness(
-                    business_number=nr,
-                    title=b.get("title", ""),
-                ))
-                new_count += 1
-        db.commit()
-        logger.info("Business cache sync complete: %d new, %d total", new_count, len(existing) + new_count)
+        # Filling an empty cache is not "new businesses": no watch alerts
+        initial = db.query(CachedBusiness.id).first() is None
+        rules = load_watch_rules(db)
+        fetched = new_count = updated_count = 0
+        async for page in _iter_business_pages(since):
+            fetched += len(page)
+            with sync_runs.phase("upsert"):
+                inserted, updated = _upsert_cached_businesses(db, page)
+            if inserted and not initial:
+                with sync_runs.phase("watch_rules"):
+                    apply_watch_rules(db, rules, [r for r in page if r["business_number"] in inserted])
+            db.commit()
+            new_count += len(inserted)
+            updated_count += updated
+            sync_runs.count(fetched=len(page), inserted=len(inserted), updated=updated)
+
+        if not fetched:
+            logger.warning("No businesses fetched from API for sync")
+            return
+        # New version only if the cache changed (or none was recorded yet),
+        # so unchanged syncs keep clients' ETags valid
+        if new_count or updated_count or db.get(CacheVersion, cache_versions.CACHED_BUSINESSES) is None:
+            cache_versions.bump_version(db, cache_versions.CACHED_BUSINESSES)
+            db.commit()
+        logger.info(
+            "Business cache sync complete: %d fetched, %d new, %d titles updated",
+            fetched, new_count, updated_count,
+        )
+
+        from .search_index import rebuild_search_index
+        with sync_runs.phase("search_index"):
+            await asyncio.to_thread(rebuild_search_index)
     except Exception:
         db.rollback()
+        sync_runs.mark_failed()
         logger.exception("Error syncing business cache")
         raise
     finally:
@@ -319,41 +754,57 @@ async def fetch_business_status(business_number: str) -> list[dict]:
     return events
 
 
-async def fetch_new_businesses(since_date: str) -> list[dict]:
-    """Fetch new businesses submitted since a given date (YYYY-MM-DD)."""
-    url = f"{BASE}/Business"
-    params = {
-        "$filter": f"SubmissionDate ge datetime'{since_date}T00:00:00' and Language eq 'DE'",
-        "$format": "json",
-        "$orderby": "SubmissionDate desc",
-        "$top": "500",
-    }
-    data = await _get(url, params)
-    if not data:
-        return []
+async def iter_new_business_pages(since_date: str):
+    """Yield pages of businesses submitted since a given date (YYYY-MM-DD).
 
-    results = data.get("d", {}).get("results", []) if isinstance(data.get("d"), dict) else []
-    if not results:
-        results = data.get("d", []) if isinstance(data.get("d"), list) else []
-    out = []
-    for item in results:
-        nr = item.get("BusinessShortNumber", "")
-        parsed = _parse_business(item, nr)
-        out.append({"business_number": nr, **parsed})
-    return out
+    Walks all ``$skip`` pages of MONITORING_PAGE_SIZE until a short page is
+    returned, so busy periods are not cut off at the first page. Raises
+    ODataError if a page cannot be fetched.
+    """
+    url = f"{BASE}/Business"
+    page_size = settings.MONITORING_PAGE_SIZE
+    skip = 0
+    while True:
+        params = {
+            "$filter": f"SubmissionDate ge datetime'{since_date}T00:00:00' and Language eq 'DE'",
+            "$format": "json",
+            "$select": _BUSINESS_SELECT,
+            # Secondary key keeps $skip pages stable
+            "$orderby": "SubmissionDate desc,ID desc",
+            "$top": str(page_size),
+            "$skip": str(skip),
+        }
+        data = await _get(url, params)
+        if data is None:
+            raise ODataError(f"Failed to fetch Business page at $skip={skip}")
+        results = _results(data)
+        if not results:
+            return
+        page = []
+        for item in results:
+            nr = item.get("BusinessShortNumber", "")
+            if nr:
+                page.append({"business_number": nr, **_parse_business(item, nr)})
+        yield page
+        if len(results) < page_size:
+            return
+        skip += page_size
 
 
 # ---------------------------------------------------------------------------
 # swissparlpy-based functions for committee & session schedule data
 # ---------------------------------------------------------------------------
 
-def _fetch_preconsultations_sync(business_number: str) -> list[dict]:
-    """Fetch committee pre-consultations (Vorberatungen) for a business."""
+def _fetch_preconsultations_sync(business_number: str) -> list[dict] | None:
+    """Fetch committee pre-consultations (Vorberatungen) for a business.
+
+    Returns None if the upstream query failed (as opposed to [] for none).
+    """
     try:
-        data = spp.get_data("Preconsultation", Language="DE", BusinessShortNumber=business_number)
+        data = get_data("Preconsultation", Language="DE", BusinessShortNumber=business_number)
     except Exception as exc:
         logger.warning("swissparlpy Preconsultation query failed: %s", exc)
-        return []
+        return None
 
     results = []
     for row in data:
@@ -369,66 +820,102 @@ def _fetch_preconsultations_sync(business_number: str) -> list[dict]:
     return results
 
 
-def _fetch_session_schedule_sync(business_number: str) -> list[dict]:
-    """Fetch plenary session schedule for a business via SubjectBusiness → Subject → Meeting."""
-    try:
-        sb_data = spp.get_data("SubjectBusiness", Language="DE", BusinessShortNumber=business_number)
-    except Exception as exc:
-        logger.warning("swissparlpy SubjectBusiness query failed: %s", exc)
-        return []
+# Subject / Meeting rows are shared by many businesses and rarely change:
+# memoize them across sync runs and requests.
+_subject_cache = TTLCache(settings.SCHEDULE_MEMO_MAXSIZE, settings.SCHEDULE_MEMO_TTL_SECONDS)
+_meeting_cache = TTLCache(settings.SCHEDULE_MEMO_MAXSIZE, settings.SCHEDULE_MEMO_TTL_SECONDS)
 
-    subject_ids = []
-    for row in sb_data:
-        subject_ids.append(row["IdSubject"])
 
-    if not subject_ids:
-        return []
+def _id_filter(ids: list):
+    """swissparlpy filter callable for '(ID eq a or ID eq b ...)' with typed literals."""
+    def _build(entities):
+        terms = [entities.ID == i for i in ids]
+        return terms[0] if len(terms) == 1 else GetEntitySetFilter.or_(*terms)
+    return _build
+
+
+def _fetch_by_ids_sync(table: str, ids: list, cache: TTLCache) -> dict:
+    """Resolve ``table`` rows by ID through ``cache``; misses are fetched in
+    batched ``ID eq .. or ..`` requests. Returns {id: row or None}; upstream
+    errors propagate so callers never mistake them for unknown IDs."""
+    rows, missing = cache.get_many(dict.fromkeys(ids))
+    for chunk in _chunks(missing):
+        data = get_data(table, filter=_id_filter(chunk), Language="DE")
+        fetched = {row["ID"]: row for row in data}
+        for i in chunk:
+            # Cache misses as None too, so unknown IDs are not refetched
+            cache.set(i, fetched.get(i))
+            rows[i] = fetched.get(i)
+    return rows
+
+
+def _fetch_session_schedule_sync(business_number: str) -> list[dict] | None:
+    """Fetch plenary session schedule for a business via SubjectBusiness → Subject → Meeting.
+
+    Returns None if any upstream query failed (as opposed to [] for none).
+    """
+    try:
+        sb_data = get_data("SubjectBusiness", Language="DE", BusinessShortNumber=business_number)
+        subject_ids = [row["IdSubject"] for row in sb_data]
+        if not subject_ids:
+            return []
+
+        subjects = _fetch_by_ids_sync("Subject", subject_ids, _subject_cache)
+        meeting_ids = [
+            subj["IdMeeting"] for subj in subjects.values()
+            if subj and subj.get("IdMeeting")
+        ]
+        meetings = _fetch_by_ids_sync("Meeting", meeting_ids, _meeting_cache)
+    except Exception as exc:
+        logger.warning("swissparlpy session schedule query failed for %s: %s", business_number, exc)
+        return None
 
     results = []
     for sid in subject_ids:
-        try:
-            subj_data = spp.get_data("Subject", Language="DE", ID=sid)
-        except Exception:
+        subj = subjects.get(sid)
+        mtg = meetings.get(subj.get("IdMeeting")) if subj else None
+        if not mtg:
             continue
-        for subj in subj_data:
-            meeting_id = subj.get("IdMeeting")
-            if not meeting_id:
-                continue
-            try:
-                mtg_data = spp.get_data("Meeting", Language="DE", ID=meeting_id)
-            except Exception:
-                continue
-            for mtg in mtg_data:
-                results.append({
-                    "meeting_date": mtg["Date"].isoformat() if mtg.get("Date") else None,
-                    "begin": mtg.get("Begin", ""),
-                    "council": mtg.get("CouncilName", ""),
-                    "council_abbrev": mtg.get("CouncilAbbreviation", ""),
-                    "session_name": mtg.get("SessionName", ""),
-                    "meeting_order": mtg.get("MeetingOrderText", ""),
-                    "location": mtg.get("Location", ""),
-                })
+        results.append({
+            "meeting_date": mtg["Date"].isoformat() if mtg.get("Date") else None,
+            "begin": mtg.get("Begin", ""),
+            "council": mtg.get("CouncilName", ""),
+            "council_abbrev": mtg.get("CouncilAbbreviation", ""),
+            "session_name": mtg.get("SessionName", ""),
+            "meeting_order": mtg.get("MeetingOrderText", ""),
+            "location": mtg.get("Location", ""),
+        })
     return results
 
 
-async def fetch_preconsultations(business_number: str) -> list[dict]:
-    """Async wrapper: fetch committee pre-consultations for a business."""
-    return await asyncio.to_thread(_fetch_preconsultations_sync, business_number)
+async def fetch_preconsultations(business_number: str) -> list[dict] | None:
+    """Async wrapper: fetch committee pre-consultations for a business
+    (None on upstream failure)."""
+    return await run_upstream("schedule", _fetch_preconsultations_sync, business_number)
 
 
-async def fetch_session_schedule(business_number: str) -> list[dict]:
-    """Async wrapper: fetch plenary session schedule for a business."""
-    return await asyncio.to_thread(_fetch_session_schedule_sync, business_number)
+async def fetch_session_schedule(business_number: str) -> list[dict] | None:
+    """Async wrapper: fetch plenary session schedule for a business (None on
+    upstream failure)."""
+    return await run_upstream("schedule", _fetch_session_schedule_sync, business_number)
 
 
 async def fetch_business_schedule(business_number: str) -> dict:
-    """Fetch full schedule info for a business (committees + plenary sessions)."""
+    """Fetch full schedule info for a business (committees + plenary sessions).
+
+    Parts whose upstream fetch failed are listed in ``failed``; their lists
+    are empty but must not be taken as "nothing scheduled".
+    """
     preconsultations, sessions = await asyncio.gather(
         fetch_preconsultations(business_number),
         fetch_session_schedule(business_number),
     )
     return {
         "business_number": business_number,
-        "preconsultations": preconsultations,
-        "sessions": sessions,
+        "preconsultations": preconsultations or [],
+        "sessions": sessions or [],
+        "failed": [
+            part for part, value in (("preconsultations", preconsultations), ("sessions", sessions))
+            if value is None
+        ],
     }
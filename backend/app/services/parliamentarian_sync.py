@@ -6,13 +6,16 @@ Runs monthly via scheduler.
 
 import asyncio
 import logging
+import time
 from datetime import datetime
 
-import swissparlpy as spp
 from sqlalchemy.orm import Session
 
 from ..database import SessionLocal
 from ..models import Canton, Parliamentarian, ParlGroup, Party
+from . import cache_versions, sync_runs
+from .parliament_api import refresh_faction_index
+from .upstream_executor import get_data, run_upstream
 
 logger = logging.getLogger(__name__)
 
@@ -20,7 +23,7 @@ logger = logging.getLogger(__name__)
 def _fetch_member_council_sync() -> list[dict]:
     """Fetch all active council members via swissparlpy."""
     try:
-        data = spp.get_data("MemberCouncil", Language="DE")
+        data = get_data("MemberCouncil", Language="DE")
         return [dict(row) for row in data]
     except Exception as exc:
         logger.error("Failed to fetch MemberCouncil: %s", exc)
@@ -30,7 +33,7 @@ def _fetch_member_council_sync() -> list[dict]:
 def _fetch_parties_sync() -> list[dict]:
     """Fetch all parties."""
     try:
-        data = spp.get_data("Party", Language="DE")
+        data = get_data("Party", Language="DE")
         return [dict(row) for row in data]
     except Exception as exc:
         logger.error("Failed to fetch Party: %s", exc)
@@ -40,7 +43,7 @@ def _fetch_parties_sync() -> list[dict]:
 def _fetch_parl_groups_sync() -> list[dict]:
     """Fetch all parliamentary groups (Fraktionen)."""
     try:
-        data = spp.get_data("ParlGroup", Language="DE")
+        data = get_data("ParlGroup", Language="DE")
         return [dict(row) for row in data]
     except Exception as exc:
         logger.error("Failed to fetch ParlGroup: %s", exc)
@@ -50,7 +53,7 @@ def _fetch_parl_groups_sync() -> list[dict]:
 def _fetch_cantons_sync() -> list[dict]:
     """Fetch all cantons."""
     try:
-        data = spp.get_data("Canton", Language="DE")
+        data = get_data("Canton", Language="DE")
         return [dict(row) for row in data]
     except Exception as exc:
         logger.error("Failed to fetch Canton: %s", exc)
@@ -271,13 +274,16 @@ async def sync_parliamentarians():
     try:
         logger.info("Starting parliamentarian sync...")
 
-        # Fetch all data in parallel via threads
-        members_data, parties_data, groups_data, cantons_data = await asyncio.gather(
-            asyncio.to_thread(_fetch_member_council_sync),
-            asyncio.to_thread(_fetch_parties_sync),
-            asyncio.to_thread(_fetch_parl_groups_sync),
-            asyncio.to_thread(_fetch_cantons_sync),
-        )
+        # Fetch all data in parallel on the upstream pool
+        with sync_runs.phase("fetch"):
+            members_data, parties_data, groups_data, cantons_data = await asyncio.gather(
+                run_upstream("parliamentarians", _fetch_member_council_sync),
+                run_upstream("parliamentarians", _fetch_parties_sync),
+                run_upstream("parliamentarians", _fetch_parl_groups_sync),
+                run_upstream("parliamentarians", _fetch_cantons_sync),
+            )
+        sync_runs.count(fetched=len(members_data) + len(parties_data) + len(groups_data) + len(cantons_data))
+        write_started = time.monotonic()
 
         # Sync cantons first (lookup data)
         cantons_added = _sync_cantons(db, cantons_data)
@@ -298,10 +304,21 @@ async def sync_parliamentarians():
             parl_stats["added"], parl_stats["updated"], parl_stats["deactivated"],
         )
 
+        # Other workers rebuild their faction index when they see the new version
+        cache_versions.bump_version(db, cache_versions.PARLIAMENTARIANS)
         db.commit()
+        sync_runs.add_phase("write", time.monotonic() - write_started)
+        sync_runs.count(
+            inserted=cantons_added + parties_added + groups_added + parl_stats["added"],
+            updated=parl_stats["updated"] + parl_stats["deactivated"],
+        )
         logger.info("Parliamentarian sync complete")
+
+        # Author-faction lookups resolve against the freshly synced rows
+        refresh_faction_index()
     except Exception:
         db.rollback()
+        sync_runs.mark_failed()
         logger.exception("Parliamentarian sync failed")
     finally:
         db.close()
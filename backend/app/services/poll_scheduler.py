@@ -0,0 +1,262 @@
+"""Activity-aware polling of tracked businesses.
+
+Instead of refetching every tracked business each SYNC_INTERVAL_HOURS, every
+business gets its own next-poll time derived from its status, the next
+scheduled event, the trackers' priority and how recently it changed
+upstream. A min-heap keyed by that time yields the due businesses; every
+POLL_TICK_MINUTES all of them are synced, in batches of POLL_BATCH_SIZE:
+
+- hot (POLL_HOT_MINUTES): event within 7 days or changed in the last 2 days
+- warm (POLL_WARM_MINUTES): priority 1, event within 30 days or changed in
+  the last 14 days
+- dormant (POLL_DORMANT_HOURS): settled (e.g. "Erledigt") with nothing
+  scheduled and not high priority
+- everything else: SYNC_INTERVAL_HOURS
+
+The next-poll time is persisted on ``businesses.next_poll_at`` so the queue
+survives restarts. Only the scheduler leader holds the queue; other workers
+schedule a business by setting its ``next_poll_at`` (e.g. to now when it is
+first tracked), which the leader picks up on its next tick.
+"""
+
+import heapq
+import logging
+from datetime import datetime, timedelta
+
+from sqlalchemy import func, update
+from sqlalchemy.orm import Session
+
+from ..config import settings
+from ..database import SessionLocal
+from ..models import Business, BusinessEvent, TrackedBusiness
+from . import sync_runs
+from .scheduler import sync_business_rows
+
+logger = logging.getLogger(__name__)
+
+SETTLED_STATUSES = ("erledigt", "abgeschrieben", "zurückgezogen")
+# Re-read the queue from the database now and then, to pick up changes made
+# outside this process (and untracked businesses)
+QUEUE_RELOAD_INTERVAL = timedelta(hours=1)
+
+
+def poll_interval(
+    now: datetime,
+    status: str | None,
+    next_event: datetime | None,
+    priority: int | None,
+    last_modified: datetime | None,
+) -> timedelta:
+    """Polling interval for one business (see module docstring)."""
+    until_event = next_event - now if next_event else None
+    since_change = now - last_modified if last_modified else None
+
+    if (until_event is not None and until_event <= timedelta(days=7)) or (
+        since_change is not None and since_change <= timedelta(days=2)
+    ):
+        return timedelta(minutes=settings.POLL_HOT_MINUTES)
+    if priority == 1 or (until_event is not None and until_event <= timedelta(days=30)) or (
+        since_change is not None and since_change <= timedelta(days=14)
+    ):
+        return timedelta(minutes=settings.POLL_WARM_MINUTES)
+
+    settled = bool(status) and any(s in status.lower() for s in SETTLED_STATUSES)
+    if settled and next_event is None:
+        return timedelta(hours=settings.POLL_DORMANT_HOURS)
+    return timedelta(hours=settings.SYNC_INTERVAL_HOURS)
+
+
+class PollQueue:
+    """Min-heap of ``(due_at, business_number)``.
+
+    Rescheduling pushes a new entry; outdated entries are skipped lazily when
+    popped, so updates stay O(log n).
+    """
+
+    def __init__(self):
+        self._heap: list[tuple[datetime, str]] = []
+        self._due: dict[str, datetime] = {}
+        self.loaded_at: datetime | None = None
+
+    def __len__(self) -> int:
+        return len(self._due)
+
+    def __contains__(self, business_number: str) -> bool:
+        return business_number in self._due
+
+    def load(self, rows, now: datetime) -> None:
+        """Replace the queue with ``(business_number, next_poll_at)`` rows;
+        businesses never polled are due immediately."""
+        self._due = {nr: due_at or now for nr, due_at in rows}
+        self._heap = [(due_at, nr) for nr, due_at in self._due.items()]
+        heapq.heapify(self._heap)
+        self.loaded_at = now
+
+    def schedule(self, business_number: str, due_at: datetime) -> None:
+        self._due[business_number] = due_at
+        heapq.heappush(self._heap, (due_at, business_number))
+
+    def due_at(self, business_number: str) -> datetime | None:
+        return self._due.get(business_number)
+
+    def discard(self, business_number: str) -> None:
+        self._due.pop(business_number, None)
+
+    def pop_due(self, now: datetime, limit: int) -> list[str]:
+        """Remove and return up to ``limit`` businesses due at ``now``."""
+        out = []
+        while self._heap and len(out) < limit:
+            due_at, nr = self._heap[0]
+            if self._due.get(nr) != due_at:
+                heapq.heappop(self._heap)  # outdated entry
+                continue
+            if due_at > now:
+                break
+            heapq.heappop(self._heap)
+            del self._due[nr]
+            out.append(nr)
+        return out
+
+    def next_due(self) -> datetime | None:
+        return min(self._due.values(), default=None)
+
+
+poll_queue = PollQueue()
+
+
+def _reload_queue(db: Session, now: datetime) -> None:
+    rows = (
+        db.query(Business.business_number, Business.next_poll_at)
+        .filter(Business.trackers.any())
+        .all()
+    )
+    poll_queue.load(rows, now)
+    logger.info("Poll queue loaded: %d tracked businesses", len(poll_queue))
+
+
+def _pick_up_due(db: Session, now: datetime) -> None:
+    """Queue businesses made due in the database since the last load (newly
+    tracked businesses, or rescheduled by another worker)."""
+    rows = (
+        db.query(Business.business_number, Business.next_poll_at)
+        .filter(
+            Business.trackers.any(),
+            (Business.next_poll_at <= now) | Business.next_poll_at.is_(None),
+        )
+        .all()
+    )
+    for nr, due_at in rows:
+        due_at = due_at or now
+        queued = poll_queue.due_at(nr)
+        if queued is None or due_at < queued:
+            poll_queue.schedule(nr, due_at)
+
+
+def _next_poll_times(db: Session, numbers: list[str], now: datetime) -> dict[str, datetime]:
+    """Compute the next poll time of each business from the freshly synced
+    data with three grouped queries."""
+    businesses = (
+        db.query(Business.business_number, Business.status, Business.upstream_modified)
+        .filter(Business.business_number.in_(numbers))
+        .all()
+    )
+    next_events = dict(
+        db.query(BusinessEvent.business_number, func.min(BusinessEvent.event_date))
+        .filter(BusinessEvent.business_number.in_(numbers), BusinessEvent.event_date > now)
+        .group_by(BusinessEvent.business_number)
+        .all()
+    )
+    priorities = dict(
+        db.query(TrackedBusiness.business_number, func.min(TrackedBusiness.priority))
+        .filter(TrackedBusiness.business_number.in_(numbers))
+        .group_by(TrackedBusiness.business_number)
+        .all()
+    )
+    return {
+        row.business_number: now + poll_interval(
+            now, row.status, next_events.get(row.business_number),
+            priorities.get(row.business_number), row.upstream_modified,
+        )
+        for row in businesses
+    }
+
+
+async def _poll_batch(db: Session, due: list[str]) -> tuple[int, int, int]:
+    """Sync one batch of due businesses, reschedule them and commit.
+    Returns (refetched, alerts, hot)."""
+    businesses = (
+        db.query(Business)
+        .filter(Business.business_number.in_(due), Business.trackers.any())
+        .all()
+    )
+    _, stats = await sync_business_rows(db, businesses)
+
+    numbers = [biz.business_number for biz in businesses]
+    now = datetime.utcnow()
+    next_polls = _next_poll_times(db, numbers, now)
+    id_by_number = {biz.business_number: biz.id for biz in businesses}
+    if next_polls:
+        db.execute(update(Business), [
+            {"id": id_by_number[nr], "next_poll_at": due_at} for nr, due_at in next_polls.items()
+        ])
+    db.commit()
+
+    # Untracked meanwhile: simply not rescheduled
+    for nr, due_at in next_polls.items():
+        poll_queue.schedule(nr, due_at)
+
+    hot = sum(1 for d in next_polls.values() if d - now <= timedelta(minutes=settings.POLL_HOT_MINUTES))
+    return stats["processed"], stats["alerts"], hot
+
+
+async def poll_due_businesses():
+    """Sync all businesses whose next-poll time has passed, in batches of
+    POLL_BATCH_SIZE (runs every POLL_TICK_MINUTES)."""
+    db: Session = SessionLocal()
+    now = datetime.utcnow()
+    due: list[str] = []
+    try:
+        if poll_queue.loaded_at is None or now - poll_queue.loaded_at > QUEUE_RELOAD_INTERVAL:
+            _reload_queue(db, now)
+        else:
+            _pick_up_due(db, now)
+
+        oldest = poll_queue.next_due()
+        if oldest is not None and now - oldest > timedelta(minutes=settings.POLL_TICK_MINUTES):
+            logger.warning(
+                "Poll queue is behind: oldest due business waiting since %s (%d queued)",
+                oldest, len(poll_queue),
+            )
+
+        # Drain everything due at the start of the tick; rescheduled
+        # businesses are due later and wait for a following tick
+        batches = refetched = alerts = hot = 0
+        while True:
+            due = poll_queue.pop_due(now, settings.POLL_BATCH_SIZE)
+            if not due:
+                break
+            batch_refetched, batch_alerts, batch_hot = await _poll_batch(db, due)
+            batches += 1
+            refetched += batch_refetched
+            alerts += batch_alerts
+            hot += batch_hot
+        if not batches:
+            return
+
+        logger.info(
+            "Poll tick: %d batch(es), %d refetched, %d alerts in %.1fs; %d hot; "
+            "queue %d, next due %s",
+            batches, refetched, alerts, (datetime.utcnow() - now).total_seconds(), hot,
+            len(poll_queue), poll_queue.next_due(),
+        )
+    except Exception:
+        db.rollback()
+        sync_runs.mark_failed()
+        # Retry the failed batch on the next tick instead of losing it
+        retry_at = now + timedelta(minutes=settings.POLL_TICK_MINUTES)
+        for nr in due:
+            if nr not in poll_queue:
+                poll_queue.schedule(nr, retry_at)
+        logger.exception("Adaptive poll failed")
+    finally:
+        db.close()
@@ -0,0 +1,108 @@
+"""Persistent business schedule cache (pre-consultations + plenary sessions).
+
+The scheduler writes schedules for all tracked businesses; the schedule,
+treating-body and vote-prediction endpoints read them from the database and
+only revalidate stale entries in the background, so page loads do not wait
+on ws.parlament.ch.
+"""
+
+import logging
+from datetime import datetime, timedelta
+
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from ..config import settings
+from ..database import SessionLocal
+from ..models import BusinessSchedule
+from .parliament_api import fetch_business_schedule
+
+logger = logging.getLogger(__name__)
+
+# Business numbers with a refresh currently running in this process
+_refreshing: set[str] = set()
+
+
+# fetched_at of a schedule that could only be fetched partially: stale at once
+_NEVER_FETCHED = datetime(1970, 1, 1)
+
+
+def store_business_schedule(db: Session, schedule: dict) -> None:
+    """Upsert a schedule as returned by fetch_business_schedule (no commit).
+
+    Only the parts fetched successfully overwrite the stored ones, and
+    fetched_at is only bumped when every part was fetched, so a failed fetch
+    stays stale and is retried.
+    """
+    failed = set(schedule.get("failed") or ())
+    parts = [part for part in ("preconsultations", "sessions") if part not in failed]
+    if not parts:
+        return
+    stmt = insert(BusinessSchedule).values(
+        business_number=schedule["business_number"],
+        preconsultations=schedule.get("preconsultations") or [],
+        sessions=schedule.get("sessions") or [],
+        fetched_at=_NEVER_FETCHED if failed else datetime.utcnow(),
+    )
+    update = {part: stmt.excluded[part] for part in parts}
+    if not failed:
+        update["fetched_at"] = stmt.excluded.fetched_at
+    db.execute(stmt.on_conflict_do_update(index_elements=[BusinessSchedule.business_number], set_=update))
+
+
+def _as_dict(row: BusinessSchedule) -> dict:
+    return {
+        "business_number": row.business_number,
+        "preconsultations": row.preconsultations or [],
+        "sessions": row.sessions or [],
+    }
+
+
+def _is_stale(row: BusinessSchedule) -> bool:
+    age = datetime.utcnow() - row.fetched_at
+    return age > timedelta(hours=settings.SCHEDULE_CACHE_STALE_HOURS)
+
+
+async def refresh_business_schedule(business_number: str) -> dict | None:
+    """Fetch a schedule from the parliament API and persist it."""
+    if business_number in _refreshing:
+        return None
+    _refreshing.add(business_number)
+    db: Session = SessionLocal()
+    try:
+        schedule = await fetch_business_schedule(business_number)
+        store_business_schedule(db, schedule)
+        db.commit()
+        return schedule
+    except Exception:
+        db.rollback()
+        logger.exception("Schedule refresh failed for %s", business_number)
+        return None
+    finally:
+        db.close()
+        _refreshing.discard(business_number)
+
+
+async def get_business_schedule(db: Session, business_number: str, background_tasks=None) -> dict:
+    """Return the cached schedule for a business (stale-while-revalidate).
+
+    Fresh entries are served directly. Stale entries are served as-is and a
+    refresh is queued on ``background_tasks``. Only a business that has never
+    been cached is fetched inline.
+    """
+    row = (
+        db.query(BusinessSchedule)
+        .filter(BusinessSchedule.business_number == business_number)
+        .first()
+    )
+    if row is None:
+        schedule = await refresh_business_schedule(business_number) or {}
+        return {
+            "business_number": business_number,
+            "preconsultations": schedule.get("preconsultations") or [],
+            "sessions": schedule.get("sessions") or [],
+        }
+
+    if _is_stale(row) and background_tasks is not None and business_number not in _refreshing:
+        background_tasks.add_task(refresh_business_schedule, business_number)
+    return _as_dict(row)
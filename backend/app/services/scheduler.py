@@ -1,338 +1,404 @@
+import hashlib
 import logging
-from collections import defaultdict
+import time
 from datetime import datetime, timedelta
 
+from sqlalchemy import DateTime, cast, column, func, literal_column, update, values
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
+from ..config import settings
 from ..database import SessionLocal
-from ..models import Alert, BusinessEvent, MonitoringCandidate, TrackedBusiness, User
-from .email_service import send_alert_email
-from .parliament_api import fetch_business, fetch_new_businesses, fetch_preconsultations, fetch_session_schedule
+from ..models import Business, BusinessEvent, MonitoringCandidate, TrackedBusiness
+from . import cache_versions, sync_runs
+from .alert_writer import fan_out_alerts
+from .parliament_api import fetch_business_modified, fetch_business_schedule, iter_businesses, iter_new_business_pages
+from .schedule_cache import store_business_schedule
+from .watch_rules import apply_watch_rules, load_watch_rules
 
 logger = logging.getLogger(__name__)
 
-
-def _send_email_notifications(db: Session, new_alerts: list[Alert]) -> None:
-    """Send email notifications to users who have email alerts enabled.
-
-    Groups alerts by user and sends a single summary email per user.
-    """
-    if not new_alerts:
+# Rows per bulk INSERT of business events
+EVENT_INSERT_BATCH = 500
+
+
+async def _changed_business_numbers(businesses: list[Business]) -> set[str]:
+    """Return the tracked business numbers whose upstream ``Modified`` is newer
+    than the stored watermark (or that have never been synced). Businesses
+    whose lookup failed count as changed, so they are refetched."""
+    watermarks = {biz.business_number: biz.upstream_modified for biz in businesses}
+
+    modified, failed = await fetch_business_modified(list(watermarks.keys()), settings.SYNC_CONCURRENCY)
+    changed = {
+        nr for nr, mark in watermarks.items()
+        if nr in modified and (mark is None or modified[nr] > mark)
+    }
+    changed |= failed & watermarks.keys()
+    if failed:
+        logger.warning("Delta sync: Modified lookup failed for %d businesses, refetching them", len(failed))
+    logger.info(
+        "Delta sync: %d of %d tracked businesses changed upstream (%d not found)",
+        len(changed), len(watermarks), len(watermarks) - len(modified) - len(failed),
+    )
+    return changed
+
+
+# Fields copied from the fetched business into the shared Business row; an
+# empty upstream value keeps the stored one.
+_SYNCED_FIELDS = (
+    "title", "description", "status", "business_type", "author",
+    "author_faction", "submitted_text", "reasoning",
+    "federal_council_response", "federal_council_proposal", "first_council",
+)
+
+
+def _record_status_changes(
+    db: Session, business: Business, info: dict, alert_events: list[dict]
+) -> None:
+    """Add a status-change event and queue its alert fan-out when the
+    upstream status moved."""
+    nr = business.business_number
+    new_status = info.get("status", "")
+    old_status = business.status or ""
+    if not new_status or new_status == old_status:
         return
 
-    # Group alerts by user_id
-    alerts_by_user: dict[int, list[Alert]] = defaultdict(list)
-    for alert in new_alerts:
-        alerts_by_user[alert.user_id].append(alert)
-
-    # Get users with email alerts enabled
-    user_ids = list(alerts_by_user.keys())
-    users = (
-        db.query(User)
-        .filter(User.id.in_(user_ids), User.email_alerts_enabled == True)
-        .all()
+    db.add(BusinessEvent(
+        business_number=nr,
+        event_type="status_change",
+        event_date=datetime.utcnow(),
+        description=f"Status: {old_status} \u2192 {new_status}",
+    ))
+    alert_events.append({
+        "business_number": nr,
+        "alert_type": "status_change",
+        "message": f"Geschäft {nr}: Status geändert von '{old_status}' zu '{new_status}'",
+    })
+
+
+def _bulk_update_businesses(db: Session, fetched: dict[str, dict]) -> int:
+    """Apply a chunk of fetched businesses with one
+    ``UPDATE businesses ... FROM (VALUES ...)`` statement. Returns the row count."""
+    if not fetched:
+        return 0
+
+    table = Business.__table__
+    names = ("business_number", *_SYNCED_FIELDS, "upstream_modified")
+    rows = [
+        (nr, *(info.get(name) or None for name in _SYNCED_FIELDS), info.get("modified"))
+        for nr, info in fetched.items()
+    ]
+    v = values(*(column(name, table.c[name].type) for name in names), name="fetched").data(rows)
+
+    assignments = {name: func.coalesce(v.c[name], table.c[name]) for name in _SYNCED_FIELDS}
+    # Untyped NULLs in VALUES resolve to text, so cast the timestamp explicitly
+    assignments["upstream_modified"] = func.coalesce(
+        cast(v.c.upstream_modified, DateTime), table.c.upstream_modified
     )
+    assignments["last_api_sync"] = datetime.utcnow()
 
-    # Build title lookup for business numbers
-    all_biz_numbers = list({a.business_number for a in new_alerts})
-    title_map: dict[str, str] = {}
-    if all_biz_numbers:
-        rows = (
-            db.query(TrackedBusiness.business_number, TrackedBusiness.title)
-            .filter(TrackedBusiness.business_number.in_(all_biz_numbers))
-            .all()
-        )
-        for row in rows:
-            if row.title:
-                title_map[row.business_number] = row.title
-
-    for user in users:
-        # Filter alerts by user's configured alert types
-        enabled_types_str = user.email_alert_types or ""
-        enabled_types = {t.strip() for t in enabled_types_str.split(",") if t.strip()}
-        if not enabled_types:
-            continue
-
-        user_alerts = [
-            a for a in alerts_by_user[user.id]
-            if a.alert_type in enabled_types
-        ]
-        if not user_alerts:
-            continue
-
-        # Prepare alert dicts for the email template
-        alert_dicts = []
-        for a in user_alerts:
-            alert_dicts.append({
-                "business_number": a.business_number,
-                "business_title": title_map.get(a.business_number, ""),
-                "alert_type": a.alert_type,
-                "message": a.message,
-                "event_date": a.event_date,
-            })
+    stmt = (
+        update(table)
+        .where(table.c.business_number == v.c.business_number)
+        .values(**assignments)
+    )
+    return db.execute(stmt).rowcount
+
+
+async def sync_business_rows(db: Session, businesses: list[Business]) -> tuple[list, dict]:
+    """Refetch ``businesses`` from upstream and apply them to the session.
 
-        send_alert_email(user.email, user.name, alert_dicts)
+    Business chunks are fetched with bounded parallelism
+    (SYNC_CONCURRENCY); this coroutine is the single writer and applies each
+    chunk to the session as it arrives, so the DB session is never shared.
+    Returns the fanned-out alert rows and run statistics; the caller commits.
+    """
+    started = time.monotonic()
+    by_number = {biz.business_number: biz for biz in businesses}
+    numbers = set(by_number)
+
+    if settings.SYNC_DELTA_MODE and numbers:
+        numbers = await _changed_business_numbers(businesses)
+    delta_elapsed = time.monotonic() - started
+
+    alert_events: list[dict] = []
+    processed = 0
+    updated_rows = 0
+    chunks = 0
+    write_elapsed = 0.0
+    async for fetched in iter_businesses(list(numbers), settings.SYNC_CONCURRENCY):
+        chunks += 1
+        write_started = time.monotonic()
+        for nr, info in fetched.items():
+            _record_status_changes(db, by_number[nr], info, alert_events)
+        updated_rows += _bulk_update_businesses(db, fetched)
+        processed += len(fetched)
+        write_elapsed += time.monotonic() - write_started
+
+    if processed < len(numbers):
+        logger.warning("Could not fetch %d of %d businesses", len(numbers) - processed, len(numbers))
+    if updated_rows:
+        # Lets every worker rebuild its search index with the new texts
+        cache_versions.bump_version(db, cache_versions.BUSINESSES)
+
+    alerts_started = time.monotonic()
+    new_alerts = fan_out_alerts(db, alert_events)
+    alerts_elapsed = time.monotonic() - alerts_started
+    elapsed = time.monotonic() - started
+    sync_runs.add_phase("delta_check", delta_elapsed)
+    sync_runs.add_phase("fetch", elapsed - delta_elapsed - write_elapsed - alerts_elapsed)
+    sync_runs.add_phase("write", write_elapsed)
+    sync_runs.add_phase("alerts", alerts_elapsed)
+    sync_runs.count(fetched=processed, updated=updated_rows, inserted=len(new_alerts))
+    stats = {
+        "processed": processed,
+        "chunks": chunks,
+        "updated_rows": updated_rows,
+        "alerts": len(new_alerts),
+        "elapsed": elapsed,
+        "delta_elapsed": delta_elapsed,
+        "fetch_elapsed": elapsed - delta_elapsed - write_elapsed - alerts_elapsed,
+        "write_elapsed": write_elapsed,
+    }
+    return new_alerts, stats
 
 
 async def sync_tracked_businesses():
-    """Sync all tracked businesses with parlament.ch API (runs every 6 hours)."""
+    """Sync all tracked businesses with parlament.ch API (runs every 6 hours
+    unless adaptive polling is enabled)."""
     db: Session = SessionLocal()
-    new_alerts: list[Alert] = []
     try:
-        businesses = db.query(TrackedBusiness).all()
-        seen: set[str] = set()
-
-        for biz in businesses:
-            if biz.business_number in seen:
-                continue
-            seen.add(biz.business_number)
-
-            logger.info("Syncing %s", biz.business_number)
-            info = await fetch_business(biz.business_number)
-            if not info:
-                logger.warning("Could not fetch %s", biz.business_number)
-                continue
-
-            new_status = info.get("status", "")
-            old_status = biz.status or ""
-
-            # Check for status change
-            if new_status and new_status != old_status:
-                event = BusinessEvent(
-                    business_number=biz.business_number,
-                    event_type="status_change",
-                    event_date=datetime.utcnow(),
-                    description=f"Status: {old_status} \u2192 {new_status}",
-                )
-                db.add(event)
-
-                # Create alerts for all users tracking this business
-                trackers = (
-                    db.query(TrackedBusiness)
-                    .filter(TrackedBusiness.business_number == biz.business_number)
-                    .all()
-                )
-                for t in trackers:
-                    alert = Alert(
-                        user_id=t.user_id,
-                        business_number=biz.business_number,
-                        alert_type="status_change",
-                        message=f"Geschäft {biz.business_number}: Status geändert von '{old_status}' zu '{new_status}'",
-                    )
-                    db.add(alert)
-                    new_alerts.append(alert)
-
-            # Update all tracked instances
-            all_instances = (
-                db.query(TrackedBusiness)
-                .filter(TrackedBusiness.business_number == biz.business_number)
-                .all()
-            )
-            for inst in all_instances:
-                inst.title = info.get("title") or inst.title
-                inst.description = info.get("description") or inst.description
-                inst.status = new_status or inst.status
-                inst.business_type = info.get("business_type") or inst.business_type
-                inst.author = info.get("author") or inst.author
-                inst.author_faction = info.get("author_faction") or inst.author_faction
-                inst.submitted_text = info.get("submitted_text") or inst.submitted_text
-                inst.reasoning = info.get("reasoning") or inst.reasoning
-                inst.federal_council_response = info.get("federal_council_response") or inst.federal_council_response
-                inst.federal_council_proposal = info.get("federal_council_proposal") or inst.federal_council_proposal
-                inst.first_council = info.get("first_council") or inst.first_council
-                inst.last_api_sync = datetime.utcnow()
-
+        # One row per tracked number, however many users track it; the
+        # previous status of every business comes from here
+        businesses = db.query(Business).filter(Business.trackers.any()).all()
+        _, stats = await sync_business_rows(db, businesses)
         db.commit()
-        logger.info("Sync complete: %d businesses processed", len(seen))
-
-        # Send email notifications for new alerts
-        _send_email_notifications(db, new_alerts)
+        logger.info(
+            "Sync complete: %d businesses processed in %d chunk(s), %.1fs total "
+            "(delta check %.1fs, fetch %.1fs, write %.1fs), %.1f businesses/s, "
+            "%d business rows updated, %d alerts",
+            stats["processed"], stats["chunks"], stats["elapsed"], stats["delta_elapsed"],
+            stats["fetch_elapsed"], stats["write_elapsed"],
+            stats["processed"] / stats["elapsed"] if stats["elapsed"] > 0 else 0.0,
+            stats["updated_rows"], stats["alerts"],
+        )
     except Exception:
         db.rollback()
+        sync_runs.mark_failed()
         logger.exception("Sync failed")
     finally:
         db.close()
 
 
+def _upsert_monitoring_candidates(db: Session, page: list[dict]) -> tuple[set[str], int]:
+    """Insert new candidates of one page and refresh title/type of pending
+    ones in a single statement. Returns (inserted numbers, updated count)."""
+    # A single INSERT ... ON CONFLICT may not touch the same key twice
+    rows = list({
+        biz["business_number"]: {
+            "business_number": biz["business_number"],
+            "title": biz.get("title"),
+            "description": biz.get("description"),
+            "business_type": biz.get("business_type"),
+            "submission_date": biz.get("submission_date"),
+        }
+        for biz in page
+    }.values())
+    if not rows:
+        return set(), 0
+
+    stmt = pg_insert(MonitoringCandidate).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[MonitoringCandidate.business_number],
+        set_={"title": stmt.excluded.title, "business_type": stmt.excluded.business_type},
+        # Decided candidates stay as they were; unchanged rows are not rewritten
+        where=(MonitoringCandidate.decision == "pending") & (
+            MonitoringCandidate.title.is_distinct_from(stmt.excluded.title)
+            | MonitoringCandidate.business_type.is_distinct_from(stmt.excluded.business_type)
+        ),
+    ).returning(
+        MonitoringCandidate.business_number,
+        literal_column("xmax = 0").label("inserted"),
+    )
+    result = db.execute(stmt).all()
+    inserted = {row.business_number for row in result if row.inserted}
+    return inserted, len(result) - len(inserted)
+
+
 async def fetch_monitoring_candidates():
-    """Fetch new businesses for monitoring (runs daily at 07:00)."""
+    """Fetch new businesses for monitoring (runs daily at 07:00).
+
+    Pages through everything submitted in the last 90 days and upserts each
+    page as it arrives; new candidates are matched against the watch rules.
+    """
     db: Session = SessionLocal()
     try:
         since = (datetime.utcnow() - timedelta(days=90)).strftime("%Y-%m-%d")
-        new_businesses = await fetch_new_businesses(since)
-        added = 0
-
-        for biz in new_businesses:
-            nr = biz.get("business_number", "")
-            if not nr:
-                continue
-
-            exists = (
-                db.query(MonitoringCandidate)
-                .filter(MonitoringCandidate.business_number == nr)
-                .first()
-            )
-            if exists:
-                continue
-
-            candidate = MonitoringCandidate(
-                business_number=nr,
-                title=biz.get("title"),
-                description=biz.get("description"),
-                business_type=biz.get("business_type"),
-                submission_date=biz.get("submission_date"),
-            )
-            db.add(candidate)
-            added += 1
-
-        db.commit()
-        logger.info("Monitoring: %d new candidates added", added)
+        # The very first run imports the whole window: no watch alerts for that
+        initial = db.query(MonitoringCandidate.id).first() is None
+        rules = load_watch_rules(db)
+        fetched = added = updated = watch_alerts = 0
+        # "fetch" is the time spent waiting for the next page
+        fetch_started = time.monotonic()
+        async for page in iter_new_business_pages(since):
+            sync_runs.add_phase("fetch", time.monotonic() - fetch_started)
+            with sync_runs.phase("upsert"):
+                inserted, refreshed = _upsert_monitoring_candidates(db, page)
+            if inserted and not initial:
+                with sync_runs.phase("watch_rules"):
+                    new_rows = [biz for biz in page if biz["business_number"] in inserted]
+                    alerts, _ = apply_watch_rules(db, rules, new_rows, accept_candidates=True)
+                watch_alerts += alerts
+            db.commit()
+            fetched += len(page)
+            added += len(inserted)
+            updated += refreshed
+            sync_runs.count(fetched=len(page), inserted=len(inserted), updated=refreshed)
+            fetch_started = time.monotonic()
+        sync_runs.add_phase("fetch", time.monotonic() - fetch_started)
+
+        logger.info(
+            "Monitoring: %d businesses fetched, %d new candidates added, %d pending candidates "
+            "refreshed, %d watch rule alerts (%d rules)",
+            fetched, added, updated, watch_alerts, len(rules),
+        )
     except Exception:
         db.rollback()
+        sync_runs.mark_failed()
         logger.exception("Monitoring fetch failed")
     finally:
         db.close()
 
 
+def event_dedup_key(business_number: str, event_type: str, committee_name: str | None, description: str | None) -> str:
+    """Content hash backing the unique index on business_events.dedup_key.
+
+    Must match the SQL backfill in main.lifespan / migration 010:
+    md5(concat_ws('|', business_number, event_type, committee_name, description)).
+    """
+    raw = "|".join([business_number, event_type, committee_name or "", description or ""])
+    return hashlib.md5(raw.encode("utf-8")).hexdigest()
+
+
+def _parse_event_date(value: str | None) -> datetime | None:
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def _schedule_events(schedule: dict) -> list[dict]:
+    """Turn a fetched schedule into business_events rows (with dedup key)."""
+    nr = schedule["business_number"]
+    rows = []
+
+    for precon in schedule["preconsultations"]:
+        committee = precon.get("committee_name", "")
+        description = f"Vorberatung: {committee}"
+        if precon.get("committee_abbrev"):
+            description += f" ({precon['committee_abbrev']})"
+        if precon.get("treatment_category"):
+            description += f" \u2013 Kategorie: {precon['treatment_category']}"
+        rows.append({
+            "business_number": nr,
+            "event_type": "committee_scheduled",
+            "event_date": _parse_event_date(precon.get("date")),
+            "description": description,
+            "committee_name": committee,
+        })
+
+    # Plenary session schedule
+    for sess in schedule["sessions"]:
+        council = sess.get("council", "")
+        session_name = sess.get("session_name", "")
+        description = f"Traktandiert: {council}"
+        if session_name:
+            description += f", {session_name}"
+        if sess.get("meeting_order"):
+            description += f" \u2013 {sess['meeting_order']}"
+        rows.append({
+            "business_number": nr,
+            "event_type": "debate_scheduled",
+            "event_date": _parse_event_date(sess.get("meeting_date")),
+            "description": description,
+            "committee_name": council,
+        })
+
+    for row in rows:
+        row["dedup_key"] = event_dedup_key(
+            nr, row["event_type"], row["committee_name"], row["description"]
+        )
+        row["created_at"] = datetime.utcnow()
+    return rows
+
+
+def _insert_new_events(db: Session, rows: list[dict]) -> list:
+    """Bulk-insert events, skipping ones already stored. Returns the rows that
+    were actually inserted, so concurrent runs never alert twice."""
+    # Identical keys within one statement would only be skipped anyway
+    unique_rows = list({row["dedup_key"]: row for row in rows}.values())
+    inserted = []
+    for start in range(0, len(unique_rows), EVENT_INSERT_BATCH):
+        stmt = (
+            pg_insert(BusinessEvent)
+            .values(unique_rows[start:start + EVENT_INSERT_BATCH])
+            .on_conflict_do_nothing(index_elements=[BusinessEvent.dedup_key])
+            .returning(
+                BusinessEvent.business_number,
+                BusinessEvent.event_type,
+                BusinessEvent.event_date,
+                BusinessEvent.description,
+            )
+        )
+        inserted.extend(db.execute(stmt).all())
+    return inserted
+
+
 async def sync_committee_schedules():
     """Check for new committee/session scheduling of tracked businesses (runs every 6 hours)."""
     db: Session = SessionLocal()
-    new_alerts: list[Alert] = []
     try:
-        businesses = db.query(TrackedBusiness).all()
-        seen: set[str] = set()
-        new_events = 0
-
-        for biz in businesses:
-            if biz.business_number in seen:
-                continue
-            seen.add(biz.business_number)
-
-            # Fetch committee pre-consultations
-            preconsultations = await fetch_preconsultations(biz.business_number)
-            for precon in preconsultations:
-                committee = precon.get("committee_name", "")
-                precon_date = precon.get("date")
-                # Build a dedup key from business_number + committee + date
-                description = f"Vorberatung: {committee}"
-                if precon.get("committee_abbrev"):
-                    description += f" ({precon['committee_abbrev']})"
-                if precon.get("treatment_category"):
-                    description += f" \u2013 Kategorie: {precon['treatment_category']}"
-
-                existing = (
-                    db.query(BusinessEvent)
-                    .filter(
-                        BusinessEvent.business_number == biz.business_number,
-                        BusinessEvent.event_type == "committee_scheduled",
-                        BusinessEvent.committee_name == committee,
-                        BusinessEvent.description == description,
-                    )
-                    .first()
-                )
-                if existing:
-                    continue
-
-                event_date = None
-                if precon_date:
-                    try:
-                        event_date = datetime.fromisoformat(precon_date)
-                    except (ValueError, TypeError):
-                        pass
-
-                event = BusinessEvent(
-                    business_number=biz.business_number,
-                    event_type="committee_scheduled",
-                    event_date=event_date,
-                    description=description,
-                    committee_name=committee,
-                )
-                db.add(event)
-                new_events += 1
-
-                # Alert all users tracking this business
-                trackers = (
-                    db.query(TrackedBusiness)
-                    .filter(TrackedBusiness.business_number == biz.business_number)
-                    .all()
-                )
-                for t in trackers:
-                    date_str = event_date.strftime("%d.%m.%Y") if event_date else "unbekannt"
-                    alert = Alert(
-                        user_id=t.user_id,
-                        business_number=biz.business_number,
-                        alert_type="committee_scheduled",
-                        event_date=event_date,
-                        message=f"Geschäft {biz.business_number}: {description} (Datum: {date_str})",
-                    )
-                    db.add(alert)
-                    new_alerts.append(alert)
-
-            # Fetch plenary session schedule
-            sessions = await fetch_session_schedule(biz.business_number)
-            for sess in sessions:
-                council = sess.get("council", "")
-                session_name = sess.get("session_name", "")
-                meeting_date = sess.get("meeting_date")
-                description = f"Traktandiert: {council}"
-                if session_name:
-                    description += f", {session_name}"
-                if sess.get("meeting_order"):
-                    description += f" \u2013 {sess['meeting_order']}"
-
-                existing = (
-                    db.query(BusinessEvent)
-                    .filter(
-                        BusinessEvent.business_number == biz.business_number,
-                        BusinessEvent.event_type == "debate_scheduled",
-                        BusinessEvent.description == description,
-                    )
-                    .first()
-                )
-                if existing:
-                    continue
-
-                event_date = None
-                if meeting_date:
-                    try:
-                        event_date = datetime.fromisoformat(meeting_date)
-                    except (ValueError, TypeError):
-                        pass
-
-                event = BusinessEvent(
-                    business_number=biz.business_number,
-                    event_type="debate_scheduled",
-                    event_date=event_date,
-                    description=description,
-                    committee_name=council,
-                )
-                db.add(event)
-                new_events += 1
-
-                trackers = (
-                    db.query(TrackedBusiness)
-                    .filter(TrackedBusiness.business_number == biz.business_number)
-                    .all()
-                )
-                for t in trackers:
-                    date_str = event_date.strftime("%d.%m.%Y") if event_date else "unbekannt"
-                    alert = Alert(
-                        user_id=t.user_id,
-                        business_number=biz.business_number,
-                        alert_type="debate_scheduled",
-                        event_date=event_date,
-                        message=f"Geschäft {biz.business_number}: {description} (Datum: {date_str})",
-                    )
-                    db.add(alert)
-                    new_alerts.append(alert)
+        numbers = [
+            row.business_number
+            for row in db.query(TrackedBusiness.business_number).distinct().all()
+        ]
 
-        db.commit()
-        logger.info("Committee schedule sync: %d new events for %d businesses", new_events, len(seen))
+        event_rows: list[dict] = []
+        for nr in numbers:
+            # Fetch committee pre-consultations + plenary sessions and persist
+            # them for the schedule / treating-body / prediction endpoints
+            with sync_runs.phase("fetch"):
+                schedule = await fetch_business_schedule(nr)
+            store_business_schedule(db, schedule)
+            event_rows.extend(_schedule_events(schedule))
+        sync_runs.count(fetched=len(numbers))
+
+        with sync_runs.phase("events"):
+            inserted = _insert_new_events(db, event_rows)
+        sync_runs.count(inserted=len(inserted))
+
+        # Alert all users tracking a business, for newly inserted events only
+        alert_events = []
+        for event in inserted:
+            date_str = event.event_date.strftime("%d.%m.%Y") if event.event_date else "unbekannt"
+            alert_events.append({
+                "business_number": event.business_number,
+                "alert_type": event.event_type,
+                "event_date": event.event_date,
+                "message": f"Geschäft {event.business_number}: {event.description} (Datum: {date_str})",
+            })
+        fan_out_alerts(db, alert_events)
 
-        # Send email notifications for new alerts
-        _send_email_notifications(db, new_alerts)
+        db.commit()
+        logger.info(
+            "Committee schedule sync: %d new events for %d businesses",
+            len(inserted), len(numbers),
+        )
     except Exception:
         db.rollback()
+        sync_runs.mark_failed()
         logger.exception("Committee schedule sync failed")
     finally:
         db.close()
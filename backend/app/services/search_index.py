@@ -0,0 +1,236 @@
+"""In-process full-text and fuzzy search over locally known businesses.
+
+Indexes the business cache (number + title) together with the richer texts
+of tracked businesses, so /api/parliament/search can answer from memory and
+only falls back to ws.parlament.ch when nothing matches locally.
+The index remembers the versions of both data sets (see cache_versions.py)
+and every worker rebuilds it on the next search once one of them changed.
+"""
+
+import bisect
+import logging
+import math
+import re
+import threading
+from collections import defaultdict
+
+from ..database import SessionLocal
+from ..models import Business, CachedBusiness
+from . import cache_versions
+
+logger = logging.getLogger(__name__)
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+_NUMBER_QUERY_RE = re.compile(r"^\d{2}\.?\d*$")
+_FOLD = str.maketrans({"ä": "ae", "ö": "oe", "ü": "ue", "ß": "ss", "é": "e", "è": "e", "à": "a"})
+
+_STOPWORDS = {
+    "der", "die", "das", "den", "dem", "des", "ein", "eine", "einer", "eines",
+    "und", "oder", "im", "in", "am", "an", "auf", "aus", "bei", "mit", "von",
+    "vom", "zu", "zum", "zur", "fuer", "ueber", "als", "auch", "ist", "sind",
+    "nicht", "wie", "sich", "es",
+}
+
+TITLE_WEIGHT = 2.0
+BODY_WEIGHT = 1.0
+PREFIX_FACTOR = 0.8
+FUZZY_FACTOR = 0.6
+FUZZY_MIN_SIMILARITY = 0.5
+MIN_PREFIX_LENGTH = 3
+
+# Data sets the index is built from
+INDEXED_DATA = (cache_versions.CACHED_BUSINESSES, cache_versions.BUSINESSES)
+
+
+def tokenize(text: str | None) -> list[str]:
+    """Lowercase, fold German umlauts and drop stopwords/1-char tokens."""
+    if not text:
+        return []
+    tokens = _TOKEN_RE.findall(text.lower().translate(_FOLD))
+    return [t for t in tokens if len(t) > 1 and t not in _STOPWORDS]
+
+
+def _trigrams(token: str) -> set[str]:
+    padded = f"  {token} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class BusinessSearchIndex:
+    """Inverted index with prefix and trigram (typo-tolerant) term expansion."""
+
+    def __init__(self, versions: tuple = ()):
+        # versions of INDEXED_DATA the index was built from
+        self.versions = versions
+        # result dicts in the shape of ParliamentPreview
+        self.docs: list[dict] = []
+        # token -> {doc index: field weight}
+        self.postings: dict[str, dict[int, float]] = {}
+        # sorted vocabulary for prefix lookups
+        self.vocabulary: list[str] = []
+        # trigram -> tokens, for fuzzy lookups
+        self.trigram_index: dict[str, set[str]] = {}
+        # sorted (business_number, doc index) for number-prefix lookups
+        self.numbers: list[tuple[str, int]] = []
+
+    def add(self, doc: dict, body: str = "") -> None:
+        idx = len(self.docs)
+        self.docs.append(doc)
+        for token in tokenize(doc["title"]):
+            self.postings.setdefault(token, {})[idx] = TITLE_WEIGHT
+        for token in tokenize(body):
+            self.postings.setdefault(token, {}).setdefault(idx, BODY_WEIGHT)
+
+    def finalize(self) -> "BusinessSearchIndex":
+        self.vocabulary = sorted(self.postings)
+        trigram_index: dict[str, set[str]] = defaultdict(set)
+        for token in self.vocabulary:
+            for gram in _trigrams(token):
+                trigram_index[gram].add(token)
+        self.trigram_index = dict(trigram_index)
+        self.numbers = sorted((d["business_number"], i) for i, d in enumerate(self.docs))
+        return self
+
+    # --- lookups ---
+
+    def _idf(self, token: str) -> float:
+        return math.log(1 + len(self.docs) / (1 + len(self.postings.get(token, ()))))
+
+    def _prefix_tokens(self, prefix: str) -> list[str]:
+        start = bisect.bisect_left(self.vocabulary, prefix)
+        out = []
+        for token in self.vocabulary[start:]:
+            if not token.startswith(prefix):
+                break
+            if token != prefix:
+                out.append(token)
+        return out
+
+    def _fuzzy_tokens(self, token: str) -> list[tuple[str, float]]:
+        grams = _trigrams(token)
+        overlap: dict[str, int] = defaultdict(int)
+        for gram in grams:
+            for candidate in self.trigram_index.get(gram, ()):
+                overlap[candidate] += 1
+        out = []
+        for candidate, shared in overlap.items():
+            similarity = shared / (len(grams) + len(_trigrams(candidate)) - shared)
+            if similarity >= FUZZY_MIN_SIMILARITY:
+                out.append((candidate, similarity))
+        return out
+
+    def _expand(self, token: str) -> list[tuple[str, float]]:
+        """Exact match, then prefix completions, then fuzzy (typo) matches."""
+        expansions = []
+        if token in self.postings:
+            expansions.append((token, 1.0))
+        if len(token) >= MIN_PREFIX_LENGTH:
+            expansions.extend((t, PREFIX_FACTOR) for t in self._prefix_tokens(token))
+        if not expansions and len(token) >= MIN_PREFIX_LENGTH:
+            expansions.extend((t, sim * FUZZY_FACTOR) for t, sim in self._fuzzy_tokens(token))
+        return expansions
+
+    def _search_number(self, query: str, limit: int) -> list[dict]:
+        start = bisect.bisect_left(self.numbers, (query,))
+        out = []
+        for number, idx in self.numbers[start:]:
+            if not number.startswith(query) or len(out) >= limit:
+                break
+            out.append(self.docs[idx])
+        return out
+
+    def search(self, query: str, limit: int = 20) -> list[dict]:
+        query = query.strip()
+        if _NUMBER_QUERY_RE.match(query):
+            hits = self._search_number(query, limit)
+            if hits:
+                return hits
+
+        terms = tokenize(query)
+        if not terms:
+            return []
+
+        scores: dict[int, float] = defaultdict(float)
+        matched_terms: dict[int, int] = defaultdict(int)
+        for term in terms:
+            best: dict[int, float] = {}
+            for token, factor in self._expand(term):
+                idf = self._idf(token)
+                for idx, weight in self.postings[token].items():
+                    score = factor * weight * idf
+                    if score > best.get(idx, 0.0):
+                        best[idx] = score
+            for idx, score in best.items():
+                scores[idx] += score
+                matched_terms[idx] += 1
+
+        # Documents matching more query terms always rank first
+        ranked = sorted(
+            scores,
+            key=lambda i: (matched_terms[i], scores[i], self.docs[i]["business_number"]),
+            reverse=True,
+        )
+        return [self.docs[i] for i in ranked[:limit]]
+
+
+_index: BusinessSearchIndex | None = None
+_build_lock = threading.Lock()
+
+
+def _data_versions() -> tuple:
+    return tuple(cache_versions.read_version(name) for name in INDEXED_DATA)
+
+
+def _build(versions: tuple) -> BusinessSearchIndex:
+    """Build the index from cached and tracked businesses (under _build_lock)."""
+    global _index
+    db = SessionLocal()
+    try:
+        tracked = {biz.business_number: biz for biz in db.query(Business).all()}
+        cached = db.query(CachedBusiness.business_number, CachedBusiness.title).all()
+    finally:
+        db.close()
+
+    index = BusinessSearchIndex(versions)
+    for nr, biz in tracked.items():
+        body = " ".join(filter(None, [
+            biz.description, biz.author, biz.submitted_text, biz.reasoning,
+        ]))
+        index.add({
+            "business_number": nr,
+            "title": biz.title or "",
+            "description": biz.description,
+            "business_type": biz.business_type,
+            "status": biz.status,
+            "submission_date": biz.submission_date.isoformat() if biz.submission_date else None,
+        }, body)
+    for row in cached:
+        if row.business_number not in tracked:
+            index.add({"business_number": row.business_number, "title": row.title or ""})
+
+    _index = index.finalize()
+    logger.info("Search index rebuilt: %d businesses, %d terms", len(_index.docs), len(_index.vocabulary))
+    return _index
+
+
+def rebuild_search_index() -> int:
+    """Rebuild the index from cached and tracked businesses. Returns doc count."""
+    with _build_lock:
+        return len(_build(_data_versions()).docs)
+
+
+def _current_index() -> BusinessSearchIndex:
+    """The index, rebuilt first if it is missing or its data changed."""
+    versions = _data_versions()
+    index = _index
+    if index is not None and index.versions == versions:
+        return index
+    with _build_lock:
+        # Another request may have rebuilt it while we waited
+        if _index is not None and _index.versions == versions:
+            return _index
+        return _build(versions)
+
+
+def search_local(query: str, limit: int = 20) -> list[dict]:
+    """Search the local index; (re)builds it when its data changed."""
+    return _current_index().search(query, limit)
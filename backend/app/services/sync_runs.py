@@ -0,0 +1,159 @@
+"""Persistent history of sync job runs.
+
+job_lock.run_exclusive wraps every scheduled and manual job in
+``record_run``, which stores a ``sync_runs`` row when the run starts and
+completes it with status, row counts, upstream call counts and per-phase
+durations when it ends. Jobs report into the active run through the
+module-level helpers (``count``, ``phase``, ``mark_failed``); upstream
+calls are counted per HTTP request by the HTTP client and by the
+swissparlpy wrapper of the upstream executor. All helpers
+are no-ops outside a recorded run. ``prune_sync_runs`` deletes history
+older than SYNC_RUN_RETENTION_DAYS once a day.
+"""
+
+import logging
+import sys
+import threading
+import time
+import traceback
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timedelta
+
+from ..config import settings
+from ..database import SessionLocal
+from ..models import SyncRun
+
+logger = logging.getLogger(__name__)
+
+
+class RunRecorder:
+    """Counters and timings of one job run."""
+
+    def __init__(self, job: str, trigger: str):
+        self.job = job
+        self.trigger = trigger
+        self.started_at = datetime.utcnow()
+        self.started = time.monotonic()
+        self.rows_fetched = 0
+        self.rows_inserted = 0
+        self.rows_updated = 0
+        self.upstream_calls = 0
+        self.phases: dict[str, float] = {}
+        self.error: str | None = None
+
+
+_current_run: ContextVar[RunRecorder | None] = ContextVar("sync_run", default=None)
+# Upstream calls are also counted from upstream executor threads
+_upstream_lock = threading.Lock()
+
+
+def count(fetched: int = 0, inserted: int = 0, updated: int = 0) -> None:
+    """Add row counts to the active run."""
+    run = _current_run.get()
+    if run is not None:
+        run.rows_fetched += fetched
+        run.rows_inserted += inserted
+        run.rows_updated += updated
+
+
+def count_upstream_call() -> None:
+    run = _current_run.get()
+    if run is not None:
+        with _upstream_lock:
+            run.upstream_calls += 1
+
+
+def add_phase(name: str, seconds: float) -> None:
+    run = _current_run.get()
+    if run is not None:
+        run.phases[name] = run.phases.get(name, 0.0) + seconds
+
+
+@contextmanager
+def phase(name: str):
+    """Time a block as phase ``name`` of the active run (accumulates)."""
+    started = time.monotonic()
+    try:
+        yield
+    finally:
+        add_phase(name, time.monotonic() - started)
+
+
+def mark_failed() -> None:
+    """Mark the active run as failed with the exception being handled.
+
+    Jobs log and swallow their exceptions, so they call this from their
+    ``except`` block.
+    """
+    run = _current_run.get()
+    if run is not None:
+        run.error = "".join(traceback.format_exception_only(*sys.exc_info()[:2])).strip() or "failed"
+
+
+def _start(run: RunRecorder) -> int | None:
+    db = SessionLocal()
+    try:
+        row = SyncRun(job=run.job, trigger=run.trigger, status="running", started_at=run.started_at)
+        db.add(row)
+        db.commit()
+        return row.id
+    except Exception:
+        db.rollback()
+        logger.exception("Could not record start of %s run", run.job)
+        return None
+    finally:
+        db.close()
+
+
+def _finish(run_id: int | None, run: RunRecorder) -> None:
+    if run_id is None:
+        return
+    db = SessionLocal()
+    try:
+        row = db.get(SyncRun, run_id)
+        row.status = "failed" if run.error else "success"
+        row.finished_at = datetime.utcnow()
+        row.duration_seconds = round(time.monotonic() - run.started, 3)
+        row.rows_fetched = run.rows_fetched
+        row.rows_inserted = run.rows_inserted
+        row.rows_updated = run.rows_updated
+        row.upstream_calls = run.upstream_calls
+        row.phases = {name: round(seconds, 3) for name, seconds in run.phases.items()}
+        row.error = run.error
+        db.commit()
+    except Exception:
+        db.rollback()
+        logger.exception("Could not record end of %s run", run.job)
+    finally:
+        db.close()
+
+
+async def record_run(job: str, trigger: str, fn) -> None:
+    """Run ``fn()`` as a recorded run of ``job``."""
+    run = RunRecorder(job, trigger)
+    run_id = _start(run)
+    token = _current_run.set(run)
+    try:
+        await fn()
+    except BaseException:
+        mark_failed()
+        raise
+    finally:
+        _current_run.reset(token)
+        _finish(run_id, run)
+
+
+async def prune_sync_runs():
+    """Delete sync_runs rows older than SYNC_RUN_RETENTION_DAYS (runs daily)."""
+    db = SessionLocal()
+    try:
+        cutoff = datetime.utcnow() - timedelta(days=settings.SYNC_RUN_RETENTION_DAYS)
+        deleted = db.query(SyncRun).filter(SyncRun.started_at < cutoff).delete(synchronize_session=False)
+        db.commit()
+        logger.info("Pruned %d sync runs older than %s", deleted, cutoff)
+    except Exception:
+        db.rollback()
+        logger.exception("Pruning sync runs failed")
+    finally:
+        db.close()
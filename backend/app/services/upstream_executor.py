@@ -0,0 +1,131 @@
+"""Dedicated thread pool for blocking calls to ws.parlament.ch (swissparlpy).
+
+Blocking OData downloads used to run on the default executor, which FastAPI
+also uses for sync endpoints, so a heavy sync could starve request handling.
+Upstream-bound work now runs on its own sized pool, and each job is capped
+to a number of concurrent calls so one sync cannot occupy every worker.
+
+Jobs run in a copy of the caller's context, so ``get_data`` can count every
+HTTP request swissparlpy makes (metadata and result pages) for the active
+sync run.
+"""
+
+import asyncio
+import contextvars
+import functools
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+import swissparlpy as spp
+
+from ..config import settings
+from .sync_runs import count_upstream_call
+
+logger = logging.getLogger(__name__)
+
+_executor: ThreadPoolExecutor | None = None
+_job_semaphores: dict[str, asyncio.Semaphore] = {}
+_stats_lock = threading.Lock()
+_stats: dict[str, dict] = {}
+
+
+def _job_limit(job: str) -> int:
+    return settings.UPSTREAM_JOB_LIMITS.get(job, settings.UPSTREAM_JOB_CONCURRENCY)
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=settings.UPSTREAM_EXECUTOR_WORKERS,
+            thread_name_prefix="upstream",
+        )
+    return _executor
+
+
+def _job_stats(job: str) -> dict:
+    stats = _stats.get(job)
+    if stats is None:
+        stats = _stats[job] = {
+            "waiting": 0,  # blocked on the per-job cap
+            "queued": 0,   # submitted to the pool, no worker yet
+            "running": 0,
+            "completed": 0,
+            "failed": 0,
+            "queue_wait_seconds": 0.0,
+            "run_seconds": 0.0,
+        }
+    return stats
+
+
+def _adjust(job: str, **deltas) -> None:
+    with _stats_lock:
+        stats = _job_stats(job)
+        for key, delta in deltas.items():
+            stats[key] += delta
+
+
+def _run_tracked(job: str, submitted_at: float, fn):
+    started = time.monotonic()
+    _adjust(job, queued=-1, running=1, queue_wait_seconds=started - submitted_at)
+    try:
+        result = fn()
+    except BaseException:
+        _adjust(job, running=-1, failed=1, run_seconds=time.monotonic() - started)
+        raise
+    _adjust(job, running=-1, completed=1, run_seconds=time.monotonic() - started)
+    return result
+
+
+async def run_upstream(job: str, fn, *args, **kwargs):
+    """Run a blocking upstream call on the dedicated pool under ``job``'s cap."""
+    semaphore = _job_semaphores.get(job)
+    if semaphore is None:
+        semaphore = _job_semaphores[job] = asyncio.Semaphore(_job_limit(job))
+
+    _adjust(job, waiting=1)
+    async with semaphore:
+        _adjust(job, waiting=-1, queued=1)
+        loop = asyncio.get_running_loop()
+        call = functools.partial(contextvars.copy_context().run, fn, *args, **kwargs)
+        return await loop.run_in_executor(
+            _get_executor(),
+            functools.partial(_run_tracked, job, time.monotonic(), call),
+        )
+
+
+def get_data(table: str, filter=None, **kwargs):
+    """``swissparlpy.get_data`` that counts each HTTP request as an upstream
+    call of the active sync run (call it inside ``run_upstream`` jobs)."""
+    session = requests.Session()
+    session.hooks["response"].append(lambda response, *args, **kwargs: count_upstream_call())
+    return spp.SwissParlClient(session=session).get_data(table, filter, **kwargs)
+
+
+def executor_stats() -> dict:
+    """Snapshot of pool size and per-job queue depth / timings."""
+    with _stats_lock:
+        jobs = {
+            job: {
+                **{k: round(v, 3) if isinstance(v, float) else v for k, v in stats.items()},
+                "limit": _job_limit(job),
+            }
+            for job, stats in _stats.items()
+        }
+    return {
+        "workers": settings.UPSTREAM_EXECUTOR_WORKERS,
+        "waiting": sum(j["waiting"] for j in jobs.values()),
+        "queued": sum(j["queued"] for j in jobs.values()),
+        "running": sum(j["running"] for j in jobs.values()),
+        "jobs": jobs,
+    }
+
+
+def shutdown_upstream_executor() -> None:
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
@@ -1,7 +1,8 @@
 """Sync service for voting data (Vote + individual Voting records).
 
-Fetches data from ws.parlament.ch via swissparlpy session-wise.
-Runs weekly via scheduler.
+Fetches sessions and votes via swissparlpy session-wise; individual Voting
+records are fetched concurrently through the async OData client and bulk
+inserted. Runs weekly via scheduler.
 """
 
 import asyncio
@@ -9,11 +10,16 @@ import logging
 import time
 from datetime import datetime
 
-import swissparlpy as spp
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
+from ..config import settings
 from ..database import SessionLocal
 from ..models import Vote, Voting
+from . import sync_runs
+from .adaptive_limiter import AIMDLimiter
+from .odata_client import ODataError, ODataThrottled, iter_pages
+from .upstream_executor import get_data, run_upstream
 
 logger = logging.getLogger(__name__)
 
@@ -21,11 +27,14 @@ logger = logging.getLogger(__name__)
 # These are fetched dynamically, but we start from session 5100 onwards
 MIN_SESSION_ID = 5100
 
+# Rows per bulk INSERT of voting records
+VOTING_INSERT_BATCH = 1000
+
 
 def _fetch_sessions_sync() -> list[dict]:
     """Fetch all available sessions."""
     try:
-        data = spp.get_data("Session", Language="DE")
+        data = get_data("Session", Language="DE")
         return [dict(row) for row in data]
     except Exception as exc:
         logger.error("Failed to fetch Session: %s", exc)
@@ -35,23 +44,13 @@ def _fetch_sessions_sync() -> list[dict]:
 def _fetch_votes_of_session_sync(session_id: int) -> list[dict]:
     """Fetch all votes of a session."""
     try:
-        data = spp.get_data("Vote", Language="DE", IdSession=session_id)
+        data = get_data("Vote", Language="DE", IdSession=session_id)
         return [dict(v) for v in data]
     except Exception as exc:
         logger.warning("Failed to fetch Vote for session %s: %s", session_id, exc)
         return []
 
 
-def _fetch_votings_of_vote_sync(vote_id: int) -> list[dict]:
-    """Fetch individual voting records for a specific vote."""
-    try:
-        data = spp.get_data("Voting", Language="DE", IdVote=vote_id)
-        return [dict(v) for v in data]
-    except Exception as exc:
-        logger.warning("Failed to fetch Voting for vote %s: %s", vote_id, exc)
-        return []
-
-
 def _parse_odata_date(raw) -> datetime | None:
     """Parse OData date formats."""
     if not raw:
@@ -68,88 +67,195 @@ def _parse_odata_date(raw) -> datetime | None:
         return None
 
 
-def _sync_vote_record(db: Session, vote_data: dict, session_name: str = "") -> bool:
-    """Sync a single vote record. Returns True if new."""
+def _vote_row(vote_data: dict, session_name: str = "") -> dict | None:
+    """Map an upstream Vote to a votes row (None without an ID)."""
     vote_id = vote_data.get("ID") or vote_data.get("IdVote")
     if not vote_id:
-        return False
-
-    existing = db.query(Vote).filter(Vote.vote_id == vote_id).first()
-    if existing:
-        return False
-
-    vote_date = _parse_odata_date(vote_data.get("VoteDate") or vote_data.get("Date"))
-
-    db.add(Vote(
-        vote_id=vote_id,
-        business_number=vote_data.get("BusinessShortNumber", ""),
-        business_title=vote_data.get("BusinessTitle", ""),
-        subject=vote_data.get("Subject", ""),
-        meaning_yes=vote_data.get("MeaningYes", ""),
-        meaning_no=vote_data.get("MeaningNo", ""),
-        vote_date=vote_date,
-        council_id=vote_data.get("CouncilId") or vote_data.get("IdCouncil"),
-        session_id=str(vote_data.get("IdSession", "")),
-        session_name=session_name,
-        total_yes=vote_data.get("TotalYes"),
-        total_no=vote_data.get("TotalNo"),
-        total_abstain=vote_data.get("TotalAbstain"),
-        total_not_voted=vote_data.get("TotalNotVoted"),
-        result=vote_data.get("ResultText", ""),
-    ))
-    return True
-
-
-def _sync_voting_records(db: Session, vote_id: int, votings_data: list[dict]) -> int:
-    """Sync individual voting records for a vote. Returns count of new records."""
-    count = 0
+        return None
+    return {
+        "vote_id": vote_id,
+        "business_number": vote_data.get("BusinessShortNumber", ""),
+        "business_title": vote_data.get("BusinessTitle", ""),
+        "subject": vote_data.get("Subject", ""),
+        "meaning_yes": vote_data.get("MeaningYes", ""),
+        "meaning_no": vote_data.get("MeaningNo", ""),
+        "vote_date": _parse_odata_date(vote_data.get("VoteDate") or vote_data.get("Date")),
+        "council_id": vote_data.get("CouncilId") or vote_data.get("IdCouncil"),
+        "session_id": str(vote_data.get("IdSession", "")),
+        "session_name": session_name,
+        "total_yes": vote_data.get("TotalYes"),
+        "total_no": vote_data.get("TotalNo"),
+        "total_abstain": vote_data.get("TotalAbstain"),
+        "total_not_voted": vote_data.get("TotalNotVoted"),
+        "result": vote_data.get("ResultText", ""),
+        "created_at": datetime.utcnow(),
+    }
+
+
+# Normalized decision values
+DECISION_MAP = {
+    "Ja": "Yes",
+    "Nein": "No",
+    "Enthaltung": "Abstention",
+    "Entschuldigt": "Absent",
+    "Hat nicht teilgenommen": "Absent",
+    "Die Präsidentin/Der Präsident": "President",
+}
+
+
+def _voting_rows(vote_id: int, votings_data: list[dict]) -> list[dict]:
+    """Map the upstream Voting records of a vote to votings rows."""
+    now = datetime.utcnow()
+    rows = []
     for row in votings_data:
         person_number = row.get("PersonNumber")
         if not person_number:
             continue
+        decision = row.get("DecisionText") or row.get("Decision", "")
+        rows.append({
+            "vote_id": vote_id,
+            "person_number": person_number,
+            "decision": DECISION_MAP.get(decision, decision),
+            "parl_group_number": row.get("ParlGroupNumber"),
+            "canton_id": row.get("CantonNumber"),
+            "created_at": now,
+        })
+    return rows
+
+
+def _write_batch(db: Session, votes: list[dict], votings: list[dict]) -> tuple[int, int]:
+    """Insert votes and their votings, skipping rows that already exist.
+    Returns (new votes, new votings). Does not commit."""
+    new_votes = len(db.execute(
+        pg_insert(Vote).values(votes)
+        .on_conflict_do_nothing(index_elements=[Vote.vote_id])
+        .returning(Vote.vote_id)
+    ).all())
+    new_votings = 0
+    for start in range(0, len(votings), VOTING_INSERT_BATCH):
+        new_votings += len(db.execute(
+            pg_insert(Voting).values(votings[start:start + VOTING_INSERT_BATCH])
+            .on_conflict_do_nothing(constraint="uq_voting")
+            .returning(Voting.id)
+        ).all())
+    return new_votes, new_votings
+
+
+# ---------------------------------------------------------------------------
+# Pipeline stages: sessions -> votes -> Voting fetch -> parse -> bulk write
+# ---------------------------------------------------------------------------
+
+_DONE = object()
+
+
+async def _produce_votes(db: Session, sessions: list[dict], session_names: dict, vote_queue: asyncio.Queue) -> int:
+    """Queue the votes not stored yet, session by session."""
+    queued = 0
+    for session in sessions:
+        session_id = session.get("ID")
+        if not session_id:
+            continue
 
-        existing = db.query(Voting).filter(
-            Voting.vote_id == vote_id,
-            Voting.person_number == person_number,
-        ).first()
-        if existing:
+        with sync_runs.phase("votes"):
+            votes_data = await run_upstream("voting", _fetch_votes_of_session_sync, session_id)
+        sync_runs.count(fetched=len(votes_data or []))
+        if not votes_data:
             continue
 
-        decision = row.get("DecisionText") or row.get("Decision", "")
-        # Normalize decision values
-        decision_map = {
-            "Ja": "Yes",
-            "Nein": "No",
-            "Enthaltung": "Abstention",
-            "Entschuldigt": "Absent",
-            "Hat nicht teilgenommen": "Absent",
-            "Die Präsidentin/Der Präsident": "President",
-        }
-        decision = decision_map.get(decision, decision)
-
-        db.add(Voting(
-            vote_id=vote_id,
-            person_number=person_number,
-            decision=decision,
-            parl_group_number=row.get("ParlGroupNumber"),
-            canton_id=row.get("CantonNumber"),
-        ))
-        count += 1
-
-    return count
+        ids = {v.get("ID") or v.get("IdVote") for v in votes_data} - {None}
+        existing = {vote_id for (vote_id,) in db.query(Vote.vote_id).filter(Vote.vote_id.in_(ids))}
+        new_votes = [v for v in votes_data if (v.get("ID") or v.get("IdVote")) in ids - existing]
+        if not new_votes:
+            continue
+
+        logger.info("Processing session %s: %d votes found, %d new", session_id, len(votes_data), len(new_votes))
+        for vote_data in new_votes:
+            await vote_queue.put((vote_data, session_names.get(session_id, "")))
+            queued += 1
+    return queued
+
+
+async def _fetch_votings(limiter: AIMDLimiter, vote_queue: asyncio.Queue, parse_queue: asyncio.Queue, stats: dict):
+    """Fetch the Voting records of queued votes under the adaptive limit.
+
+    A vote whose records cannot be fetched is not written, so the next run
+    picks it up again.
+    """
+    while True:
+        item = await vote_queue.get()
+        if item is _DONE:
+            return
+        vote_data, session_name = item
+        vote_id = vote_data.get("ID") or vote_data.get("IdVote")
+
+        started = await limiter.acquire()
+        rows: list[dict] = []
+        failed = throttled = False
+        try:
+            async for page in iter_pages("Voting", filter=f"IdVote eq {vote_id}"):
+                sync_runs.count(fetched=len(page))
+                rows.extend(page)
+        except ODataError as exc:
+            failed = True
+            throttled = isinstance(exc, ODataThrottled)
+            stats["failed"] += 1
+            logger.warning("Failed to fetch Voting for vote %s: %s", vote_id, exc)
+        finally:
+            await limiter.release(started, not failed, throttled)
+
+        if not failed:
+            await parse_queue.put((vote_data, session_name, rows))
+
+
+async def _parse_votes(parse_queue: asyncio.Queue, write_queue: asyncio.Queue):
+    """Turn fetched votes into votes/votings rows."""
+    while True:
+        item = await parse_queue.get()
+        if item is _DONE:
+            await write_queue.put(_DONE)
+            return
+        vote_data, session_name, rows = item
+        vote = _vote_row(vote_data, session_name)
+        if vote:
+            await write_queue.put((vote, _voting_rows(vote["vote_id"], rows)))
+
+
+async def _write_votes(db: Session, write_queue: asyncio.Queue, stats: dict):
+    """Bulk insert parsed votes, committing every VOTING_SYNC_WRITE_BATCH votes."""
+    votes: list[dict] = []
+    votings: list[dict] = []
+    while True:
+        item = await write_queue.get()
+        if item is not _DONE:
+            vote, rows = item
+            votes.append(vote)
+            votings.extend(rows)
+        if votes and (item is _DONE or len(votes) >= settings.VOTING_SYNC_WRITE_BATCH):
+            with sync_runs.phase("write"):
+                new_votes, new_votings = _write_batch(db, votes, votings)
+                db.commit()
+            stats["votes"] += new_votes
+            stats["votings"] += new_votings
+            votes, votings = [], []
+        if item is _DONE:
+            return
 
 
 async def sync_voting_data():
     """Sync voting data: fetch new votes and individual voting records.
 
-    Called weekly by scheduler. Processes session-wise with rate limiting.
+    Called weekly by scheduler. New votes flow through a pipeline of bounded
+    queues: the Voting records of several votes are fetched concurrently
+    under an AIMD limit (growing while upstream answers quickly, halving on
+    errors and 429s), parsed and bulk inserted in batches.
     """
     db: Session = SessionLocal()
     try:
         logger.info("Starting voting data sync...")
 
         # Get all sessions
-        sessions_data = await asyncio.to_thread(_fetch_sessions_sync)
+        with sync_runs.phase("sessions"):
+            sessions_data = await run_upstream("voting", _fetch_sessions_sync)
         if not sessions_data:
             logger.warning("No sessions fetched")
             return
@@ -169,60 +275,69 @@ async def sync_voting_data():
         ]
         recent_sessions.sort(key=lambda s: s.get("ID", 0))
 
-        total_new_votes = 0
-        total_new_votings = 0
-
-        for session in recent_sessions:
-            session_id = session.get("ID")
-            if not session_id:
-                continue
-
-            # Check if we already have votes from this session
-            existing_count = db.query(Vote).filter(Vote.session_id == str(session_id)).count()
-
-            # Fetch votes for this session
-            votes_data = await asyncio.to_thread(_fetch_votes_of_session_sync, session_id)
-
-            if not votes_data:
-                continue
-
-            # Skip if we already have all votes from this session
-            if existing_count >= len(votes_data):
-                continue
-
-            logger.info("Processing session %s: %d votes found", session_id, len(votes_data))
-
-            for vote_data in votes_data:
-                vote_id = vote_data.get("ID") or vote_data.get("IdVote")
-                if not vote_id:
-                    continue
-
-                is_new = _sync_vote_record(db, vote_data, session_name=session_name_map.get(session_id, ""))
-                if is_new:
-                    total_new_votes += 1
-
-                    # Fetch individual voting records
-                    votings_data = await asyncio.to_thread(
-                        _fetch_votings_of_vote_sync, vote_id
-                    )
-                    new_votings = _sync_voting_records(db, vote_id, votings_data)
-                    total_new_votings += new_votings
-
-                    # Rate limiting between voting fetches
-                    await asyncio.sleep(0.5)
+        limiter = AIMDLimiter(
+            "Voting sync",
+            initial=settings.VOTING_SYNC_INITIAL_CONCURRENCY,
+            minimum=settings.VOTING_SYNC_MIN_CONCURRENCY,
+            maximum=settings.VOTING_SYNC_MAX_CONCURRENCY,
+            target_latency=settings.VOTING_SYNC_TARGET_LATENCY,
+        )
+        vote_queue: asyncio.Queue = asyncio.Queue(maxsize=settings.VOTING_SYNC_QUEUE_SIZE)
+        parse_queue: asyncio.Queue = asyncio.Queue(maxsize=settings.VOTING_SYNC_QUEUE_SIZE)
+        write_queue: asyncio.Queue = asyncio.Queue(maxsize=settings.VOTING_SYNC_QUEUE_SIZE)
+        stats = {"queued": 0, "failed": 0, "votes": 0, "votings": 0}
+        started = time.monotonic()
+
+        # One fetcher per possible slot; the limiter decides how many run
+        fetchers = [
+            asyncio.create_task(_fetch_votings(limiter, vote_queue, parse_queue, stats))
+            for _ in range(limiter.maximum)
+        ]
 
-            # Commit per session and rate limit between sessions
-            db.commit()
-            await asyncio.sleep(1.0)
+        async def feed():
+            stats["queued"] = await _produce_votes(db, recent_sessions, session_name_map, vote_queue)
+            for _ in fetchers:
+                await vote_queue.put(_DONE)
+            await asyncio.gather(*fetchers)
+            # Wall-clock time of the concurrent Voting fetch stage
+            sync_runs.add_phase("votings", time.monotonic() - started)
+            await parse_queue.put(_DONE)
+
+        tasks = [
+            asyncio.create_task(feed()),
+            *fetchers,
+            asyncio.create_task(_parse_votes(parse_queue, write_queue)),
+            asyncio.create_task(_write_votes(db, write_queue, stats)),
+        ]
+        try:
+            # Fails fast if any stage raises; the others are cancelled below
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        elapsed = time.monotonic() - started
+        logger.info(
+            "Voting pipeline: %d new votes queued, %d failed, %.1fs (%.1f votes/s); "
+            "concurrency limit %d (peak %d, %d decrease(s))",
+            stats["queued"], stats["failed"], elapsed,
+            stats["queued"] / elapsed if elapsed > 0 else 0.0,
+            int(limiter.limit), int(limiter.peak), limiter.decreases,
+        )
+        total_new_votes = stats["votes"]
+        total_new_votings = stats["votings"]
 
         # Backfill session names for existing votes that are missing them
-        for sid, sname in session_name_map.items():
-            if sname:
-                db.query(Vote).filter(
-                    Vote.session_id == str(sid),
-                    Vote.session_name.is_(None),
-                ).update({"session_name": sname}, synchronize_session=False)
-        db.commit()
+        backfilled = 0
+        with sync_runs.phase("session_names"):
+            for sid, sname in session_name_map.items():
+                if sname:
+                    backfilled += db.query(Vote).filter(
+                        Vote.session_id == str(sid),
+                        Vote.session_name.is_(None),
+                    ).update({"session_name": sname}, synchronize_session=False)
+            db.commit()
+        sync_runs.count(inserted=total_new_votes + total_new_votings, updated=backfilled)
 
         logger.info(
             "Voting sync complete: %d new votes, %d new voting records",
@@ -230,6 +345,7 @@ async def sync_voting_data():
         )
     except Exception:
         db.rollback()
+        sync_runs.mark_failed()
         logger.exception("Voting sync failed")
     finally:
         db.close()
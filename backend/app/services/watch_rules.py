@@ -0,0 +1,152 @@
+"""Per-user watch rules for new businesses.
+
+A rule is a keyword/phrase, a business type, or both. All phrases of all
+users are compiled into one Aho-Corasick automaton per job run, so every new
+business's title and description is scanned once, in time linear in the
+text, however many rules exist. Business types are matched by lookup.
+
+A match creates a ``watch_match`` alert for the rule's owner (once per user
+and business); rules with ``auto_accept`` also accept the pending monitoring
+candidate on the owner's behalf. Rules run over newly inserted monitoring
+candidates and business cache rows only. Cache rows carry no type or
+description, so only phrase rules without a type filter can match them.
+"""
+
+import logging
+from collections import defaultdict
+from datetime import datetime
+
+from sqlalchemy import insert, update
+from sqlalchemy.orm import Session
+
+from ..models import Alert, MonitoringCandidate, WatchRule
+from .email_outbox import enqueue_alert_emails
+from .keyword_matcher import KeywordMatcher
+
+logger = logging.getLogger(__name__)
+
+
+class WatchRuleSet:
+    """All watch rules, compiled for matching."""
+
+    def __init__(self, rules: list):
+        self.rules = {rule.id: rule for rule in rules}
+        self._phrases = KeywordMatcher()
+        self._type_only: dict[str, list[int]] = defaultdict(list)
+        for rule in rules:
+            if rule.phrase:
+                self._phrases.add(rule.phrase, rule.id)
+            elif rule.business_type:
+                self._type_only[rule.business_type.casefold()].append(rule.id)
+        self._phrases.build()
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+    def match(self, text: str, business_type: str | None) -> list:
+        """Return the rules matching a business."""
+        btype = (business_type or "").casefold()
+        matched = []
+        for rule_id in self._phrases.find(text):
+            rule = self.rules[rule_id]
+            if not rule.business_type or rule.business_type.casefold() == btype:
+                matched.append(rule)
+        matched.extend(self.rules[rule_id] for rule_id in self._type_only.get(btype, ()))
+        return matched
+
+
+def load_watch_rules(db: Session) -> WatchRuleSet:
+    rows = db.query(
+        WatchRule.id, WatchRule.user_id, WatchRule.phrase, WatchRule.business_type, WatchRule.auto_accept,
+    ).all()
+    return WatchRuleSet(rows)
+
+
+def _alert_message(rule, business_number: str, title: str, accepted: bool) -> str:
+    label = rule.phrase or rule.business_type
+    message = f"Geschäft {business_number} entspricht Ihrer Regel «{label}»"
+    if title:
+        message += f": {title}"
+    if accepted:
+        message += " (automatisch übernommen)"
+    return message
+
+
+def apply_watch_rules(
+    db: Session,
+    rules: WatchRuleSet,
+    businesses: list[dict],
+    accept_candidates: bool = False,
+) -> tuple[int, int]:
+    """Match new ``businesses`` (dicts with business_number, title and
+    optionally description and business_type) against the rules.
+
+    Creates alerts (and queues their emails) and, with
+    ``accept_candidates``, accepts pending candidates matched by an
+    auto-accept rule. Does not commit. Returns (alerts, accepted).
+    """
+    if not len(rules) or not businesses:
+        return 0, 0
+
+    hits: dict[tuple[int, str], object] = {}  # (user_id, number) -> first matching rule
+    accept_by: dict[str, int] = {}  # number -> accepting user
+    titles: dict[str, str] = {}
+    for biz in businesses:
+        nr = biz["business_number"]
+        text = "\n".join(t for t in (biz.get("title"), biz.get("description")) if t)
+        for rule in rules.match(text, biz.get("business_type")):
+            hits.setdefault((rule.user_id, nr), rule)
+            if accept_candidates and rule.auto_accept:
+                accept_by.setdefault(nr, rule.user_id)
+        titles[nr] = biz.get("title") or ""
+    if not hits:
+        return 0, 0
+
+    # One watch alert per user and business, also across jobs and runs
+    existing = set(
+        db.query(Alert.user_id, Alert.business_number)
+        .filter(Alert.alert_type == "watch_match", Alert.business_number.in_({nr for _, nr in hits}))
+        .all()
+    )
+    now = datetime.utcnow()
+    rows = [
+        {
+            "user_id": user_id,
+            "business_number": nr,
+            "alert_type": "watch_match",
+            "message": _alert_message(rule, nr, titles[nr], accept_by.get(nr) == user_id),
+            "is_read": False,
+            "created_at": now,
+        }
+        for (user_id, nr), rule in hits.items()
+        if (user_id, nr) not in existing
+    ]
+    if rows:
+        inserted = db.execute(
+            insert(Alert).values(rows).returning(
+                Alert.id, Alert.user_id, Alert.business_number,
+                Alert.alert_type, Alert.message, Alert.event_date,
+            )
+        ).all()
+        enqueue_alert_emails(db, inserted)
+
+    accepted = 0
+    numbers_by_user: dict[int, list[str]] = defaultdict(list)
+    for nr, user_id in accept_by.items():
+        numbers_by_user[user_id].append(nr)
+    for user_id, numbers in numbers_by_user.items():
+        result = db.execute(
+            update(MonitoringCandidate)
+            .where(
+                MonitoringCandidate.business_number.in_(numbers),
+                MonitoringCandidate.decision == "pending",
+            )
+            .values(decision="accepted", decided_by=user_id, decided_at=now)
+        )
+        accepted += result.rowcount
+
+    logger.info(
+        "Watch rules: %d businesses matched, %d alerts created, %d candidates accepted",
+        len({nr for _, nr in hits}), len(rows), accepted,
+    )
+    return len(rows), accepted
@@ -0,0 +1,82 @@
+"""send_messages against a local aiosmtpd sink."""
+
+import asyncio
+import socket
+
+import pytest
+from aiosmtpd.controller import Controller
+
+from app.config import settings
+from app.services.email_service import build_alert_message, send_messages
+
+
+class SinkHandler:
+    """Collects messages with the client address of the session they came
+    over; can drop the connection instead of answering one DATA command."""
+
+    def __init__(self, drop_message: int | None = None):
+        self.received: list[tuple[tuple, str]] = []
+        self.drop_message = drop_message
+        self._data_commands = 0
+
+    async def handle_DATA(self, server, session, envelope):
+        self._data_commands += 1
+        if self._data_commands == self.drop_message:
+            server.transport.close()
+            return "421 Closing connection"
+        self.received.append((session.peer, envelope.rcpt_tos[0]))
+        return "250 OK"
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture
+def smtp_sink(monkeypatch):
+    controllers = []
+
+    def start(handler: SinkHandler) -> SinkHandler:
+        controller = Controller(handler, hostname="127.0.0.1", port=_free_port())
+        controller.start()
+        controllers.append(controller)
+        monkeypatch.setattr(settings, "SMTP_HOST", "127.0.0.1")
+        monkeypatch.setattr(settings, "SMTP_PORT", controller.port)
+        monkeypatch.setattr(settings, "SMTP_USER", "")
+        monkeypatch.setattr(settings, "SMTP_USE_TLS", False)
+        monkeypatch.setattr(settings, "SMTP_USE_SSL", False)
+        monkeypatch.setattr(settings, "SMTP_CONCURRENCY", 1)
+        monkeypatch.setattr(settings, "SMTP_TIMEOUT", 5)
+        return handler
+
+    yield start
+    for controller in controllers:
+        controller.stop()
+
+
+def _messages(count: int) -> list:
+    alert = {"business_number": "24.3927", "alert_type": "status_change", "message": "Status geändert"}
+    return [build_alert_message(f"user{i}@example.org", [alert]) for i in range(count)]
+
+
+def test_batch_reuses_one_session(smtp_sink):
+    sink = smtp_sink(SinkHandler())
+
+    results = asyncio.run(send_messages(_messages(3)))
+
+    assert results == [True, True, True]
+    assert [rcpt for _, rcpt in sink.received] == [f"user{i}@example.org" for i in range(3)]
+    assert len({peer for peer, _ in sink.received}) == 1
+
+
+def test_reconnects_when_server_drops_connection(smtp_sink):
+    sink = smtp_sink(SinkHandler(drop_message=2))
+
+    results = asyncio.run(send_messages(_messages(3)))
+
+    assert results == [True, True, True]
+    assert [rcpt for _, rcpt in sink.received] == [f"user{i}@example.org" for i in range(3)]
+    peers = [peer for peer, _ in sink.received]
+    assert peers[0] != peers[1] == peers[2]
@@ -107,6 +107,18 @@ export const decideCandiate = (id, decision) =>
     body: JSON.stringify({ decision }),
   });
 
+// Watch rules
+export const getWatchRules = () => request("/watch-rules");
+
+export const addWatchRule = (rule) =>
+  request("/watch-rules", {
+    method: "POST",
+    body: JSON.stringify(rule),
+  });
+
+export const deleteWatchRule = (id) =>
+  request(`/watch-rules/${id}`, { method: "DELETE" });
+
 // Parliament search / preview / cache
 export const getRecentBusinesses = () => request("/parliament/recent");
 
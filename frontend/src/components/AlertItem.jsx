@@ -7,6 +7,7 @@ const TYPE_LABELS = {
   debate_scheduled: "Debatte",
   new_document: "Dokument",
   vote_result: "Abstimmung",
+  watch_match: "Stichwort",
 };
 
 export default function AlertItem({ alert, onUpdated }) {
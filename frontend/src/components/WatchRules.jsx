@@ -0,0 +1,139 @@
+import { useEffect, useState } from "react";
+import {
+  addWatchRule,
+  deleteWatchRule,
+  getMonitoringBusinessTypes,
+  getWatchRules,
+} from "../api/client";
+
+export default function WatchRules() {
+  const [rules, setRules] = useState([]);
+  const [businessTypes, setBusinessTypes] = useState([]);
+  const [phrase, setPhrase] = useState("");
+  const [businessType, setBusinessType] = useState("");
+  const [autoAccept, setAutoAccept] = useState(false);
+  const [loading, setLoading] = useState(true);
+  const [error, setError] = useState("");
+
+  useEffect(() => {
+    Promise.all([getWatchRules(), getMonitoringBusinessTypes()])
+      .then(([r, types]) => {
+        setRules(r);
+        setBusinessTypes(types);
+      })
+      .catch(() => {})
+      .finally(() => setLoading(false));
+  }, []);
+
+  const handleAdd = async (e) => {
+    e.preventDefault();
+    setError("");
+    try {
+      const rule = await addWatchRule({
+        phrase: phrase || null,
+        business_type: businessType || null,
+        auto_accept: autoAccept,
+      });
+      setRules((prev) => [...prev, rule]);
+      setPhrase("");
+      setBusinessType("");
+      setAutoAccept(false);
+    } catch (err) {
+      setError(err.message);
+    }
+  };
+
+  const handleDelete = async (id) => {
+    await deleteWatchRule(id);
+    setRules((prev) => prev.filter((r) => r.id !== id));
+  };
+
+  return (
+    <div className="bg-white dark:bg-gray-800 rounded-lg border border-gray-200 dark:border-gray-700 p-6 mt-6">
+      <h2 className="font-semibold mb-2">Stichwort-Regeln</h2>
+      <p className="text-sm text-gray-500 mb-4">
+        Neue Geschäfte, deren Titel oder Beschreibung ein Stichwort enthält
+        (oder die einem Geschäftstyp entsprechen), lösen einen Alert aus.
+        Optional werden passende Monitoring-Kandidaten automatisch übernommen.
+      </p>
+
+      {loading ? (
+        <div className="flex items-center gap-2 text-sm text-gray-500">
+          <div className="animate-spin h-4 w-4 border-2 border-gray-400 border-t-transparent rounded-full" />
+          Laden...
+        </div>
+      ) : (
+        <>
+          {rules.length > 0 && (
+            <ul className="divide-y divide-gray-200 dark:divide-gray-700 mb-4">
+              {rules.map((r) => (
+                <li key={r.id} className="flex items-center justify-between py-2 text-sm">
+                  <span>
+                    {r.phrase && <span className="font-medium">«{r.phrase}»</span>}
+                    {r.phrase && r.business_type && " · "}
+                    {r.business_type && <span className="text-gray-500">{r.business_type}</span>}
+                    {r.auto_accept && (
+                      <span className="ml-2 text-xs px-2 py-0.5 rounded bg-gray-100 dark:bg-gray-700 text-gray-600 dark:text-gray-300">
+                        automatisch übernehmen
+                      </span>
+                    )}
+                  </span>
+                  <button
+                    onClick={() => handleDelete(r.id)}
+                    className="text-xs text-gray-400 hover:text-swiss-red"
+                  >
+                    Entfernen
+                  </button>
+                </li>
+              ))}
+            </ul>
+          )}
+
+          <form onSubmit={handleAdd} className="space-y-3">
+            <div className="flex gap-2">
+              <input
+                type="text"
+                value={phrase}
+                onChange={(e) => setPhrase(e.target.value)}
+                placeholder="Stichwort, z.B. AHV"
+                maxLength={200}
+                className="flex-1 px-3 py-2 rounded-md border border-gray-300 dark:border-gray-600 bg-white dark:bg-gray-800 text-sm"
+              />
+              <select
+                value={businessType}
+                onChange={(e) => setBusinessType(e.target.value)}
+                className="px-3 py-2 rounded-md border border-gray-300 dark:border-gray-600 bg-white dark:bg-gray-800 text-sm"
+              >
+                <option value="">Alle Geschäftstypen</option>
+                {businessTypes.map((t) => (
+                  <option key={t} value={t}>
+                    {t}
+                  </option>
+                ))}
+              </select>
+            </div>
+            <div className="flex items-center justify-between">
+              <label className="flex items-center gap-3 cursor-pointer">
+                <input
+                  type="checkbox"
+                  checked={autoAccept}
+                  onChange={(e) => setAutoAccept(e.target.checked)}
+                  className="w-4 h-4 rounded border-gray-300 text-swiss-red focus:ring-swiss-red"
+                />
+                <span className="text-sm">Kandidaten automatisch übernehmen</span>
+              </label>
+              <button
+                type="submit"
+                disabled={!phrase.trim() && !businessType}
+                className="bg-swiss-red text-white px-4 py-2 rounded-md text-sm font-medium hover:bg-swiss-dark disabled:opacity-50"
+              >
+                Hinzufügen
+              </button>
+            </div>
+            {error && <p className="text-sm text-red-600">{error}</p>}
+          </form>
+        </>
+      )}
+    </div>
+  );
+}
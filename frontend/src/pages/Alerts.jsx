@@ -9,6 +9,7 @@ const ALERT_TYPES = [
   { value: "debate_scheduled", label: "Debatte" },
   { value: "new_document", label: "Dokument" },
   { value: "vote_result", label: "Abstimmung" },
+  { value: "watch_match", label: "Stichwort" },
 ];
 
 export default function Alerts() {
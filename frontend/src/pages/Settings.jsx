@@ -9,6 +9,7 @@ import {
   triggerSyncBusinesses,
   triggerSyncAll,
 } from "../api/client";
+import WatchRules from "../components/WatchRules";
 
 const ALERT_TYPE_OPTIONS = [
   { value: "status_change", label: "Statusänderungen" },
@@ -16,6 +17,13 @@ const ALERT_TYPE_OPTIONS = [
   { value: "debate_scheduled", label: "Ratsdebatte traktandiert" },
   { value: "new_document", label: "Neue Dokumente" },
   { value: "vote_result", label: "Abstimmungsergebnisse" },
+  { value: "watch_match", label: "Stichwort-Treffer" },
+];
+
+const DIGEST_OPTIONS = [
+  { value: "immediate", label: "Sofort" },
+  { value: "hourly", label: "Stündlich (Zusammenfassung)" },
+  { value: "daily", label: "Täglich (Zusammenfassung)" },
 ];
 
 export default function Settings() {
@@ -25,6 +33,7 @@ export default function Settings() {
   );
   const [emailEnabled, setEmailEnabled] = useState(false);
   const [emailTypes, setEmailTypes] = useState([]);
+  const [emailDigest, setEmailDigest] = useState("immediate");
   const [emailLoading, setEmailLoading] = useState(true);
   const [emailSaving, setEmailSaving] = useState(false);
   const [emailSaved, setEmailSaved] = useState(false);
@@ -35,6 +44,7 @@ export default function Settings() {
       .then((data) => {
         setEmailEnabled(data.email_alerts_enabled);
         setEmailTypes(data.email_alert_types || []);
+        setEmailDigest(data.email_digest || "immediate");
       })
       .catch(() => {})
       .finally(() => setEmailLoading(false));
@@ -48,7 +58,7 @@ export default function Settings() {
   const handleToggleEmail = async () => {
     const newEnabled = !emailEnabled;
     setEmailEnabled(newEnabled);
-    await saveEmailSettings(newEnabled, emailTypes);
+    await saveEmailSettings(newEnabled, emailTypes, emailDigest);
   };
 
   const handleToggleType = async (type) => {
@@ -56,19 +66,26 @@ export default function Settings() {
       ? emailTypes.filter((t) => t !== type)
       : [...emailTypes, type];
     setEmailTypes(newTypes);
-    await saveEmailSettings(emailEnabled, newTypes);
+    await saveEmailSettings(emailEnabled, newTypes, emailDigest);
+  };
+
+  const handleChangeDigest = async (digest) => {
+    setEmailDigest(digest);
+    await saveEmailSettings(emailEnabled, emailTypes, digest);
   };
 
-  const saveEmailSettings = async (enabled, types) => {
+  const saveEmailSettings = async (enabled, types, digest) => {
     setEmailSaving(true);
     setEmailSaved(false);
     try {
       const result = await updateEmailSettings({
         email_alerts_enabled: enabled,
         email_alert_types: types,
+        email_digest: digest,
       });
       setEmailEnabled(result.email_alerts_enabled);
       setEmailTypes(result.email_alert_types);
+      setEmailDigest(result.email_digest);
       setEmailSaved(true);
       setTimeout(() => setEmailSaved(false), 2000);
     } catch {
@@ -197,6 +214,20 @@ export default function Settings() {
                     </label>
                   ))}
                 </div>
+                <label className="block text-sm font-medium text-gray-700 dark:text-gray-300 mt-4 mb-2">
+                  Zustellung:
+                </label>
+                <select
+                  value={emailDigest}
+                  onChange={(e) => handleChangeDigest(e.target.value)}
+                  className="text-sm border border-gray-300 dark:border-gray-600 rounded px-2 py-1 bg-white dark:bg-gray-700"
+                >
+                  {DIGEST_OPTIONS.map((opt) => (
+                    <option key={opt.value} value={opt.value}>
+                      {opt.label}
+                    </option>
+                  ))}
+                </select>
               </div>
             )}
 
@@ -208,6 +239,8 @@ export default function Settings() {
         )}
       </div>
 
+      <WatchRules />
+
       {/* Data Sync */}
       <div className="bg-white dark:bg-gray-800 rounded-lg border border-gray-200 dark:border-gray-700 p-6 mt-6">
         <h2 className="font-semibold mb-4">Datensynchronisation</h2>